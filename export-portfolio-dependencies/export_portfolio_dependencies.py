@@ -14,30 +14,122 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import csv
+import email.utils
+import gzip
+import hashlib
+import http.client
+import itertools
 import json
 import os
+import re
 import sys
-import urllib.request
+import time
 import urllib.error
+import urllib.parse
+import urllib.request
 import argparse
-from typing import Dict, List, Any
-import pandas as pd
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Collection, Dict, Iterable, Iterator, List, Any, Tuple
+import ijson
 import logging
-
-
-API_BASE_URL = "https://sigrid-says.com/rest/analysis-results/api/v1/osh-findings"
+from openpyxl import Workbook
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+API_ROOT_URL = "https://sigrid-says.com/rest/analysis-results/api/v1"
+API_BASE_URL = f"{API_ROOT_URL}/osh-findings"
+SYSTEM_METADATA_URL = f"{API_ROOT_URL}/system-metadata"
+MAX_RETRIES = 3
+RETRY_DELAY_SECONDS = 2
+REQUEST_TIMEOUT_SECONDS = 300
+# Like validate_json_structure, systems can be either an array or a single system object.
+SYSTEM_PREFIXES = {"start_array": "systems.item", "start_map": "systems"}
+OUTPUT_FORMATS = {"xlsx": ".xlsx", "csv": "", "ndjson": ".ndjson", "parquet": ""}
+COMPRESSION_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+PARQUET_BATCH_SIZE = 65536
+FILE_NAME_PATTERN = re.compile(r"[^\w.-]+")
+STATE_VERSION = 1
+MENDIX_FILTER = "name=Mendix-Runtime"
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+class ComponentFilter:
+    """
+    Selects components based on conditions like "name=Mendix-Runtime,purl-prefix=pkg:npm/,property:key=value". A
+    component needs to match all conditions, or one of them if there are multiple conditions for the same field. The
+    filter is applied to the components in the API response, so other components are never processed.
+    """
+
+    FIELDS = ("name", "version", "group", "purl-prefix")
+
+    def __init__(self, conditions: Dict[str, List[str]]):
+        self.conditions = conditions
+
+    @staticmethod
+    def parse(expression: str) -> "ComponentFilter":
+        conditions = {}
+        for condition in expression.split(","):
+            field, separator, value = condition.partition("=")
+            field = field.strip()
+            if not separator or not (field in ComponentFilter.FIELDS or field.startswith("property:")):
+                raise argparse.ArgumentTypeError(f"Invalid component filter condition: '{condition}'. Expected "
+                                                 f"one of {', '.join(ComponentFilter.FIELDS)} or property:<name>, "
+                                                 f"followed by =<value>")
+            conditions.setdefault(field, []).append(value.strip())
+        return ComponentFilter(conditions)
+
+    def matches(self, component: Dict) -> bool:
+        return all(any(self.matches_condition(component, field, value) for value in values)
+                   for field, values in self.conditions.items())
+
+    @staticmethod
+    def matches_condition(component: Dict, field: str, value: str) -> bool:
+        if field == "purl-prefix":
+            return ComponentFilter.to_text(component.get('purl')).startswith(value)
+        elif field.startswith("property:"):
+            name = field[len("property:"):]
+            return any(p.get('name') == name and ComponentFilter.to_text(p.get('value')) == value
+                       for p in component.get('properties') or [])
+        else:
+            return ComponentFilter.to_text(component.get(field)) == value
+
+    @staticmethod
+    def to_text(value: Any) -> str:
+        # Fields that are missing or null are treated as empty, instead of matching "None".
+        return '' if value is None else str(value)
+
+
 def fetch_api_data(customer: str, token: str):
+    with open_api_stream(customer, token) as response:
+        try:
+            return response.read().decode("utf-8")
+        except Exception as e:
+            logger.error(f"An unexpected error occurred: {e}")
+            raise RuntimeError(f"An unexpected error occurred: {e}") from e
+
+
+def open_api_stream(customer: str, token: str):
     url = f"{API_BASE_URL}/{customer}"
     headers = {'Authorization': f'Bearer {token}'}
 
     try:
         request = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(request) as response:
-            return response.read().decode("utf-8")
+        return urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT_SECONDS)
     except urllib.error.HTTPError as e:
         if e.code == 403:
             logger.error(f"Access forbidden. Please check your API token and permissions.")
@@ -56,6 +148,107 @@ def fetch_api_data(customer: str, token: str):
         raise RuntimeError(f"An unexpected error occurred: {e}") from e
 
 
+def fetch_system_names(customer: str, token: str) -> List[str]:
+    request = urllib.request.Request(f"{SYSTEM_METADATA_URL}/{customer}", headers={'Authorization': f'Bearer {token}'})
+    try:
+        with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT_SECONDS) as response:
+            return sorted(system['systemName'] for system in json.load(response))
+    except urllib.error.HTTPError as e:
+        logger.error(f"Failed to retrieve the list of systems: {e.code} {e.reason}")
+        raise RuntimeError(f"Failed to retrieve the list of systems: {e.code} {e.reason}") from e
+    except urllib.error.URLError as e:
+        logger.error(f"Failed to connect to the API: {e.reason}")
+        raise RuntimeError(f"Failed to connect to the API: {e.reason}") from e
+    except (TimeoutError, ConnectionError, http.client.IncompleteRead) as e:
+        logger.error(f"Failed to retrieve the list of systems: {e}")
+        raise RuntimeError(f"Failed to retrieve the list of systems: {e}") from e
+    except ValueError as e:
+        logger.error(f"Received an invalid list of systems: {e}")
+        raise RuntimeError(f"Received an invalid list of systems: {e}") from e
+
+
+def fetch_system_sbom(customer: str, system_name: str, token: str) -> Dict:
+    url = f"{API_BASE_URL}/{customer}/{urllib.parse.quote(system_name)}"
+    request = urllib.request.Request(url, headers={'Authorization': f'Bearer {token}'})
+
+    for attempt in range(MAX_RETRIES + 1):
+        delay = RETRY_DELAY_SECONDS * 2 ** attempt
+        try:
+            with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT_SECONDS) as response:
+                return json.load(response)
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                logger.debug(f"No open source health data for system {system_name}")
+                return {}
+            if (e.code < 500 and e.code != 429) or attempt == MAX_RETRIES:
+                raise RuntimeError(f"HTTP error occurred for system {system_name}: {e.code} {e.reason}") from e
+            if e.code == 429:
+                delay = get_retry_after(e, delay)
+        except (urllib.error.URLError, TimeoutError, ConnectionError, http.client.IncompleteRead) as e:
+            if attempt == MAX_RETRIES:
+                raise RuntimeError(f"Failed to fetch system {system_name}: {e}") from e
+        except ValueError as e:
+            raise RuntimeError(f"Received invalid JSON for system {system_name}: {e}") from e
+        logger.debug(f"Retrying system {system_name} after attempt {attempt + 1} failed")
+        time.sleep(delay)
+
+
+def get_retry_after(error: urllib.error.HTTPError, default: float) -> float:
+    # Retry-After is either a number of seconds or an HTTP date.
+    retry_after = (error.headers or {}).get('Retry-After')
+    if not retry_after:
+        return default
+    try:
+        return max(float(retry_after), 0)
+    except ValueError:
+        pass
+    try:
+        return max(email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return default
+
+
+def fetch_systems(customer: str, token: str, workers: int, component_filter: ComponentFilter = None,
+                  failed_systems: List[str] = None) -> Iterator[Tuple[str, List[Dict]]]:
+    """
+    Fetches the dependencies of every system in a separate request, using a bounded number of concurrent requests.
+    Systems are yielded in order as soon as they arrive. Systems that still fail after retrying are skipped, so that
+    one system cannot break the entire export, and are added to failed_systems.
+    """
+    system_names = fetch_system_names(customer, token)
+    logger.info(f"Fetching dependencies for {len(system_names)} systems")
+    failed_systems = [] if failed_systems is None else failed_systems
+
+    def fetch_system(system_name):
+        system = {'systemName': system_name, 'sbom': fetch_system_sbom(customer, system_name, token)}
+        return process_system(system, component_filter)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Limits how many systems are fetched ahead, so that a slow system does not cause all others to pile up.
+        pending = deque()
+        remaining = iter(system_names)
+        for system_name in itertools.islice(remaining, workers * 2):
+            pending.append((system_name, executor.submit(fetch_system, system_name)))
+
+        for index in range(len(system_names)):
+            system_name, future = pending.popleft()
+            for next_system_name in itertools.islice(remaining, 1):
+                pending.append((next_system_name, executor.submit(fetch_system, next_system_name)))
+
+            try:
+                components = future.result()
+            except (RuntimeError, ValueError, OSError, http.client.HTTPException) as e:
+                logger.error(str(e))
+                failed_systems.append(system_name)
+                continue
+
+            logger.info(f"Fetched system {index + 1}/{len(system_names)}: {system_name}")
+            yield system_name, components
+
+    if failed_systems:
+        logger.warning(f"Export is incomplete, failed to fetch {len(failed_systems)} systems: {', '.join(failed_systems)}")
+
+
 def parse_json_data(json_data: Any) -> Dict:
     if isinstance(json_data, str):
         try:
@@ -98,39 +291,305 @@ def process_component(component: Dict, system_name: str) -> Dict:
     return flat_component
 
 
-def process_all_systems(systems: List[Dict]) -> List[Dict]:
-    all_components = {}
+def stream_systems(stream, component_filter: ComponentFilter = None) -> Iterator[Tuple[str, List[Dict]]]:
+    """
+    Parses the API response incrementally while it is being read, and yields the flat component records for one
+    system at a time. Only the components of the current system are kept in memory, not the entire portfolio.
+    """
+    system_prefix = None
+    component_prefix = None
+    system_name = None
+    components = []
+    builder = None
+
+    try:
+        for prefix, event, value in ijson.parse(stream, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == component_prefix and event == 'end_map':
+                    if component_filter is None or component_filter.matches(builder.value):
+                        components.append(builder.value)
+                    builder = None
+            elif prefix == component_prefix and event == 'start_map':
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif prefix == 'systems' and system_prefix is None:
+                if event not in SYSTEM_PREFIXES:
+                    logger.error("Systems in API response are not an array or object.")
+                    raise ValueError("Invalid JSON structure: 'systems' is not an array or object.")
+                system_prefix = SYSTEM_PREFIXES[event]
+                component_prefix = f"{system_prefix}.sbom.components.item"
+            elif prefix == f"{system_prefix}.systemName" and event == 'string':
+                system_name = value
+            elif prefix == system_prefix and event == 'end_map':
+                # The system name can appear after the components, so they are only processed at the end of the system.
+                system_name = system_name or 'Unknown System'
+                yield system_name, [process_component(component, system_name) for component in components]
+                system_name = None
+                components = []
+    except ijson.JSONError as e:
+        logger.error("Failed to parse JSON stream.")
+        raise ValueError(f"Received data is not valid JSON: {e}")
+
+    if system_prefix is None:
+        logger.error("No systems found in API response.")
+        raise ValueError("Invalid JSON structure: 'systems' key not found.")
+
+
+def iter_systems(systems: List[Dict], component_filter: ComponentFilter = None) -> Iterator[Tuple[str, List[Dict]]]:
     for system in systems:
-        system_name = system.get('systemName', 'Unknown System')
+        yield system.get('systemName', 'Unknown System'), process_system(system, component_filter)
+
+
+class PivotComponent:
+    """A component in the pivot, with the fields of its first occurrence and a bitset of the systems using it."""
+
+    __slots__ = ("columns", "values", "systems")
+
+    def __init__(self, columns: Tuple[str, ...], values: Tuple[Any, ...]):
+        self.columns = columns
+        self.values = values
+        self.systems = 0
+
+
+class PivotRecords:
+    """
+    Pivoted components in a compact form. Strings are interned, since the same names, licenses and property keys
+    appear in many components, components with the same properties share their tuple of column names, and systems
+    are stored as a bit per system. The components are only converted to records while they are being written.
+    """
+
+    def __init__(self):
+        self.components: Dict[Tuple[str, str], PivotComponent] = {}
+        self.columns: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        self.system_names: List[str] = []
+        self.system_indexes: Dict[str, int] = {}
+
+    def add(self, system_name: str, component: Dict):
+        system_index = self.system_indexes.get(system_name)
+        if system_index is None:
+            system_index = self.system_indexes[system_name] = len(self.system_names)
+            self.system_names.append(system_name)
+
+        key = (component['name'], component['version'])
+        pivot_component = self.components.get(key)
+        if pivot_component is None:
+            columns = tuple(component.keys())
+            columns = self.columns.setdefault(columns, tuple(sys.intern(column) for column in columns))
+            values = tuple(intern_value(value) for value in component.values())
+            pivot_component = self.components[tuple(intern_value(value) for value in key)] = PivotComponent(columns, values)
+        pivot_component.systems |= 1 << system_index
+
+    def get_system_names(self, systems: int) -> List[str]:
+        names = []
+        while systems:
+            lowest_bit = systems & -systems
+            names.append(self.system_names[lowest_bit.bit_length() - 1])
+            systems ^= lowest_bit
+        return names
+
+    def __len__(self):
+        return len(self.components)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for pivot_component in self.components.values():
+            record = dict(zip(pivot_component.columns, pivot_component.values))
+            record['systems'] = ', '.join(sorted(self.get_system_names(pivot_component.systems)))
+            yield record
+
+
+def intern_value(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def process_all_systems(systems: Iterable[Tuple[str, List[Dict]]]) -> PivotRecords:
+    all_components = PivotRecords()
+    for system_name, components in systems:
         logger.info(f"Processing system '{system_name}'")
-        components = system.get('sbom', {}).get('components', [])
 
         for component in components:
-            key = (component.get('name', ''), component.get('version', ''))
-            if key not in all_components:
-                all_components[key] = process_component(component, system_name)
-                all_components[key]['systems'] = set()
-            all_components[key]['systems'].add(system_name)
+            all_components.add(system_name, component)
 
-    for component in all_components.values():
-        component['systems'] = ', '.join(sorted(component['systems']))
+    return all_components
 
-    return list(all_components.values())
 
-
-def process_system(system: Dict) -> List[Dict]:
+def process_system(system: Dict, component_filter: ComponentFilter = None) -> List[Dict]:
     system_name = system.get('systemName', 'Unknown System')
     components = system.get('sbom', {}).get('components', [])
     logger.debug(f"Processing system: {system_name}")
 
-    return [process_component(component, system_name) for component in components]
+    return [process_component(component, system_name) for component in components
+            if component_filter is None or component_filter.matches(component)]
+
+
+class OutputWriter(ABC):
+    """
+    Base class for the output formats. Every sheet contains the components of one system, or all components when
+    pivoting. Sheets are written to disk as soon as they are complete.
+    """
+
+    @abstractmethod
+    def write_sheet(self, sheet_name: str, records: Iterable[Dict]):
+        pass
+
+    def write_no_data(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
 
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
 
-def create_excel_sheet(writer: pd.ExcelWriter, system_name: str, components: List[Dict]):
+
+class ExcelWriter(OutputWriter):
+    """
+    Writes records to an Excel file in write-only mode, where rows are written as they are appended instead of
+    keeping the entire workbook in memory.
+    """
+
+    def __init__(self, output_file: str):
+        self.output_file = output_file
+        self.workbook = Workbook(write_only=True)
+
+    def write_sheet(self, sheet_name: str, records: Iterable[Dict]):
+        worksheet = self.workbook.create_sheet(title=sheet_name[:31])
+        columns = get_columns(records)
+        worksheet.append(columns)
+        for record in records:
+            worksheet.append([record.get(column) for column in columns])
+
+    def write_no_data(self):
+        # An Excel file needs to contain at least one sheet.
+        self.write_sheet('No Data', [{"Message": "No data available"}])
+
+    def close(self):
+        self.workbook.save(self.output_file)
+
+
+class CsvWriter(OutputWriter):
+    """Writes every sheet to a separate CSV file in the output directory."""
+
+    def __init__(self, output_dir: str, compression: str = None):
+        self.output_dir = output_dir
+        self.compression = compression
+        self.file_names = set()
+        os.makedirs(output_dir, exist_ok=True)
+
+    def write_sheet(self, sheet_name: str, records: Iterable[Dict]):
+        path = get_sheet_path(self.output_dir, sheet_name, ".csv", self.compression, self.file_names)
+        with open_output_file(path, self.compression) as f:
+            writer = csv.DictWriter(f, fieldnames=get_columns(records))
+            writer.writeheader()
+            writer.writerows(records)
+
+
+class NdjsonWriter(OutputWriter):
+    """Writes all records to a single file, with one JSON object per line."""
+
+    def __init__(self, output_file: str, compression: str = None):
+        self.output_file = output_file
+        self.file = open_output_file(output_file, compression)
+
+    def write_sheet(self, sheet_name: str, records: Iterable[Dict]):
+        for record in records:
+            self.file.write(json.dumps(record))
+            self.file.write("\n")
+
+    def close(self):
+        self.file.close()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super().__exit__(exc_type, exc_value, traceback)
+        if exc_type is not None:
+            # The file is written while exporting, so remove it instead of leaving a truncated file that looks valid.
+            self.file.close()
+            os.remove(self.output_file)
+
+
+class ParquetWriter(OutputWriter):
+    """Writes every sheet to a separate Parquet file in the output directory, with all columns as strings."""
+
+    def __init__(self, output_dir: str, compression: str = None):
+        self.output_dir = output_dir
+        self.compression = compression or "snappy"
+        self.file_names = set()
+        os.makedirs(output_dir, exist_ok=True)
+
+    def write_sheet(self, sheet_name: str, records: Iterable[Dict]):
+        path = get_sheet_path(self.output_dir, sheet_name, ".parquet", None, self.file_names)
+        schema = pyarrow.schema([(column, pyarrow.string()) for column in get_columns(records)])
+        with pyarrow.parquet.ParquetWriter(path, schema, compression=self.compression) as writer:
+            remaining = iter(records)
+            while batch := [{key: to_string(value) for key, value in record.items()}
+                            for record in itertools.islice(remaining, PARQUET_BATCH_SIZE)]:
+                writer.write_table(pyarrow.Table.from_pylist(batch, schema=schema))
+
+
+def create_writer(output: str, output_format: str, compression: str = None) -> OutputWriter:
+    if output_format == "csv":
+        return CsvWriter(output, compression)
+    elif output_format == "ndjson":
+        return NdjsonWriter(output, compression)
+    elif output_format == "parquet":
+        return ParquetWriter(output, compression)
+    else:
+        return ExcelWriter(output)
+
+
+def open_output_file(path: str, compression: str = None):
+    if compression == "gzip":
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    elif compression == "zstd":
+        return zstandard.open(path, "wt", encoding="utf-8", newline="")
+    else:
+        return open(path, "w", encoding="utf-8", newline="")
+
+
+def get_sheet_path(output_dir: str, sheet_name: str, extension: str, compression: str = None,
+                   used_names: set = None) -> str:
+    """
+    Returns the path of the file for a sheet. Different sheet names can end up with the same file name after
+    replacing unsupported characters, so a suffix is added when the file name was already used for another sheet.
+    """
+    base_name = FILE_NAME_PATTERN.sub("_", sheet_name)
+    file_name = base_name
+    if used_names is not None:
+        # File names are compared case-insensitively, since that is how most file systems on Windows and macOS work.
+        suffix = 1
+        while file_name.lower() in used_names:
+            suffix += 1
+            file_name = f"{base_name}_{suffix}"
+        if file_name != base_name:
+            logger.warning(f"Writing sheet '{sheet_name}' to {file_name}, since {base_name} is already used")
+        used_names.add(file_name.lower())
+    return os.path.join(output_dir, file_name + extension + COMPRESSION_EXTENSIONS.get(compression, ""))
+
+
+def get_output_extension(output_format: str, compression: str = None) -> str:
+    extension = OUTPUT_FORMATS[output_format]
+    return extension + COMPRESSION_EXTENSIONS.get(compression, "") if extension else ""
+
+
+def to_string(value: Any) -> Any:
+    return value if value is None or isinstance(value, str) else str(value)
+
+
+def get_columns(records: Iterable[Dict]) -> List[str]:
+    # Components have different properties, so the columns are all keys in the order in which they first appear.
+    columns = {}
+    for record in records:
+        columns.update(dict.fromkeys(record))
+    return list(columns)
+
+
+def create_excel_sheet(writer: OutputWriter, system_name: str, components: List[Dict]):
     if components:
-        df = pd.DataFrame(components)
-        sheet_name = str(system_name)[:31]
-        df.to_excel(writer, sheet_name=sheet_name, index=False)
+        writer.write_sheet(str(system_name), components)
         logger.debug(f"Created sheet for system {system_name}")
         return True
     else:
@@ -138,82 +597,250 @@ def create_excel_sheet(writer: pd.ExcelWriter, system_name: str, components: Lis
         return False
 
 
-def create_single_excel_sheet(writer: pd.ExcelWriter, components: List[Dict]):
+def create_single_excel_sheet(writer: OutputWriter, components: Collection[Dict]):
     if components:
-        df = pd.DataFrame(components)
-        df.to_excel(writer, sheet_name='All Components', index=False)
+        writer.write_sheet('All Components', components)
         logger.debug(f"Created single sheet with all components")
         return True
     else:
         logger.warning(f"No dependencies found across all systems")
         return False
-    
-def retrieve_mendix_versions(json_data: Any):
-    for system in json_data['systems']:
-        sbom = system.get('sbom', {})
-        components = sbom.get('components', [])
-        filtered_components = [component for component in components if component.get('name') == 'Mendix-Runtime']
-        sbom['components'] = filtered_components
-    return json_data
 
 
-def process_api_output(json_data: Any, output_file: str, pivot: bool, mendix_versions_only: bool):
+@dataclass
+class OutputOptions:
+    output_file: str
+    pivot: bool = False
+    output_format: str = "xlsx"
+    compression: str = None
+    state_file: str = None
+    since_state: bool = False
+
+
+def process_api_output(json_data: Any, options: OutputOptions, component_filter: ComponentFilter = None):
     try:
         logger.debug(f"Received data type: {type(json_data)}")
         parsed_data = parse_json_data(json_data)
+        systems = validate_json_structure(parsed_data)
+        export_systems(iter_systems(systems, component_filter), options)
+    except ValueError as e:
+        logger.error(f"Value error: {str(e)}")
+        raise
+    except Exception as e:
+        logger.exception(f"Error processing data or writing to output: {e}")
+        raise RuntimeError(f"Error processing data or writing to output: {e}")
 
-        if mendix_versions_only:
-            parsed_data = retrieve_mendix_versions(parsed_data)
 
-        systems = validate_json_structure(parsed_data)
+def process_api_stream(stream, options: OutputOptions, component_filter: ComponentFilter = None):
+    try:
+        systems = stream_systems(stream, component_filter)
+        # Reads up to the first system before creating the output, so that invalid responses are reported.
+        first_system = next(systems, None)
+        if first_system is not None:
+            systems = itertools.chain([first_system], systems)
+        export_systems(systems, options)
+    except ValueError as e:
+        logger.error(f"Value error: {str(e)}")
+        raise
+    except Exception as e:
+        logger.exception(f"Error processing data or writing to output: {e}")
+        raise RuntimeError(f"Error processing data or writing to output: {e}")
 
-        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-            if pivot or mendix_versions_only:
-                all_components = process_all_systems(systems)
-                if create_single_excel_sheet(writer, all_components):
-                    logger.info(f"Excel file created successfully with pivoted data: {output_file}")
-                else:
-                    logger.warning("No data available. Adding a default sheet.")
-                    pd.DataFrame({"Message": ["No data available"]}).to_excel(writer, sheet_name='No Data', index=False)
-            else:
-                sheets_created = 0
-                for system in systems:
-                    components = process_system(system)
-                    if create_excel_sheet(writer, system['systemName'], components):
-                        sheets_created += 1
-
-                if sheets_created == 0:
-                    logger.warning("No sheets were created. Adding a default sheet.")
-                    pd.DataFrame({"Message": ["No data available"]}).to_excel(writer, sheet_name='No Data', index=False)
-                else:
-                    logger.info(f"Excel file created successfully with multiple sheets: {output_file}")
 
+def process_api_systems(customer: str, token: str, workers: int, options: OutputOptions,
+                        component_filter: ComponentFilter = None):
+    try:
+        failed_systems = []
+        export_systems(fetch_systems(customer, token, workers, component_filter, failed_systems), options,
+                       failed_systems)
     except ValueError as e:
         logger.error(f"Value error: {str(e)}")
         raise
     except Exception as e:
-        logger.exception(f"Error processing data or writing to Excel file: {e}")
-        raise RuntimeError(f"Error processing data or writing to Excel file: {e}")
+        logger.exception(f"Error processing data or writing to output: {e}")
+        raise RuntimeError(f"Error processing data or writing to output: {e}")
+
+
+def export_systems(systems: Iterable[Tuple[str, List[Dict]]], options: OutputOptions,
+                   failed_systems: Collection[str] = ()):
+    """
+    Writes the exported systems, and updates the state file when requested. failed_systems is only complete once
+    all systems have been processed, and contains the systems that were skipped because they could not be fetched.
+    """
+    state = {}
+    if options.since_state:
+        previous_state = load_state(options.state_file)
+        systems = [('Changes', find_changes(systems, previous_state, state, failed_systems))]
+    elif options.state_file:
+        systems = record_state(systems, state)
+
+    with create_writer(options.output_file, options.output_format, options.compression) as writer:
+        write_output(systems, writer, options.pivot)
+
+    if options.state_file and failed_systems and not options.since_state and os.path.exists(options.state_file):
+        keep_failed_systems(load_state(options.state_file), state, failed_systems)
+
+    if options.state_file:
+        save_state(options.state_file, state)
+        logger.info(f"Saved state of {len(state)} components to {options.state_file}")
+
+
+def get_component_key(component: Dict) -> Tuple[str, str, str]:
+    return component['systemName'], component['name'], component['version']
+
+
+def get_components_hash(components: List[Dict]) -> str:
+    # A system can contain the same component and version multiple times, for example in different locations.
+    content = sorted(json.dumps(component, sort_keys=True, default=str) for component in components)
+    return hashlib.sha256("\n".join(content).encode("utf-8")).hexdigest()[:16]
+
+
+def group_components(components: List[Dict]) -> Dict[Tuple[str, str, str], List[Dict]]:
+    grouped = {}
+    for component in components:
+        grouped.setdefault(get_component_key(component), []).append(component)
+    return grouped
+
+
+def record_state(systems: Iterable[Tuple[str, List[Dict]]],
+                 state: Dict[Tuple[str, str, str], str]) -> Iterator[Tuple[str, List[Dict]]]:
+    for system_name, components in systems:
+        for key, same_components in group_components(components).items():
+            state[key] = get_components_hash(same_components)
+        yield system_name, components
+
+
+def keep_failed_systems(previous_state: Dict[Tuple[str, str, str], str], state: Dict[Tuple[str, str, str], str],
+                        failed_systems: Collection[str]):
+    # Systems that could not be fetched keep their previous state, otherwise their components would be reported as
+    # removed now and as added again in the next run.
+    failed_systems = set(failed_systems)
+    for key, component_hash in previous_state.items():
+        if key[0] in failed_systems:
+            state.setdefault(key, component_hash)
+
+
+def find_changes(systems: Iterable[Tuple[str, List[Dict]]], previous_state: Dict[Tuple[str, str, str], str],
+                 state: Dict[Tuple[str, str, str], str], failed_systems: Collection[str] = ()) -> List[Dict]:
+    """
+    Returns the components that were added or changed since the previous state, followed by the components that
+    were removed. Removed components only contain the system, name and version, since that is all the state contains.
+    Components of failed systems are not reported as removed, since it is unknown whether they changed.
+    """
+    changes = []
+    for system_name, components in systems:
+        for key, same_components in group_components(components).items():
+            state[key] = get_components_hash(same_components)
+            if key not in previous_state:
+                changes += [{'changeType': 'ADDED', **component} for component in same_components]
+            elif previous_state[key] != state[key]:
+                changes += [{'changeType': 'CHANGED', **component} for component in same_components]
+
+    keep_failed_systems(previous_state, state, failed_systems)
+    for system_name, name, version in previous_state.keys() - state.keys():
+        changes.append({'changeType': 'REMOVED', 'systemName': system_name, 'name': name, 'version': version})
+
+    logger.info(f"Found {len(changes)} changed components since the previous state")
+    return changes
+
+
+def load_state(state_file: str) -> Dict[Tuple[str, str, str], str]:
+    if not os.path.exists(state_file):
+        logger.info(f"State file {state_file} does not exist yet, all components will be reported as added")
+        return {}
+
+    with open(state_file, "r", encoding="utf-8") as f:
+        state = json.load(f)
+    if state.get('version') != STATE_VERSION:
+        raise ValueError(f"Unsupported state file version in {state_file}")
+    return {(system_name, name, version): component_hash
+            for system_name, name, version, component_hash in state['components']}
+
+
+def save_state(state_file: str, state: Dict[Tuple[str, str, str], str]):
+    components = [[*key, component_hash] for key, component_hash in sorted(state.items())]
+    temp_file = f"{state_file}.tmp"
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump({'version': STATE_VERSION, 'components': components}, f)
+    os.replace(temp_file, state_file)
+
+
+def write_output(systems: Iterable[Tuple[str, List[Dict]]], writer: OutputWriter, pivot: bool):
+    if pivot:
+        all_components = process_all_systems(systems)
+        if create_single_excel_sheet(writer, all_components):
+            logger.info(f"Output created successfully with pivoted data")
+        else:
+            logger.warning("No data available.")
+            writer.write_no_data()
+    else:
+        sheets_created = 0
+        for system_name, components in systems:
+            if create_excel_sheet(writer, system_name, components):
+                sheets_created += 1
+
+        if sheets_created == 0:
+            logger.warning("No sheets were created.")
+            writer.write_no_data()
+        else:
+            logger.info(f"Output created successfully with {sheets_created} systems")
 
 
 def validate_output_filename(value):
     if os.path.dirname(value):
         raise argparse.ArgumentTypeError(f"The --output argument should be a file name, not a path. You provided: {value}")
-    if not value.endswith('.xlsx'):
-        raise argparse.ArgumentTypeError(f"The output file must have a .xlsx extension. You provided: {value}")
     return value
 
 
+def validate_output_arguments(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    extension = get_output_extension(args.format, args.compression)
+    if args.output and extension and not args.output.endswith(extension):
+        parser.error(f"The output file must have a {extension} extension. You provided: {args.output}")
+    if args.mendix_versions_only and args.component_filter:
+        parser.error("--mendix_versions_only cannot be combined with --component-filter")
+    if args.compression and args.format == "xlsx":
+        parser.error("Compression is not supported for xlsx output")
+    if args.format == "parquet" and pyarrow is None:
+        parser.error("Parquet output requires the pyarrow package")
+    if args.compression == "zstd" and args.format != "parquet" and zstandard is None:
+        parser.error("zstd compression requires the zstandard package")
+    if args.since_state and (args.pivot or args.mendix_versions_only):
+        parser.error("--since-state cannot be combined with --pivot or --mendix_versions_only, since changes are "
+                     "reported per system")
+    if args.workers < 1:
+        parser.error(f"--workers must be at least 1. You provided: {args.workers}")
+
+
 def parse_arguments():
     parser = argparse.ArgumentParser(description="Export all Portfolio dependencies to Excel")
     parser.add_argument("--customer", type=str, required=True, help="Sigrid customer name.")
     parser.add_argument("--output", type=validate_output_filename,
-                        help="Output Excel file name (not path). If not specified, a default name will be used.")
+                        help="Output file name (not path), or directory name for csv and parquet. "
+                             "If not specified, a default name will be used.")
+    parser.add_argument("--format", choices=list(OUTPUT_FORMATS), default="xlsx",
+                        help="Output format. csv and parquet create a directory with a file per sheet.")
+    parser.add_argument("--compression", choices=list(COMPRESSION_EXTENSIONS),
+                        help="Compression for csv, ndjson and parquet output")
     parser.add_argument("--pivot", action="store_true", help="Generate a single sheet with all dependencies "
                                                              "instead of a sheet per system")
     parser.add_argument("--mendix_versions_only", action="store_true", help="Get a full list of Mendix versions only if enabled")
+    parser.add_argument("--component-filter", type=ComponentFilter.parse,
+                        help="Only export components matching all conditions, e.g. "
+                             "name=log4j-core,purl-prefix=pkg:maven/,property:<name>=<value>")
+    parser.add_argument("--stream", action="store_true", help="Parse the API response while it is downloaded, "
+                                                              "to limit memory usage for large portfolios")
+    parser.add_argument("--per-system", action="store_true", help="Fetch the dependencies for every system in a "
+                                                                  "separate request, instead of a single request")
+    parser.add_argument("--workers", type=int, default=4, help="Number of concurrent requests when using --per-system")
+    state_group = parser.add_mutually_exclusive_group()
+    state_group.add_argument("--state", type=str, help="Save the state of all exported components to this file")
+    state_group.add_argument("--since-state", type=str, help="Only export the components that were added, removed "
+                                                             "or changed since the state in this file, and update "
+                                                             "the file to the current state")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
-    return parser.parse_args()
+    args = parser.parse_args()
+    validate_output_arguments(parser, args)
+    return args
 
 
 def main():
@@ -229,18 +856,29 @@ def main():
 
     customer_name = args.customer.lower()
 
+    extension = get_output_extension(args.format, args.compression)
     if args.output:
         output_file = args.output
     elif args.mendix_versions_only:
-        output_file = f'{customer_name}-mendix-versions.xlsx'
+        output_file = f'{customer_name}-mendix-versions{extension}'
     else:
-        output_file = f'{customer_name}-portfolio-dependencies.xlsx'
+        output_file = f'{customer_name}-portfolio-dependencies{extension}'
+
+    component_filter = ComponentFilter.parse(MENDIX_FILTER) if args.mendix_versions_only else args.component_filter
+    options = OutputOptions(output_file, args.pivot or args.mendix_versions_only, args.format, args.compression,
+                            args.since_state or args.state, args.since_state is not None)
 
     try:
         logger.info(f"Fetching data for customer: {customer_name}")
-        json_data = fetch_api_data(customer_name, token)
-        logger.info(f"Data fetched successfully. Processing output...")
-        process_api_output(json_data, output_file, args.pivot, args.mendix_versions_only)
+        if args.per_system:
+            process_api_systems(customer_name, token, args.workers, options, component_filter)
+        elif args.stream:
+            with open_api_stream(customer_name, token) as stream:
+                process_api_stream(stream, options, component_filter)
+        else:
+            json_data = fetch_api_data(customer_name, token)
+            logger.info(f"Data fetched successfully. Processing output...")
+            process_api_output(json_data, options, component_filter)
         logger.info(f"Data successfully exported to {output_file}")
     except Exception as e:
         logger.exception(f"An error occurred: {e}")
@@ -14,13 +14,17 @@
 
 import itertools
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
+import numpy as np
 from sigrid_api_client import SigridApiClient
 
 
+MAX_CONCURRENT_REQUESTS = 8
+
 OBJECTIVE_TYPES = {
     "MAINTAINABILITY" : "Maintainability",
     "TEST_CODE_RATIO" : "Test code",
@@ -63,7 +67,9 @@ class SystemFilter:
         self.team = team
         
     def check(self, systemEvaluation, metadata):
-        systemMetadata = metadata[systemEvaluation["systemName"]]
+        systemMetadata = metadata.get(systemEvaluation["systemName"])
+        if systemMetadata == None:
+            return False
         active = systemMetadata["active"] and not systemMetadata["isDevelopmentOnly"]
         divisionMatch = self.division == None or self.division == (systemMetadata["divisionName"] or "Unknown")
         teamMatch = self.team == None or self.team in (systemMetadata["teamNames"] or "Unknown")
@@ -71,6 +77,82 @@ class SystemFilter:
         
     def apply(self, systemEvaluations, metadata):
         return [system for system in systemEvaluations if self.check(system, metadata)]
+        
+    def mask(self, matrix):
+        mask = matrix.activeMask
+        if self.division != None:
+            mask = mask & matrix.groupMask(Group.DIVISION, self.division)
+        if self.team != None:
+            mask = mask & matrix.groupMask(Group.TEAM, self.team)
+        return mask
+
+
+# Number of objectives per status, indexed by period, system, and objective type. Systems
+# without any objectives count as a single "not covered" objective of every type, as in
+# ObjectivesCalculator.calculateStatus. Filtering on division or team is done using the
+# boolean masks over the systems, so every chart only needs to sum the matrix instead of
+# walking through all systems and their objectives again.
+class StatusMatrix:
+    def __init__(self, calculator, evaluationsPerPeriod):
+        self.systems = sorted(set(system["systemName"] for evaluations in evaluationsPerPeriod for system in evaluations))
+        self.systemIndex = {name: i for i, name in enumerate(self.systems)}
+        found = set(soe["type"] for evaluations in evaluationsPerPeriod for system in evaluations for soe in system["objectives"])
+        self.types = [type for type in OBJECTIVE_TYPES if type in found] + sorted(found - set(OBJECTIVE_TYPES))
+        self.typeIndex = {type: i for i, type in enumerate(self.types)}
+        
+        shape = (len(evaluationsPerPeriod), len(self.systems))
+        self.counts = np.zeros(shape + (len(self.types), len(Status)), dtype=np.int64)
+        self.withoutObjectives = np.zeros(shape, dtype=np.int64)
+        
+        for p, evaluations in enumerate(evaluationsPerPeriod):
+            for system in evaluations:
+                s = self.systemIndex[system["systemName"]]
+                for systemObjectiveEvaluation in system["objectives"]:
+                    status = calculator.determineStatus(systemObjectiveEvaluation)
+                    self.counts[p, s, self.typeIndex[systemObjectiveEvaluation["type"]], status.value - 1] += 1
+                if len(system["objectives"]) == 0:
+                    self.withoutObjectives[p, s] += 1
+                    
+        # Systems without metadata, for example systems that have been removed since, are
+        # not active and not part of any group, so they are only included without a mask.
+        systemMetadata = [calculator.metadata.get(name) for name in self.systems]
+        self.activeMask = np.array([m != None and m["active"] and not m["isDevelopmentOnly"] for m in systemMetadata], dtype=bool)
+        self.groupMasks = {group: defaultdict(lambda: np.zeros(len(self.systems), dtype=bool)) for group in Group}
+        for s, m in enumerate(systemMetadata):
+            if m == None:
+                continue
+            for group in Group:
+                for systemGroup in calculator.getSystemGroups(m, group):
+                    self.groupMasks[group][systemGroup][s] = True
+                    
+    def groupMask(self, group, name):
+        masks = self.groupMasks[group]
+        return masks[name] if name in masks else np.zeros(len(self.systems), dtype=bool)
+        
+    def systemMask(self, systemNames):
+        mask = np.zeros(len(self.systems), dtype=bool)
+        mask[[self.systemIndex[name] for name in systemNames if name in self.systemIndex]] = True
+        return mask
+        
+    # Returns the percentage of objectives per status for every period, for the systems
+    # selected by the mask. This gives the same result as calling calculateStatus for the
+    # systems in each period.
+    def calculateStatus(self, type="*", mask=None):
+        counts = self.counts if mask is None else self.counts[:, mask]
+        withoutObjectives = self.withoutObjectives if mask is None else self.withoutObjectives[:, mask]
+        
+        typeCounts = counts.sum(axis=1)
+        if type in (None, "*"):
+            statusCounts = typeCounts.sum(axis=1)
+        elif type in self.typeIndex:
+            statusCounts = typeCounts[:, self.typeIndex[type]].copy()
+        else:
+            statusCounts = np.zeros((len(counts), len(Status)), dtype=np.int64)
+        statusCounts[:, Status.NA.value - 1] += withoutObjectives.sum(axis=1)
+        
+        totals = statusCounts.sum(axis=1, keepdims=True)
+        percentages = np.divide(statusCounts * 100.0, totals, out=np.zeros(statusCounts.shape), where=totals > 0)
+        return [{status: float(row[status.value - 1]) for status in Status} for row in percentages]
 
 
 class ObjectivesCalculator:
@@ -79,18 +161,30 @@ class ObjectivesCalculator:
         self.endDate = endDate
         self.periods = self.getMonthlyPeriods()
         
-        self.metadata = sigrid.fetchMetadata()
-        self.rawPortfolioObjectives = sorted(sigrid.fetchPortfolioObjectives(), key=lambda o: o["objective"]["type"])
-        self.status = sigrid.fetchObjectivesEvaluation(startDate, endDate)
-        self.trend = {period: sigrid.fetchObjectivesEvaluation(period.start, period.end) for period in self.periods}
+        # The endpoints are independent of each other, so they are fetched concurrently.
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            metadata = executor.submit(sigrid.fetchMetadata)
+            portfolioObjectives = executor.submit(sigrid.fetchPortfolioObjectives)
+            status = executor.submit(sigrid.fetchObjectivesEvaluation, startDate, endDate)
+            trend = {period: executor.submit(sigrid.fetchObjectivesEvaluation, period.start, period.end) for period in self.periods}
+        
+        self.metadata = metadata.result()
+        self.rawPortfolioObjectives = sorted(portfolioObjectives.result(), key=lambda o: o["objective"]["type"])
+        self.status = status.result()
+        self.trend = {period: future.result() for period, future in trend.items()}
+        self.statusMatrix = StatusMatrix(self, [self.status])
+        self.trendMatrix = StatusMatrix(self, [self.trend[period] for period in self.periods])
         
     # Returns a map from the specified groups to all systems in that group. Note that
     # systems can appear multiple times. For example, if a system is maintained by two
-    # teams, it will appear for both teams in the grouping.
+    # teams, it will appear for both teams in the grouping. Systems without metadata are
+    # not part of any group, the same as in the status matrix.
     def groupSystems(self, systemEvaluations, group):
         groups = defaultdict(list)
         for systemEvaluation in systemEvaluations:
-            systemMetadata = self.metadata[systemEvaluation["systemName"]]
+            systemMetadata = self.metadata.get(systemEvaluation["systemName"])
+            if systemMetadata == None:
+                continue
             for systemGroup in self.getSystemGroups(systemMetadata, group):
                 groups[systemGroup].append(systemEvaluation)
         return {group: groups[group] for group in reversed(sorted(groups.keys()))}
@@ -105,9 +199,9 @@ class ObjectivesCalculator:
             raise Exception(f"Unknown group: {group}")
             
     def isMetadataComplete(self, systemEvaluation):
-        systemMetadata = self.metadata[systemEvaluation["systemName"]]
+        systemMetadata = self.metadata.get(systemEvaluation["systemName"])
         fields = ["divisionName", "teamNames", "businessCriticality", "lifecyclePhase"]
-        return all(systemMetadata[field] for field in fields)
+        return systemMetadata != None and all(systemMetadata[field] for field in fields)
         
     def getMonthlyPeriods(self):
         months = []
@@ -14,10 +14,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+import json
 import os
 import re
 import sys
 from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 
 from dateutil.relativedelta import relativedelta
@@ -34,6 +38,9 @@ TEAM_COLORS = ("#8269A4", "#DFC101", "#04ABC8", "#233347", "#C5CD58", "#D45200",
 STATUS_COLORS = ("#04ABC8", "#C3F5FE", "#F0F3F8")
 METADATA_COLORS = ("#8269A4", "#E6E1ED")
 FILENAME = re.compile("/")
+MANIFEST_FILE = "chart-manifest.json"
+
+STATUS_SERIES = (("Complete", Status.COMPLETE), ("Incomplete", Status.INCOMPLETE), ("Not covered", Status.NA))
 
 CONDITION_DISPLAY_NAMES = {
     "businessCriticality" : "Business criticality",
@@ -42,77 +49,58 @@ CONDITION_DISPLAY_NAMES = {
 }
     
     
+# Describes a chart, with all data needed to render it. Charts are first defined using the
+# calculator, and then rendered separately, which can be done in multiple processes since
+# rendering is what takes most of the time when generating all charts.
+@dataclass
+class ChartSpec:
+    chartType: type
+    title: str
+    xLabels: list
+    series: list
+    colors: tuple
+    outputFile: str
+    percentage: bool = True
+
+
 def generateGroupedObjectivesStatusChart(calculator, outputFile):
     systems = calculator.status
     types = list(reversed(calculator.getAvailableObjectiveTypes(systems)))
-    statusPercentages = {type: calculator.calculateStatus(systems, type) for type in types}
-
-    chart = HorizontalStackedBar(width=600, height=400, range=(0, 100), style=getChartStyle(STATUS_COLORS), legend_at_bottom=True)
-    chart.title = f"Sigrid objectives status"
-    chart.x_labels = [OBJECTIVE_TYPES[type] for type in types]
-    chart.value_formatter = lambda value: f"{round(value)}%"
-    chart.add("Complete", [statusPercentages[type][Status.COMPLETE] for type in types])
-    chart.add("Incomplete", [statusPercentages[type][Status.INCOMPLETE] for type in types])
-    chart.add("Not covered", [statusPercentages[type][Status.NA] for type in types])
-    chart.render_to_file(outputFile)
+    statusPercentages = {type: calculator.statusMatrix.calculateStatus(type)[0] for type in types}
+    series = [(label, [statusPercentages[type][status] for type in types]) for label, status in STATUS_SERIES]
+    return ChartSpec(HorizontalStackedBar, "Sigrid objectives status", [OBJECTIVE_TYPES[type] for type in types], series, STATUS_COLORS, outputFile)
     
     
 def generateTeamObjectivesStatusChart(calculator, outputFile):
     teamSystems = calculator.groupSystems(calculator.status, Group.TEAM)
-    statusPercentages = {team: calculator.calculateStatus(systems) for team, systems in teamSystems.items()}
-    
-    chart = HorizontalStackedBar(width=600, height=400, range=(0, 100), style=getChartStyle(STATUS_COLORS), legend_at_bottom=True)
-    chart.title = "Sigrid objectives status per team"
-    chart.x_labels = teamSystems.keys()
-    chart.value_formatter = lambda value: f"{round(value)}%"
-    chart.add("Complete", [statusPercentages[team][Status.COMPLETE] for team in teamSystems])
-    chart.add("Incomplete", [statusPercentages[team][Status.INCOMPLETE] for team in teamSystems])
-    chart.add("Not covered", [statusPercentages[team][Status.NA] for team in teamSystems])
-    chart.render_to_file(outputFile)
+    matrix = calculator.statusMatrix
+    statusPercentages = {team: matrix.calculateStatus(mask=matrix.groupMask(Group.TEAM, team))[0] for team in teamSystems}
+    series = [(label, [statusPercentages[team][status] for team in teamSystems]) for label, status in STATUS_SERIES]
+    return ChartSpec(HorizontalStackedBar, "Sigrid objectives status per team", list(teamSystems.keys()), series, STATUS_COLORS, outputFile)
     
     
 def generateGroupedObjectivesTrendChart(calculator, type, systemFilter, outputFile):
-    periods = calculator.periods
-    metadata = calculator.metadata
-    trend = {period: calculator.calculateStatus(systemFilter.apply(calculator.trend[period], metadata), type) for period in periods}
-    
-    chart = StackedBar(width=600, height=400, range=(0, 100), style=getChartStyle(STATUS_COLORS), legend_at_bottom=True)
-    chart.title = f"{OBJECTIVE_TYPES[type]} objective trend"
-    chart.x_labels = [period.start.strftime("%m/%Y") for period in periods]        
-    chart.value_formatter = lambda value: f"{round(value)}%"
-    chart.add("Complete", [trend[period][Status.COMPLETE] for period in periods])
-    chart.add("Incomplete", [trend[period][Status.INCOMPLETE] for period in periods])
-    chart.add("Not covered", [trend[period][Status.NA] for period in periods])
-    chart.render_to_file(outputFile)
+    matrix = calculator.trendMatrix
+    trend = matrix.calculateStatus(type, systemFilter.mask(matrix))
+    series = [(label, [periodStatus[status] for periodStatus in trend]) for label, status in STATUS_SERIES]
+    return ChartSpec(StackedBar, f"{OBJECTIVE_TYPES[type]} objective trend", getPeriodLabels(calculator), series, STATUS_COLORS, outputFile)
     
     
 def generateOverallObjectivesBarChart(calculator, systemFilter, outputFile):
-    periods = calculator.periods
-    metadata = calculator.metadata
-    trend = {period: calculator.calculateStatus(systemFilter.apply(calculator.trend[period], metadata)) for period in periods}
-    
-    chart = StackedBar(width=600, height=400, range=(0, 100), style=getChartStyle(STATUS_COLORS), legend_at_bottom=True)
-    chart.title = "Sigrid objective trend"
-    chart.x_labels = [period.start.strftime("%m/%Y") for period in periods]        
-    chart.value_formatter = lambda value: f"{round(value)}%"
-    chart.add("Complete", [trend[period][Status.COMPLETE] for period in periods])
-    chart.add("Incomplete", [trend[period][Status.INCOMPLETE] for period in periods])
-    chart.add("Not covered", [trend[period][Status.NA] for period in periods])
-    chart.render_to_file(outputFile)
+    matrix = calculator.trendMatrix
+    trend = matrix.calculateStatus(mask=systemFilter.mask(matrix))
+    series = [(label, [periodStatus[status] for periodStatus in trend]) for label, status in STATUS_SERIES]
+    return ChartSpec(StackedBar, "Sigrid objective trend", getPeriodLabels(calculator), series, STATUS_COLORS, outputFile)
     
     
 def generateOverallObjectivesLineChart(calculator, systemFilter, outputFile):
-    periods = calculator.periods
-    metadata = calculator.metadata
-    
-    chart = Line(width=600, height=400, range=(0, 100), style=getChartStyle(TEAM_COLORS), legend_at_bottom=True)
-    chart.title = "Sigrid objective trend"
-    chart.x_labels = [period.start.strftime("%m/%Y") for period in periods]        
-    chart.value_formatter = lambda value: f"{round(value)}%"
+    matrix = calculator.trendMatrix
+    mask = systemFilter.mask(matrix)
+    series = []
     for type in calculator.getAvailableObjectiveTypes(calculator.status):
-        trend = {period: calculator.calculateStatus(systemFilter.apply(calculator.trend[period], metadata), type) for period in periods}
-        chart.add(OBJECTIVE_TYPES[type], [trend[period][Status.COMPLETE] for period in periods])
-    chart.render_to_file(outputFile) 
+        trend = matrix.calculateStatus(type, mask)
+        series.append((OBJECTIVE_TYPES[type], [status[Status.COMPLETE] for status in trend]))
+    return ChartSpec(Line, "Sigrid objective trend", getPeriodLabels(calculator), series, TEAM_COLORS, outputFile)
     
     
 def generateMetadataCompletionChart(calculator, group, outputFile):
@@ -120,28 +108,78 @@ def generateMetadataCompletionChart(calculator, group, outputFile):
     countMetadataComplete = lambda systems: sum(1 for system in systems if calculator.isMetadataComplete(system))
     withMetadata = [countMetadataComplete(systems) for group, systems in groups.items()]
     withoutMetadata = [len(systems) - countMetadataComplete(systems) for group, systems in groups.items()]
-
-    chart = HorizontalStackedBar(width=600, height=400, style=getChartStyle(METADATA_COLORS), legend_at_bottom=True)
-    chart.title = f"Sigrid metadata status per {group}"
-    chart.x_labels = groups.keys()
-    chart.add("With metadata", withMetadata)
-    chart.add("Without metadata", withoutMetadata)
-    chart.render_to_file(outputFile)
+    series = [("With metadata", withMetadata), ("Without metadata", withoutMetadata)]
+    return ChartSpec(HorizontalStackedBar, f"Sigrid metadata status per {group}", list(groups.keys()), series, METADATA_COLORS, outputFile, percentage=False)
      
     
 def generateObjectivesBreakdownChart(calculator, type, groupedSystems, outputFile):
-    periods = calculator.periods
-
-    chart = Line(width=600, height=400, range=(0, 100), style=getChartStyle(TEAM_COLORS), legend_at_bottom=True)
-    chart.title = f"{OBJECTIVE_TYPES[type]} objective trend"
-    chart.x_labels = [period.start.strftime("%m/%Y") for period in periods]        
-    chart.value_formatter = lambda value: f"{round(value)}%"
+    matrix = calculator.trendMatrix
+    series = []
     for name in sorted(groupedSystems.keys()):
-        systemNames = [system["systemName"] for system in groupedSystems[name]]
-        systemFilter = lambda system: system["systemName"] in systemNames
-        status = [calculator.calculateStatus(calculator.trend[period], type, filter=systemFilter)[Status.COMPLETE] for period in periods]
-        chart.add(name, status)
-    chart.render_to_file(outputFile)
+        mask = matrix.systemMask(system["systemName"] for system in groupedSystems[name])
+        series.append((name, [periodStatus[Status.COMPLETE] for periodStatus in matrix.calculateStatus(type, mask)]))
+    return ChartSpec(Line, f"{OBJECTIVE_TYPES[type]} objective trend", getPeriodLabels(calculator), series, TEAM_COLORS, outputFile)
+    
+    
+def getPeriodLabels(calculator):
+    return [period.start.strftime("%m/%Y") for period in calculator.periods]
+    
+    
+def renderChart(spec):
+    if spec.percentage:
+        chart = spec.chartType(width=600, height=400, range=(0, 100), style=getChartStyle(spec.colors), legend_at_bottom=True)
+        chart.value_formatter = formatPercentage
+    else:
+        chart = spec.chartType(width=600, height=400, style=getChartStyle(spec.colors), legend_at_bottom=True)
+    chart.title = spec.title
+    chart.x_labels = spec.xLabels
+    for label, values in spec.series:
+        chart.add(label, values)
+    chart.render_to_file(spec.outputFile)
+    
+    
+def renderCharts(specs, jobs):
+    if jobs <= 1:
+        for spec in specs:
+            renderChart(spec)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for _ in executor.map(renderChart, specs, chunksize=max(1, len(specs) // (jobs * 4))):
+                pass
+    
+    
+# Charts are only rendered again when their input has changed since the previous run. The
+# manifest in the output directory contains a hash of the input for every chart.
+def selectChangedCharts(specs, outputDir, manifest):
+    isUnchanged = lambda spec: manifest.get(getManifestKey(spec, outputDir)) == getChartHash(spec)
+    return [spec for spec in specs if not isUnchanged(spec) or not os.path.exists(spec.outputFile)]
+    
+    
+def getChartHash(spec):
+    chartInput = [spec.chartType.__name__, spec.title, spec.xLabels, spec.series, spec.colors, spec.percentage]
+    return hashlib.sha256(json.dumps(chartInput).encode("utf8")).hexdigest()
+    
+    
+def getManifestKey(spec, outputDir):
+    return os.path.relpath(spec.outputFile, outputDir)
+    
+    
+def readManifest(outputDir):
+    try:
+        with open(f"{outputDir}/{MANIFEST_FILE}", "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+        
+        
+def writeManifest(outputDir, specs):
+    manifest = {getManifestKey(spec, outputDir): getChartHash(spec) for spec in specs}
+    with open(f"{outputDir}/{MANIFEST_FILE}", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    
+    
+def formatPercentage(value):
+    return f"{round(value)}%"
     
     
 def getChartStyle(colors):
@@ -185,36 +223,45 @@ if __name__ == "__main__":
     parser.add_argument("--end", type=str, default=TODAY.strftime("%Y-%m-%d"), help="End date (yyyy-mm-dd).")
     parser.add_argument("--out", type=str, default=os.getcwd(), help="Output directory path.")
     parser.add_argument("--sigridurl", type=str, default="https://sigrid-says.com")
+    parser.add_argument("--jobs", type=int, default=1, help="Number of processes used to render the charts.")
+    parser.add_argument("--cache", type=str, default=None, help="Directory used to cache evaluations of past months.")
     args = parser.parse_args()
         
     if not os.environ.get("SIGRID_CI_TOKEN"):
         print("Missing Sigrid API token in environment variable SIGRID_CI_TOKEN")
         sys.exit(1)
         
-    sigrid = SigridApiClient(args.sigridurl, args.customer, os.environ["SIGRID_CI_TOKEN"])
+    cacheDir = os.path.expanduser(args.cache) if args.cache else None
+    sigrid = SigridApiClient(args.sigridurl, args.customer, os.environ["SIGRID_CI_TOKEN"], cacheDir=cacheDir)
     startDate = datetime.strptime(args.start, "%Y-%m-%d")
     endDate = datetime.strptime(args.end, "%Y-%m-%d")
     calculator = ObjectivesCalculator(sigrid, startDate, endDate)
     divisions = calculator.groupSystems(calculator.status, Group.DIVISION)
     teams = calculator.groupSystems(calculator.status, Group.TEAM)    
     outputDir = createOutputDir(os.path.expanduser(args.out), args.customer)
+    charts = []
     
-    generateOverallObjectivesBarChart(calculator, SystemFilter(), f"{outputDir}/all-trend-bar.svg")
-    generateOverallObjectivesLineChart(calculator, SystemFilter(), f"{outputDir}/all-trend-line.svg")
+    charts.append(generateOverallObjectivesBarChart(calculator, SystemFilter(), f"{outputDir}/all-trend-bar.svg"))
+    charts.append(generateOverallObjectivesLineChart(calculator, SystemFilter(), f"{outputDir}/all-trend-line.svg"))
         
     for type in calculator.getAvailableObjectiveTypes(calculator.status):
-        generateGroupedObjectivesTrendChart(calculator, type, SystemFilter(), f"{outputDir}/trend-{type.lower()}.svg")
-        generateObjectivesBreakdownChart(calculator, type, divisions, f"{outputDir}/breakdown-divisions-{type}.svg")
-        generateObjectivesBreakdownChart(calculator, type, teams, f"{outputDir}/breakdown-teams-{type}.svg")
+        charts.append(generateGroupedObjectivesTrendChart(calculator, type, SystemFilter(), f"{outputDir}/trend-{type.lower()}.svg"))
+        charts.append(generateObjectivesBreakdownChart(calculator, type, divisions, f"{outputDir}/breakdown-divisions-{type}.svg"))
+        charts.append(generateObjectivesBreakdownChart(calculator, type, teams, f"{outputDir}/breakdown-teams-{type}.svg"))
 
     for division, systems in divisions.items():
         divisionDir = createOutputDir(outputDir, "Division " + division)
         for type in calculator.getAvailableObjectiveTypes(systems):
             systemFilter = SystemFilter(division=division)
-            generateGroupedObjectivesTrendChart(calculator, type, systemFilter, f"{divisionDir}/trend-{type.lower()}.svg")
+            charts.append(generateGroupedObjectivesTrendChart(calculator, type, systemFilter, f"{divisionDir}/trend-{type.lower()}.svg"))
     
     for team, systems in teams.items():
         teamDir = createOutputDir(outputDir, "Team " + team)
         for type in calculator.getAvailableObjectiveTypes(systems):
             systemFilter = SystemFilter(team=team)
-            generateGroupedObjectivesTrendChart(calculator, type, systemFilter, f"{teamDir}/trend-{type.lower()}.svg")
+            charts.append(generateGroupedObjectivesTrendChart(calculator, type, systemFilter, f"{teamDir}/trend-{type.lower()}.svg"))
+            
+    changedCharts = selectChangedCharts(charts, outputDir, readManifest(outputDir))
+    renderCharts(changedCharts, args.jobs)
+    writeManifest(outputDir, charts)
+    print(f"Generated {len(changedCharts)} charts, skipped {len(charts) - len(changedCharts)} unchanged charts")
@@ -12,28 +12,79 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import json
-import urllib.request
-from datetime import datetime
+import os
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Evaluations of periods that ended more than this long ago will no longer change,
+# so they can be cached on disk.
+CLOSED_PERIOD_DELAY = timedelta(days=1)
+REQUEST_TIMEOUT_SECONDS = 60
+CONNECTION_POOL_SIZE = 8
 
 
 class SigridApiClient:
-    def __init__(self, sigridURL, customer, token):
+    def __init__(self, sigridURL, customer, token, *, cacheDir=None):
         self.sigridURL = sigridURL
         self.customer = customer
         self.token = token
+        self.cacheDir = cacheDir
+        self.pendingResponses = {}
+        self.lock = threading.Lock()
+        self.session = self.createSession()
 
+    # Connections are kept alive and reused for later requests. Like urllib, the session
+    # follows redirects and uses the proxy from the HTTP_PROXY, HTTPS_PROXY, and NO_PROXY
+    # environment variables. Only GET requests are retried when the connection fails.
+    @staticmethod
+    def createSession():
+        session = requests.Session()
+        retry = Retry(total=2, allowed_methods=["GET"], backoff_factor=0.5)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=CONNECTION_POOL_SIZE, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    # Identical requests that are made concurrently from different threads are only sent
+    # once. The other callers receive the same response, so they should not modify it.
     def callEndPoint(self, path, body=None):
-        request = urllib.request.Request(f"{self.sigridURL}/rest/analysis-results/api/v1{path}", body)
-        request.add_header("Accept", "application/json")
-        request.add_header("Authorization", f"Bearer {self.token}".encode("utf8"))
-        response = urllib.request.urlopen(request)
+        if body != None:
+            return self.sendRequest("POST", path, body)
+        
+        with self.lock:
+            future = self.pendingResponses.get(path)
+            owner = future == None
+            if owner:
+                future = Future()
+                self.pendingResponses[path] = future
         
-        if response.status >= 400:
-            raise Exception(f"Sigrid API returns HTTP status {response.status}")
+        if owner:
+            try:
+                future.set_result(self.sendRequest("GET", path))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                with self.lock:
+                    del self.pendingResponses[path]
+        return future.result()
         
-        responseBody = response.read().decode("utf8")
-        return json.loads(responseBody)
+    def sendRequest(self, method, path, body=None):
+        url = f"{self.sigridURL}/rest/analysis-results/api/v1{path}"
+        headers = {"Accept": "application/json", "Authorization": f"Bearer {self.token}"}
+        response = self.session.request(method, url, data=body, headers=headers, timeout=REQUEST_TIMEOUT_SECONDS)
+        
+        if response.status_code >= 400:
+            raise Exception(f"Sigrid API returns HTTP status {response.status_code}")
+        
+        return json.loads(response.content.decode("utf8"))
 
     def fetchSystemNames(self):
         response = self.callEndPoint(f"/maintainability/{self.customer}")
@@ -54,15 +105,28 @@ class SigridApiClient:
         response = self.callEndPoint(f"/objectives/{self.customer}")
         # Use a deterministic sort order, since the API returns objectives
         # in a different/random order every time.
-        response["objectives"].sort(key=lambda o: o["id"])
-        return response["objectives"]
+        return sorted(response["objectives"], key=lambda o: o["id"])
 
     def fetchObjectivesEvaluation(self, start, end):
         if isinstance(start, datetime):
             start = start.strftime("%Y-%m-%d")
         if isinstance(end, datetime):
             end = end.strftime("%Y-%m-%d")
-        response = self.callEndPoint(f"/objectives-evaluation/{self.customer}?startDate={start}&endDate={end}")
+        path = f"/objectives-evaluation/{self.customer}?startDate={start}&endDate={end}"
+        
+        if self.cacheDir == None or datetime.strptime(end, "%Y-%m-%d") + CLOSED_PERIOD_DELAY > datetime.now():
+            return self.callEndPoint(path)["systems"]
+        
+        cacheFile = f"{self.cacheDir}/{hashlib.sha256(f'{self.sigridURL}{path}'.encode('utf8')).hexdigest()}.json"
+        if os.path.exists(cacheFile):
+            with open(cacheFile, "r", encoding="utf-8") as f:
+                return json.load(f)["systems"]
+        
+        response = self.callEndPoint(path)
+        os.makedirs(self.cacheDir, exist_ok=True)
+        with open(f"{cacheFile}.{threading.get_ident()}", "w", encoding="utf-8") as f:
+            json.dump(response, f)
+        os.replace(f"{cacheFile}.{threading.get_ident()}", cacheFile)
         return response["systems"]
 
     def fetchArchitectureGraph(self, system):
@@ -105,12 +105,17 @@ class PolarionApiClient:
         "MEDIUM" : "Nice to Have",
         "LOW" : "Nice to Have"
     }
+    PAGE_SIZE = 100
+    FINDING_QUERY_BATCH_SIZE = 50
 
     def __init__(self, baseURL, token, projectId, systemWorkItemId):
         self.baseURL = baseURL
         self.token = token
         self.projectId = urllib.parse.quote(projectId.encode("utf8"))
         self.systemWorkItemId = systemWorkItemId
+        # Finding ID -> work item ID, for all findings that have been looked up in Polarion.
+        self.findingWorkItems = {}
+        self.indexedFindings = set()
 
     def call(self, method, path, body=None):
         data = None if body == None else json.dumps(body).encode("utf8")
@@ -133,13 +138,49 @@ class PolarionApiClient:
                 print(e.read().decode("utf8"))
             return None
     
+    def query_work_items(self, query, fields):
+        pageNumber = 1
+        while True:
+            params = urllib.parse.urlencode({
+                "query": query,
+                "fields[workitems]": fields,
+                "page[size]": self.PAGE_SIZE,
+                "page[number]": pageNumber
+            }, quote_via=urllib.parse.quote)
+            response = self.call("GET", f"/projects/{self.projectId}/workitems?{params}")
+            if response is None:
+                raise Exception(f"Cannot query Polarion work items: {query}")
+            workItems = response.get("data", [])
+            yield from workItems
+            if len(workItems) < self.PAGE_SIZE:
+                return
+            pageNumber += 1
+
+    def index_findings(self, findings: list[Finding], refresh=False):
+        """Looks up the work items for all findings at once, using one query per batch of finding IDs."""
+        findingIds = list(dict.fromkeys(finding.id for finding in findings
+                                        if refresh or finding.id not in self.indexedFindings))
+
+        for start in range(0, len(findingIds), self.FINDING_QUERY_BATCH_SIZE):
+            batch = findingIds[start:start + self.FINDING_QUERY_BATCH_SIZE]
+            for findingId in batch:
+                self.findingWorkItems.pop(findingId, None)
+            for workItem in self.query_work_items(f"findingid:({' OR '.join(batch)})", "findingid"):
+                findingId = workItem.get("attributes", {}).get("findingid")
+                if findingId in batch:
+                    self.findingWorkItems.setdefault(findingId, workItem["id"])
+            self.indexedFindings.update(batch)
+
     def is_new_finding(self, finding: Finding) -> bool:
-        response = self.call("GET", f"/projects/{self.projectId}/workitems?query=findingid%3A{finding.id}")
-        return not ("data" in response and len(response["data"]) > 0)
+        self.index_findings([finding])
+        return finding.id not in self.findingWorkItems
 
     def get_finding_id(self, finding: Finding) -> str:
-        response = self.call("GET", f"/projects/{self.projectId}/workitems?query=findingid%3A{finding.id}")
-        return response["data"][0]["id"]
+        self.index_findings([finding])
+        if finding.id not in self.findingWorkItems:
+            # Created after it was looked up, so look it up again.
+            self.index_findings([finding], refresh=True)
+        return self.findingWorkItems[finding.id]
 
     def is_new_component(self, componentName, componentVersion) -> bool:
         query = f"componentName%3A{componentName}%20AND%20componentVersion%3A{componentVersion}"
@@ -304,10 +345,12 @@ def process_findings(findings: Any, include: Callable[[Finding], bool]) -> list[
 
 def create_work_items_for_internal(polarion):
     all_internal_security_findings = process_findings(sigrid.get_security_findings(), polarion.filter_security_findings)
-    
+    polarion.index_findings(all_internal_security_findings)
+
     new_security_findings = list(filter(polarion.is_new_finding, all_internal_security_findings))
     new_sbom_findings = list(map(polarion.create_sbom_security_finding, new_security_findings))
     polarion.create_work_items(new_sbom_findings)
+    polarion.index_findings(new_security_findings, refresh=True)
     polarion.link_findings_to_components(new_security_findings)
 
     old_security_findings = list(filter(lambda x: not polarion.is_new_finding(x), all_internal_security_findings))
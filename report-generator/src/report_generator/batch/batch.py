@@ -0,0 +1,160 @@
+#  Copyright Software Improvement Group
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import logging
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Optional, TextIO
+
+import yaml
+
+from report_generator import presets
+from report_generator.generator import data_models, planner, sigrid_api
+from report_generator.generator.response_cache import ResponseCache
+
+
+@dataclass(frozen=True)
+class ApiContext:
+    customer: str
+    token: str = field(repr=False)
+    start: str
+    end: str
+    api_url: Optional[str] = None
+
+    def configure(self, system: Optional[str]) -> None:
+        sigrid_api.reset_context(reset_customer=True, reset_system=True)
+        sigrid_api.set_context(bearer_token=self.token, customer=self.customer, system=system,
+                               period=(self.start, self.end), base_url=self.api_url)
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    context: ApiContext
+    layout: str
+    out_file: str
+    system: Optional[str] = None
+
+
+def load_manifest(manifest: TextIO, token: Optional[str], start: str, end: str) -> list[BatchJob]:
+    """
+    Reads the reports that should be generated from a YAML manifest. The manifest contains a list of reports, each
+    with a customer, layout, out-file and (for system-level layouts) a system. The token, start and api-url can be
+    specified for all reports at the top level of the manifest, or per report.
+    """
+    content = yaml.safe_load(manifest) or {}
+    reports = content.get("reports")
+
+    if not isinstance(reports, list) or len(reports) == 0:
+        raise ValueError("The manifest does not contain any reports")
+
+    defaults = {"token": token, "start": start, **{key: value for key, value in content.items() if key != "reports"}}
+    return [_to_job({**defaults, **report}, end) for report in reports]
+
+
+def _to_job(report: dict, end: str) -> BatchJob:
+    for required in ("customer", "layout", "out-file", "token"):
+        if not report.get(required):
+            raise ValueError(f"Report {report.get('out-file', '')} in the manifest is missing '{required}'")
+
+    layout = report["layout"]
+    system = report.get("system")
+
+    if layout not in presets.ids:
+        raise ValueError(f"Unsupported layout '{layout}' for report {report['out-file']}")
+    if layout in presets.SYSTEM_LEVEL_PRESETS and system is None:
+        raise ValueError(f"System is required when using layout '{layout}' (report {report['out-file']})")
+    if layout not in presets.SYSTEM_LEVEL_PRESETS and system is not None:
+        raise ValueError(f"System is not allowed when using layout '{layout}' (report {report['out-file']})")
+
+    context = ApiContext(str(report["customer"]).lower(), report["token"], str(report["start"]), end,
+                         report.get("api-url"))
+    return BatchJob(context, layout, str(report["out-file"]), None if system is None else str(system))
+
+
+def run(jobs: list[BatchJob], cache_dir: Optional[str] = None, workers: Optional[int] = None,
+        timeout: float = sigrid_api.DEFAULT_TIMEOUT_SECONDS) -> list[BatchJob]:
+    """
+    Generates all reports. All Sigrid API data that is needed by the reports is fetched once, up front, and
+    shared with the worker processes that render the reports through the response cache. Returns the jobs that failed.
+    """
+    if cache_dir is None:
+        with tempfile.TemporaryDirectory(prefix="report-generator-") as temp_dir:
+            return run(jobs, temp_dir, workers, timeout)
+
+    sigrid_api.set_context(timeout=timeout)
+    _fetch_data(jobs, cache_dir)
+    return _render_reports(jobs, cache_dir, workers, timeout)
+
+
+def _fetch_data(jobs: list[BatchJob], cache_dir: str) -> None:
+    # The data models use the system from the API context, so the data is fetched for one system at a time.
+    # Portfolio data that is used for several systems is only fetched once, through the API memory cache.
+    models_per_system = defaultdict(set)
+    for job in jobs:
+        models_per_system[(job.context, job.system)].update(presets.data_models(job.layout))
+
+    response_cache = ResponseCache(cache_dir)
+    sigrid_api.set_response_cache(response_cache)
+
+    try:
+        for (context, system), models in models_per_system.items():
+            logging.info(f"Fetching Sigrid API data for customer {context.customer}, system {system or 'portfolio'}")
+            context.configure(system)
+            data_models.reset()
+            planner.prefetch_models(models)
+    finally:
+        data_models.reset()
+        sigrid_api.set_response_cache(None)
+        sigrid_api.clear_cache()
+        response_cache.close()
+
+
+def _render_reports(jobs: list[BatchJob], cache_dir: str, workers: Optional[int], timeout: float) -> list[BatchJob]:
+    failed = []
+    log_level = logging.getLogger().getEffectiveLevel()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initialize_worker,
+                             initargs=(cache_dir, log_level, timeout)) as executor:
+        futures = {executor.submit(_render_report, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                logging.error(f"Failed to generate report {job.out_file}: {e}")
+                failed.append(job)
+
+    logging.info(f"Generated {len(jobs) - len(failed)} of {len(jobs)} reports")
+    return failed
+
+
+def _initialize_worker(cache_dir: str, log_level: int, timeout: float) -> None:
+    logging.basicConfig(level=log_level, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    # Forked workers inherit the session of the main process, don't share its connections.
+    sigrid_api.reset_context(reset_session=True)
+    sigrid_api.set_context(timeout=timeout)
+    sigrid_api.set_response_cache(ResponseCache(cache_dir))
+
+
+def _render_report(job: BatchJob) -> None:
+    job.context.configure(job.system)
+    data_models.reset()
+
+    try:
+        presets.run(job.layout, job.out_file)
+    except Exception as e:
+        # Exceptions are passed back to the main process, so make sure they can be pickled.
+        raise RuntimeError(f"{type(e).__name__}: {e}") from None
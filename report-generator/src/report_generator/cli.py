@@ -21,8 +21,9 @@ import click
 import requests
 from dateutil.relativedelta import relativedelta
 
-from report_generator import presets
-from report_generator.generator import ReportGenerator, sigrid_api
+from report_generator import batch as batch_reports, presets
+from report_generator.generator import ReportGenerator, profiling, sigrid_api
+from report_generator.generator.response_cache import ResponseCache
 
 DEFAULT_START_DATE = (date.today() + relativedelta(months=-1)).strftime('%Y-%m-%d')
 DEFAULT_END_DATE = date.today().strftime('%Y-%m-%d')
@@ -79,28 +80,91 @@ def _validate_layout_or_template(ctx, param, value):
 @click.option('-o', '--out-file', default='out', help='write output to this file (default out.pptx/docx)')
 @click.option('-a', '--api-url', default=None,
               help=f'Sigrid API base URL, will default to {sigrid_api.DEFAULT_BASE_URL} if not provided')
-def run(debug, customer, system, token, layout, template, start, out_file, api_url):
+@click.option('--cache-dir', default=lambda: os.environ.get('SIGRID_REPORT_GENERATOR_CACHE_DIR'),
+              type=click.Path(file_okay=False),
+              help='Directory for caching Sigrid API responses between runs (default: $SIGRID_REPORT_GENERATOR_CACHE_DIR)')
+@click.option('--no-cache', is_flag=True, default=False, help='Do not use cached Sigrid API responses')
+@click.option('--profile', is_flag=True, default=False,
+              help='Print where the time was spent, and write a trace of the run to <out-file>.trace.json')
+@click.option('--timeout', type=click.FloatRange(min=0, min_open=True), default=sigrid_api.DEFAULT_TIMEOUT_SECONDS,
+              show_default=True, help='Timeout in seconds for each Sigrid API request')
+def run(debug, customer, system, token, layout, template, start, out_file, api_url, cache_dir, no_cache, profile,
+        timeout):
     _configure_logging(debug)
-    _configure_api(customer, system, token, (start, DEFAULT_END_DATE), api_url)
+    _configure_api(customer, system, token, (start, DEFAULT_END_DATE), api_url, timeout)
+    _configure_cache(None if no_cache else cache_dir)
     _record_usage_statistics(layout, customer)
 
-    if template:
-        ReportGenerator(template.name).generate(out_file)
-        return
+    if profile:
+        profiling.start()
+
+    try:
+        if template:
+            ReportGenerator(template.name).generate(out_file)
+        else:
+            presets.run(layout, out_file)
+    finally:
+        if profile:
+            _report_profile(profiling.stop(), f"{out_file}.trace.json")
 
-    presets.run(layout, out_file)
 
+@click.command()
+@click.argument('manifest', type=click.File('r'))
+@click.option('-d', '--debug', is_flag=True, default=False, help='Enable debug messages')
+@click.option('-t', '--token', default=lambda: os.environ.get('SIGRID_CI_TOKEN'),
+              help='Sigrid CI token, used for reports that do not specify their own token in the manifest')
+@click.option('--start', default=DEFAULT_START_DATE, help='Report start date in yyyy-mm-dd, default is last month.')
+@click.option('-j', '--jobs', type=click.IntRange(min=1), default=None,
+              help='Number of reports to generate in parallel (default: number of CPUs)')
+@click.option('--cache-dir', default=lambda: os.environ.get('SIGRID_REPORT_GENERATOR_CACHE_DIR'),
+              type=click.Path(file_okay=False),
+              help='Directory for caching Sigrid API responses between runs (default: a temporary directory)')
+@click.option('--timeout', type=click.FloatRange(min=0, min_open=True), default=sigrid_api.DEFAULT_TIMEOUT_SECONDS,
+              show_default=True, help='Timeout in seconds for each Sigrid API request')
+def batch(manifest, debug, token, start, jobs, cache_dir, timeout):
+    """Generates all reports listed in a YAML MANIFEST, fetching the Sigrid data they share only once."""
+    _configure_logging(debug)
+
+    try:
+        batch_jobs = batch_reports.load_manifest(manifest, token, start, DEFAULT_END_DATE)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='MANIFEST')
 
-def _configure_api(customer: str, system: str, token: str, period: tuple[str, str], api_url: Optional[str]):
+    for layout, customer in sorted({(job.layout, job.context.customer) for job in batch_jobs}):
+        _record_usage_statistics(layout, customer)
+
+    failed = batch_reports.run(batch_jobs, os.path.expanduser(cache_dir) if cache_dir else None, jobs, timeout)
+    if failed:
+        raise click.ClickException(f"Failed to generate {len(failed)} of {len(batch_jobs)} reports")
+
+
+def _configure_api(customer: str, system: str, token: str, period: tuple[str, str], api_url: Optional[str],
+                   timeout: float):
     sigrid_api.set_context(
         bearer_token=token,
         customer=customer,
         system=system,
         period=period,
-        base_url=api_url
+        base_url=api_url,
+        timeout=timeout
     )
 
 
+def _configure_cache(cache_dir: Optional[str]):
+    if not cache_dir:
+        sigrid_api.set_response_cache(None)
+        return
+
+    logging.info(f"Caching Sigrid API responses in {cache_dir}")
+    sigrid_api.set_response_cache(ResponseCache(os.path.expanduser(cache_dir)))
+
+
+def _report_profile(profiler: profiling.Profiler, trace_path: str):
+    profiler.write_trace(trace_path)
+    click.echo(profiler.summary())
+    click.echo(f"\nTrace written to {trace_path}")
+
+
 def _record_usage_statistics(layout, customer):
     if os.environ.get('SIGRID_REPORT_GENERATOR_RECORD_USAGE', '1') == '0':
         logging.info("Not recording usage statistics")
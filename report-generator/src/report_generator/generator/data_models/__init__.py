@@ -12,6 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from functools import cached_property
+
 from .architecture import architecture_data
 from .maintainability import maintainability_data
 from .modernization import modernization_data
@@ -19,3 +21,19 @@ from .objectives import objectives_data
 from .osh import osh_data
 from .refactoring_candidates import refactoring_candidates_data
 from .system_metadata import system_metadata
+
+__all__ = ['architecture_data', 'maintainability_data', 'modernization_data', 'objectives_data', 'osh_data',
+           'refactoring_candidates_data', 'system_metadata']
+
+_models = [architecture_data, maintainability_data, modernization_data, objectives_data, osh_data,
+           refactoring_candidates_data, system_metadata]
+
+
+def reset() -> None:
+    """Forgets all data loaded by the data models, so they can be reused for another customer or system."""
+    for model in _models:
+        for name, attribute in vars(type(model)).items():
+            if isinstance(attribute, cached_property):
+                model.__dict__.pop(name, None)
+
+    type(refactoring_candidates_data).get_candidates.cache_clear()
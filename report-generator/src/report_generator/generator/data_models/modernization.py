@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from functools import cached_property
@@ -83,6 +84,7 @@ def fetch_possible_candidates():
 
 class ModernizationData:
     MAX_SYSTEMS = 100
+    MAX_CONCURRENT_REQUESTS = 8
     MIN_DEV_SPEED_IMPROVEMENT = 5.0
     MIN_EFFORT = 0.25
 
@@ -108,22 +110,43 @@ class ModernizationData:
         systems = self.possible_candidates.copy()
         systems.sort(key=lambda e: -e.maintainability_data["volumeInPersonMonths"])
         systems = systems[0:self.MAX_SYSTEMS]
+        architecture_graphs = self.fetch_architecture_graphs(systems)
 
-        candidates = [self.to_modernization_candidate(system.maintainability_data, system.metadata) for system in
-                      systems]
+        candidates = [self.to_modernization_candidate(system.maintainability_data, system.metadata,
+                                                      architecture_graphs[system.maintainability_data["system"]])
+                      for system in systems if system.maintainability_data["system"] in architecture_graphs]
         candidates = [candidate for candidate in candidates if self.is_viable_candidate(candidate)]
         candidates.sort(key=lambda candidate: -candidate.priority)
         return candidates
 
-    def to_modernization_candidate(self, system, metadata) -> Optional[ModernizationCandidate]:
-        volume_in_py = system["volumeInPersonMonths"] / 12.0
-
+    def fetch_architecture_graphs(self, systems: list[CandidateSystem]) -> dict[str, dict]:
+        """
+        Fetches the architecture graphs for all systems in parallel, with at most MAX_CONCURRENT_REQUESTS requests
+        in flight. Systems for which the request failed are left out of the result.
+        """
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS) as executor:
+            graphs = executor.map(lambda system: self.fetch_architecture_graph(system.maintainability_data["system"],
+                                                                               system.metadata), systems)
+            return {system.maintainability_data["system"]: graph for system, graph in zip(systems, graphs)
+                    if graph is not None}
+
+    @staticmethod
+    def fetch_architecture_graph(system_name, metadata) -> Optional[dict]:
         try:
-            architecture_graph = sigrid_api.get_architecture_graph(system["system"])
+            return sigrid_api.get_architecture_graph(system_name)
         except sigrid_api.SigridAPIRequestFailed as e:
             logging.warning("Skipping system %s due to Sigrid API request failure: %s", metadata["systemName"], e)
             return None
 
+    def to_modernization_candidate(self, system, metadata,
+                                   architecture_graph: Optional[dict] = None) -> Optional[ModernizationCandidate]:
+        volume_in_py = system["volumeInPersonMonths"] / 12.0
+
+        if architecture_graph is None:
+            architecture_graph = self.fetch_architecture_graph(system["system"], metadata)
+            if architecture_graph is None:
+                return None
+
         if system.get("maintainability") is None:
             logging.warning("Skipping system %s due to missing maintainability data", metadata["systemName"])
             return None
@@ -12,13 +12,18 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from array import array
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from functools import cached_property
+from typing import Iterable, Optional
 
 from report_generator.generator import sigrid_api
 from report_generator.generator.report_utils.time_series import Period
 
+MAX_CONCURRENT_REQUESTS = 8
+
 
 class ObjectiveStatus(Enum):
     MET = "MET"
@@ -43,7 +48,13 @@ class ObjectivesData:
 
     @cached_property
     def objectives_evaluation_trend(self):
-        return [(period, sigrid_api.get_objectives_evaluation(period)["systems"]) for period in self.periods]
+        return list(zip(self.periods, self.fetch_evaluations(self.periods)))
+
+    @staticmethod
+    def fetch_evaluations(periods: list[Period]) -> list[list[dict]]:
+        """Fetches the objective evaluations of all systems for each of the periods, concurrently."""
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            return list(executor.map(lambda period: sigrid_api.get_objectives_evaluation(period)["systems"], periods))
 
     @cached_property
     def objectives_evaluation_status(self):
@@ -60,52 +71,33 @@ class ObjectivesData:
                 result["Unknown"].append(system_metadata["systemName"])
         return dict(sorted(result.items(), key=lambda item: item[0], reverse=True))
 
+    @cached_property
+    def trend_cube(self) -> "ObjectivesStatusCube":
+        return ObjectivesStatusCube([evaluation for _, evaluation in self.objectives_evaluation_trend])
+
+    @cached_property
+    def status_cube(self) -> "ObjectivesStatusCube":
+        return ObjectivesStatusCube([self.objectives_evaluation_status])
+
     def get_portfolio_trend_series(self, capability):
-        series = []
-        for status in ObjectiveStatus:
-            row = []
-            for period, evaluation in self.objectives_evaluation_trend:
-                row.append(self.get_portfolio_percentage(evaluation, capability, status))
-            series.append(row)
-        return series
+        distributions = [self.trend_cube.distribution(period, capability) for period in range(len(self.periods))]
+        return self._to_series(distributions)
 
     def get_portfolio_status_series(self):
-        evaluation = self.objectives_evaluation_status
-        return [[self.get_portfolio_percentage(evaluation, None, status)] for status in ObjectiveStatus]
+        return self._to_series([self.status_cube.distribution(0)])
 
     def get_team_status_series(self):
-        series = []
-        for status in ObjectiveStatus:
-            row = []
-            for team, system_names in self.teams.items():
-                evaluation = self.filter_system_evaluations(self.objectives_evaluation_status, system_names)
-                row.append(self.get_portfolio_percentage(evaluation, None, status))
-            series.append(row)
-        return series
+        distributions = self.status_cube.distribution_per_group(0, self.teams)
+        return self._to_series([distributions[team] for team in self.teams])
 
     def get_capability_status_series(self):
-        evaluation = self.objectives_evaluation_status
-        mapper = lambda capability, current_status: self.get_portfolio_percentage(evaluation, capability,
-                                                                                  current_status)
-
-        series = []
-        for status in ObjectiveStatus:
-            row = [mapper(capability, status) for capability in self.capabilities]
-            series.append(row)
-        return series
+        return self._to_series([self.status_cube.distribution(0, capability) for capability in self.capabilities])
 
-    def get_portfolio_percentage(self, evaluations, capability, status):
-        with_status = 0
-        total = 0
-
-        for system in evaluations:
-            for objective_evaluation in system["objectives"]:
-                if capability is None or objective_evaluation["feature"] == capability:
-                    if self.determine_system_status(objective_evaluation) == status:
-                        with_status += 1
-                    total += 1
-
-        return with_status * 100.0 / total if total > 0 else 0
+    @staticmethod
+    def _to_series(distributions: list[list[int]]) -> list[list[float]]:
+        """Converts status counts per category to the percentage of each status, per category."""
+        return [[counts[i] * 100.0 / sum(counts) if sum(counts) > 0 else 0 for counts in distributions]
+                for i in range(len(ObjectiveStatus))]
 
     @staticmethod
     def determine_system_status(objective_evaluation):
@@ -122,9 +114,87 @@ class ObjectivesData:
         else:
             return ObjectiveStatus.UNKNOWN
 
-    @staticmethod
-    def filter_system_evaluations(evaluation, system_names):
-        return [system for system in evaluation if system["systemName"] in system_names]
+
+class ObjectivesStatusCube:
+    """
+    Number of objective evaluations for each period, system, capability and status, counted once and stored in a flat
+    array. The status distribution for any combination of period, systems and capability is a sum over this array.
+    """
+
+    STATUSES = list(ObjectiveStatus)
+
+    def __init__(self, evaluations: list[list[dict]]):
+        self.systems: dict[str, int] = {}
+        self.capabilities: dict[str, int] = {}
+
+        for evaluation in evaluations:
+            for system in evaluation:
+                self.systems.setdefault(system["systemName"], len(self.systems))
+                for objective_evaluation in system["objectives"]:
+                    self.capabilities.setdefault(objective_evaluation["feature"], len(self.capabilities))
+
+        status_index = {status: index for index, status in enumerate(self.STATUSES)}
+        self.counts = array("L", [0]) * (len(evaluations) * self._period_size)
+
+        for period, evaluation in enumerate(evaluations):
+            for system in evaluation:
+                for objective_evaluation in system["objectives"]:
+                    status = ObjectivesData.determine_system_status(objective_evaluation)
+                    offset = self._offset(period, self.systems[system["systemName"]],
+                                          self.capabilities[objective_evaluation["feature"]])
+                    self.counts[offset + status_index[status]] += 1
+
+    @property
+    def _period_size(self) -> int:
+        return len(self.systems) * len(self.capabilities) * len(self.STATUSES)
+
+    def _offset(self, period: int, system: int, capability: int) -> int:
+        return ((period * len(self.systems) + system) * len(self.capabilities) + capability) * len(self.STATUSES)
+
+    def distribution(self, period: int, capability: Optional[str] = None,
+                     systems: Optional[Iterable[str]] = None) -> list[int]:
+        """
+        Number of objective evaluations with each status in the period, for one or all capabilities, and for the
+        given or all systems.
+        """
+        if systems is None:
+            system_indices = range(len(self.systems))
+        else:
+            system_indices = {self.systems[name] for name in systems if name in self.systems}
+
+        counts = [0] * len(self.STATUSES)
+        for system in system_indices:
+            self._add_system_counts(counts, period, system, capability)
+        return counts
+
+    def distribution_per_group(self, period: int, groups: dict[str, Iterable[str]]) -> dict[str, list[int]]:
+        """Like distribution, for all capabilities, but for every group of systems, such as teams, at once."""
+        groups_per_system = defaultdict(list)
+        for group, system_names in groups.items():
+            for name in set(system_names):
+                if name in self.systems:
+                    groups_per_system[self.systems[name]].append(group)
+
+        result = {group: [0] * len(self.STATUSES) for group in groups}
+        for system, system_groups in groups_per_system.items():
+            counts = [0] * len(self.STATUSES)
+            self._add_system_counts(counts, period, system, None)
+            for group in system_groups:
+                result[group] = [a + b for a, b in zip(result[group], counts)]
+        return result
+
+    def _add_system_counts(self, counts: list[int], period: int, system: int, capability: Optional[str]) -> None:
+        if capability is None:
+            capability_indices = range(len(self.capabilities))
+        elif capability in self.capabilities:
+            capability_indices = [self.capabilities[capability]]
+        else:
+            return
+
+        for capability_index in capability_indices:
+            offset = self._offset(period, system, capability_index)
+            for i in range(len(self.STATUSES)):
+                counts[i] += self.counts[offset + i]
 
 
 objectives_data = ObjectivesData()
@@ -22,23 +22,24 @@ from report_generator.generator.constants import OSHMetric
 
 
 class _AnonDataClass:
-    total_deps = 0
+    def __init__(self):
+        self.total_deps = 0
 
-    date_day = ""
-    date_month = ""
-    date_year = ""
+        self.date_day = ""
+        self.date_month = ""
+        self.date_year = ""
 
-    ratings = {}
+        self.ratings = {}
 
-    # critical, high, medium, low, no risk
-    vuln_risks = [0, 0, 0, 0, 0]
-    license_risks = [0, 0, 0, 0, 0]
-    freshness_risks = [0, 0, 0, 0, 0]
-    stability_risks = [0, 0, 0, 0, 0]
-    mgmt_risks = [0, 0, 0, 0, 0]
-    activity_risks = [0, 0, 0, 0, 0]
+        # critical, high, medium, low, no risk
+        self.vuln_risks = [0, 0, 0, 0, 0]
+        self.license_risks = [0, 0, 0, 0, 0]
+        self.freshness_risks = [0, 0, 0, 0, 0]
+        self.stability_risks = [0, 0, 0, 0, 0]
+        self.mgmt_risks = [0, 0, 0, 0, 0]
+        self.activity_risks = [0, 0, 0, 0, 0]
 
-    vulns = []
+        self.vulns = []
 
     @property
     def total_vulnerable(self):
@@ -15,9 +15,10 @@
 import logging
 import re
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from dataclasses import dataclass
 from enum import Enum
-from typing import Iterable, Union
+from typing import Any, Callable, ClassVar, Iterable, Optional, Set, Union
 
 from report_generator.generator.report import Report, ReportType
 from report_generator.generator.sigrid_api import SigridAPIRequestFailed
@@ -25,6 +26,7 @@ from report_generator.generator.sigrid_api import SigridAPIRequestFailed
 Parameter = Union[str, int, Enum]
 ParameterList = Iterable[Parameter]
 
+WORD_PATTERN = re.compile(r'\w+')
 CAMEL_TO_SNAKE_PATTERN = re.compile(r'(?<!^)(?=[A-Z][a-z])|(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])')
 
 
@@ -43,11 +45,32 @@ class PlaceholderDocType(Enum):
     OTHER = 'Other'
 
 
+class PlaceholderValues:
+    """
+    Placeholder values that were computed before the placeholders are resolved. If computing a value failed, the
+    exception is raised when the value is used, so it is handled by resolve like any other failure.
+    """
+
+    def __init__(self):
+        self._futures: dict[tuple[type, str], Future] = {}
+
+    def add(self, placeholder: type, key: str, future: Future) -> None:
+        self._futures[(placeholder, key)] = future
+
+    def callback(self, placeholder: type, key: str, default: Callable[[], Any]) -> Callable[[], Any]:
+        future = self._futures.get((placeholder, key))
+        return future.result if future is not None else default
+
+
 @dataclass
 class Placeholder(ABC):
     key: str
     __doc_type__: PlaceholderDocType = PlaceholderDocType.OTHER
     __placeholder__ = True
+    # The data models the value of this placeholder is computed from, so their data can be loaded up front.
+    data_models: ClassVar[tuple] = ()
+    # Placeholders that compute everything they need while they are resolved don't use their value.
+    uses_value: ClassVar[bool] = True
 
     @classmethod
     @abstractmethod
@@ -55,14 +78,15 @@ class Placeholder(ABC):
         pass
 
     @classmethod
-    def resolve(cls, report: Report) -> None:
+    def resolve(cls, report: Report, values: Optional[PlaceholderValues] = None) -> None:
         resolve_method_name = cls._determine_resolve_method(report.type)
 
         if not resolve_method_name:
             return
 
         try:
-            getattr(cls, resolve_method_name)(report, cls.key, cls.value)
+            value_cb = values.callback(cls, cls.key, cls.value) if values else cls.value
+            getattr(cls, resolve_method_name)(report, cls.key, value_cb)
         except SigridAPIRequestFailed as e:
             logging.info(f'Failed to resolve {cls.key}: {e}')
         except (KeyError, AttributeError, ValueError) as e:
@@ -77,6 +101,26 @@ class Placeholder(ABC):
         else:
             return None
 
+    @classmethod
+    def key_parameters(cls) -> list[tuple[str, Parameter]]:
+        """All keys this placeholder can appear as in a template, with the parameter for their value."""
+        return [(cls.key, None)]
+
+    @classmethod
+    def keys(cls) -> list[str]:
+        return [key for key, _ in cls.key_parameters()]
+
+    @classmethod
+    def used_key_parameters(cls, tokens: Set[str]) -> list[tuple[str, Parameter]]:
+        """The keys that appear in a template, given the set of all words and table names in it."""
+        # Keys that are not a single word cannot be found in the tokens, so we can't rule them out.
+        return [(key, parameter) for key, parameter in cls.key_parameters()
+                if key in tokens or not WORD_PATTERN.fullmatch(key)]
+
+    @classmethod
+    def is_used(cls, tokens: Set[str]) -> bool:
+        return len(cls.used_key_parameters(tokens)) > 0
+
     @classmethod
     def supports(cls, report_type: ReportType) -> bool:
         return cls._determine_resolve_method(report_type) is not None
@@ -91,17 +135,21 @@ class ParameterizedPlaceholder(Placeholder, ABC):
     allowed_parameters: ParameterList
 
     @classmethod
-    def resolve(cls, report: Report) -> None:
+    def key_parameters(cls) -> list[tuple[str, Parameter]]:
+        return [(cls.key.replace('{parameter}', str(parameter)), parameter) for parameter in cls.allowed_parameters]
+
+    @classmethod
+    def resolve(cls, report: Report, values: Optional[PlaceholderValues] = None) -> None:
         resolve_method_name = cls._determine_resolve_method(report.type)
 
         if not resolve_method_name:
             return
 
-        for parameter in cls.allowed_parameters:
-            key_p = cls.key.replace('{parameter}', str(parameter))
-
+        for key_p, parameter in cls.key_parameters():
             try:
                 value_p = lambda: cls.value(parameter)
+                if values:
+                    value_p = values.callback(cls, key_p, value_p)
                 getattr(cls, resolve_method_name)(report, key_p, value_p)
             except SigridAPIRequestFailed as e:
                 logging.info(f'Failed to resolve {key_p}: {e}')
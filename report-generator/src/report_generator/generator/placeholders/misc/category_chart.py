@@ -88,6 +88,7 @@ class _AbstractCategoryChartPlaceholder(Placeholder, ABC):
 class TechnologyCategoryChartPlaceholder(_AbstractCategoryChartPlaceholder):
     """Chart with volume (in % of person months of code) per technology."""
     key = "TECHNOLOGY_CHART"
+    data_models = (maintainability_data,)
 
     @classmethod
     def labels(cls):
@@ -106,6 +107,7 @@ class TechnologyCategoryChartPlaceholder(_AbstractCategoryChartPlaceholder):
 class TestCodeRatioCategoryChartPlaceholder(_AbstractCategoryChartPlaceholder):
     """Pie chart with volume and % of test code per technology, colored in line with the SIG test code benchmark."""
     key = "TEST_CODE_RATIO_CHART"
+    data_models = (maintainability_data,)
 
     @classmethod
     def labels(cls):
@@ -128,6 +130,7 @@ class TestCodeRatioCategoryChartPlaceholder(_AbstractCategoryChartPlaceholder):
 
 class TechnicalDebtSystemsChartPlaceholder(_AbstractCategoryChartPlaceholder):
     key = "TECHNICAL_DEBT_SYSTEMS_CHART"
+    data_models = (modernization_data,)
 
     @classmethod
     def labels(cls):
@@ -148,6 +151,7 @@ class TechnicalDebtSystemsChartPlaceholder(_AbstractCategoryChartPlaceholder):
 
 class ObjectivesOverallChartPlaceholder(_AbstractCategoryChartPlaceholder):
     key = "OBJECTIVES_OVERALL_CHART"
+    data_models = (objectives_data,)
 
     @classmethod
     def labels(cls):
@@ -164,6 +168,7 @@ class ObjectivesOverallChartPlaceholder(_AbstractCategoryChartPlaceholder):
 
 class ObjectivesMaintainabilityChartPlaceholder(_AbstractCategoryChartPlaceholder):
     key = "OBJECTIVES_MAINTAINABILITY_CHART"
+    data_models = (objectives_data,)
 
     @classmethod
     def labels(cls):
@@ -180,6 +185,7 @@ class ObjectivesMaintainabilityChartPlaceholder(_AbstractCategoryChartPlaceholde
 
 class ObjectivesArchitectureChartPlaceholder(_AbstractCategoryChartPlaceholder):
     key = "OBJECTIVES_ARCHITECTURE_CHART"
+    data_models = (objectives_data,)
 
     @classmethod
     def labels(cls):
@@ -196,6 +202,7 @@ class ObjectivesArchitectureChartPlaceholder(_AbstractCategoryChartPlaceholder):
 
 class ObjectivesSecurityChartPlaceholder(_AbstractCategoryChartPlaceholder):
     key = "OBJECTIVES_SECURITY_CHART"
+    data_models = (objectives_data,)
 
     @classmethod
     def labels(cls):
@@ -212,6 +219,7 @@ class ObjectivesSecurityChartPlaceholder(_AbstractCategoryChartPlaceholder):
 
 class ObjectivesOpenSourceHealthChartPlaceholder(_AbstractCategoryChartPlaceholder):
     key = "OBJECTIVES_OSH_CHART"
+    data_models = (objectives_data,)
 
     @classmethod
     def labels(cls):
@@ -228,6 +236,7 @@ class ObjectivesOpenSourceHealthChartPlaceholder(_AbstractCategoryChartPlacehold
 
 class ObjectivesStatusChartPlaceholder(_AbstractCategoryChartPlaceholder):
     key = "OBJECTIVES_STATUS_CHART"
+    data_models = (objectives_data,)
 
     @classmethod
     def labels(cls):
@@ -244,6 +253,7 @@ class ObjectivesStatusChartPlaceholder(_AbstractCategoryChartPlaceholder):
 
 class ObjectivesTeamChartPlaceholder(_AbstractCategoryChartPlaceholder):
     key = "OBJECTIVES_TEAM_CHART"
+    data_models = (objectives_data,)
 
     @classmethod
     def labels(cls):
@@ -260,6 +270,7 @@ class ObjectivesTeamChartPlaceholder(_AbstractCategoryChartPlaceholder):
 
 class ObjectivesCapabilitiesChartPlaceholder(_AbstractCategoryChartPlaceholder):
     key = "OBJECTIVES_CAPABILITY_CHART"
+    data_models = (objectives_data,)
 
     @classmethod
     def labels(cls):
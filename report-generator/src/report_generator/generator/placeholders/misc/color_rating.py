@@ -48,6 +48,7 @@ class _AbstractColorRatingPlaceholder(ParameterizedPlaceholder, ABC):
 
 class ArchColorRatingPlaceholder(_AbstractColorRatingPlaceholder):
     key = "COLOR_ARCH_RATING_{parameter}"
+    data_models = (architecture_data,)
     allowed_parameters = list(ArchMetric) + list(ArchSubcharacteristic)
 
     @classmethod
@@ -58,6 +59,7 @@ class ArchColorRatingPlaceholder(_AbstractColorRatingPlaceholder):
 
 class MaintColorRatingPlaceholder(_AbstractColorRatingPlaceholder):
     key = "COLOR_MAINT_RATING_{parameter}"
+    data_models = (maintainability_data,)
     allowed_parameters = list(MaintMetric)
 
     @classmethod
@@ -24,6 +24,8 @@ from report_generator.generator.placeholders.base import PlaceholderDocType
 class MaintainabilityGalaxyChartPlaceholder(Placeholder):
     """Traditional SIG benchmark galaxy chart."""
     key = "GALAXY_SLIDE"
+    data_models = (maintainability_data, system_metadata,)
+    uses_value = False
     __doc_type__ = PlaceholderDocType.CHART
 
     @classmethod
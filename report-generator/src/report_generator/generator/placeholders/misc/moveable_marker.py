@@ -35,9 +35,7 @@ class _AbstractMoveableMarkerPlaceholder(Placeholder, ABC):
 
     @staticmethod
     def resolve_pptx(presentation: Presentation, key: str, value_cb: Callable[[], str]) -> None:
-        paragraphs = []
-        for slide in presentation.slides:
-            paragraphs.extend(report_utils.pptx.find_text_in_slide(slide, key))
+        paragraphs = report_utils.pptx.find_text_in_presentation(presentation, key)
 
         if len(paragraphs) == 0:
             return
@@ -55,6 +53,7 @@ class _AbstractMoveableMarkerPlaceholder(Placeholder, ABC):
 
 class MaintainabilityMovableMarkerPlaceholder(_AbstractMoveableMarkerPlaceholder):
     key = "MARKER_MAINT_RATING"
+    data_models = (maintainability_data,)
 
     @classmethod
     def value(cls, parameter=None):
@@ -63,6 +62,7 @@ class MaintainabilityMovableMarkerPlaceholder(_AbstractMoveableMarkerPlaceholder
 
 class ArchitectureMovableMarkerPlaceholder(_AbstractMoveableMarkerPlaceholder):
     key = "MARKER_ARCH_RATING"
+    data_models = (architecture_data,)
 
     @classmethod
     def value(cls, parameter=None):
@@ -71,6 +71,7 @@ class ArchitectureMovableMarkerPlaceholder(_AbstractMoveableMarkerPlaceholder):
 
 class OSHMovableMarkerPlaceholder(_AbstractMoveableMarkerPlaceholder):
     key = "MARKER_OSH_RATING"
+    data_models = (osh_data,)
 
     @classmethod
     def value(cls, parameter=None) -> str:
@@ -80,16 +81,16 @@ class OSHMovableMarkerPlaceholder(_AbstractMoveableMarkerPlaceholder):
 class _ManagementSummaryMarkerPlaceholder(Placeholder, ABC):
     @staticmethod
     def resolve_pptx(presentation: Presentation, key: str, value_cb: Callable[[], str]) -> None:
-        for slide in presentation.slides:
-            for marker in report_utils.pptx.find_text_in_slide(slide, key):
-                value, label = value_cb()
-                report_utils.pptx.update_paragraph(marker, key, f"{label}\n\n\n\n")
-                # noinspection PyProtectedMember
-                marker._parent._parent.left += int(value * _MANAGEMENT_SUMMARY_MARKER_RANGE)
+        for marker in report_utils.pptx.find_text_in_presentation(presentation, key):
+            value, label = value_cb()
+            report_utils.pptx.update_paragraph(marker, key, f"{label}\n\n\n\n")
+            # noinspection PyProtectedMember
+            marker._parent._parent.left += int(value * _MANAGEMENT_SUMMARY_MARKER_RANGE)
 
 
 class ModernizationVolumeMarkerPlaceholder(_ManagementSummaryMarkerPlaceholder):
     key = "MARKER_MODERNIZATION_VOLUME"
+    data_models = (modernization_data,)
 
     @classmethod
     def value(cls, parameter=None) -> tuple[float, str]:
@@ -98,6 +99,7 @@ class ModernizationVolumeMarkerPlaceholder(_ManagementSummaryMarkerPlaceholder):
 
 class ModernizationTechnicalDebtMarkerPlaceholder(_ManagementSummaryMarkerPlaceholder):
     key = "MARKER_MODERNIZATION_TECHNICAL_DEBT"
+    data_models = (modernization_data,)
 
     @classmethod
     def value(cls, parameter=None) -> tuple[float, str]:
@@ -108,6 +110,7 @@ class ModernizationTechnicalDebtMarkerPlaceholder(_ManagementSummaryMarkerPlaceh
 
 class ModernizationSpeedMarkerPlaceholder(_ManagementSummaryMarkerPlaceholder):
     key = "MARKER_MODERNIZATION_SPEED"
+    data_models = (modernization_data,)
 
     @classmethod
     def value(cls, parameter=None) -> tuple[float, str]:
@@ -124,6 +127,7 @@ class ModernizationSpeedMarkerPlaceholder(_ManagementSummaryMarkerPlaceholder):
 
 class ModernizationEffortMarkerPlaceholder(_ManagementSummaryMarkerPlaceholder):
     key = "MARKER_MODERNIZATION_EFFORT"
+    data_models = (modernization_data,)
 
     @classmethod
     def value(cls, parameter=None) -> tuple[float, str]:
@@ -70,6 +70,7 @@ def _set_chart_data_and_axis(chart, data, axis_max):
 class OSHSlidePlaceholder(Placeholder):
     """Traditional SIG OSH system-level slide, with risk bar charts for all 6 OSH metrics."""
     key = "OSH_SLIDE"
+    data_models = (osh_data,)
     __doc_type__ = PlaceholderDocType.CHART
 
     @classmethod
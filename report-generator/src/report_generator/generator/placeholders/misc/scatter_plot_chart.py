@@ -26,6 +26,8 @@ BLUE_GRADIENT = ["003DAB", "2E6BFF", "8DA8FF", "DBE1FF", "8A98A8"]
 
 class ModernizationScatterPlotChartPlaceholder(Placeholder):
     key = "MODERNIZATION_SCATTER_PLOT_CHART"
+    data_models = (modernization_data,)
+    uses_value = False
     __doc_type__ = PlaceholderDocType.CHART
 
     @classmethod
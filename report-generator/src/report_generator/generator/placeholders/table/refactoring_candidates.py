@@ -22,6 +22,7 @@ from report_generator.generator.placeholders.table.base import TableMatrix, Tabl
 
 class _AbstractRefactoringCandidatesTablePlaceholder(TablePlaceholder):
     metric: MaintMetric
+    data_models = (refactoring_candidates_data,)
 
     @classmethod
     @abstractmethod
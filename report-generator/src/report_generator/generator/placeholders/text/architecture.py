@@ -19,68 +19,69 @@ from report_generator.generator.formatters.formatters import calculate_stars, ma
 from .base import parameterized_text_placeholder, text_placeholder
 
 
-@text_placeholder()
+@text_placeholder(data_models=(architecture_data,))
 def arch_date_day():
     """The day of the month the latest system snapshot which was analyzed."""
     return architecture_data.date.strftime("%d")
 
 
-@text_placeholder()
+@text_placeholder(data_models=(architecture_data,))
 def arch_date_month():
     """The month of the latest system snapshot which was analyzed."""
     return architecture_data.date.strftime("%b").upper()
 
 
-@text_placeholder()
+@text_placeholder(data_models=(architecture_data,))
 def arch_date_year():
     """The year of the latest system snapshot which was analyzed."""
     return architecture_data.date.strftime("%Y")
 
 
-@text_placeholder()
+@text_placeholder(data_models=(architecture_data,))
 def arch_rating():
     """The 0.5-5.5 star rating provided by SIG's Architecture Quality Model."""
     return maintainability_round(architecture_data.ratings["architecture"])
 
 
-@text_placeholder()
+@text_placeholder(data_models=(architecture_data,))
 def arch_model_version():
     """The model version used for architecture analysis."""
     return architecture_data.data["modelVersion"]
 
 
-@text_placeholder()
+@text_placeholder(data_models=(architecture_data,))
 def arch_stars():
     """Stars corresponding to the system's Architecture Quality Rating."""
     return calculate_stars(architecture_data.ratings["architecture"])
 
 
-@text_placeholder()
+@text_placeholder(data_models=(architecture_data,))
 def arch_at_below():
     """Remark about Architecture Quality being below a certain threshold."""
     return smart_remarks.relative_to_market_average(architecture_data.ratings["architecture"])
 
 
-@text_placeholder()
+@text_placeholder(data_models=(architecture_data,))
 def arch_observation():
     """Architecture quality observation remark."""
     return smart_remarks.arch_observation(architecture_data.ratings["architecture"])
 
 
-@text_placeholder()
+@text_placeholder(data_models=(architecture_data,))
 def arch_worst_metric_remark():
     """Remark about the lowest rating metric in the system's Architecture Quality analysis."""
     return smart_remarks.arch_worst_metric_remark(architecture_data.ratings["systemProperties"])
 
 
-@text_placeholder()
+@text_placeholder(data_models=(architecture_data,))
 def arch_best_metric_remark():
     """Remark about the highest rating metric in the system's Architecture Quality analysis."""
     return smart_remarks.arch_best_metric_remark(architecture_data.ratings["systemProperties"])
 
 
 @parameterized_text_placeholder(custom_key="ARCH_RATING_{parameter}",
-                                parameters=list(ArchMetric) + list(ArchSubcharacteristic))
+                                parameters=list(ArchMetric) + list(ArchSubcharacteristic),
+                                data_models=(architecture_data,))
 def arch_rating_param(metric: MetricEnum):
     """The 0.5-5.5 star rating for this metric or subcharacteristic."""
     metric_key = metric.to_json_name()
@@ -88,7 +89,8 @@ def arch_rating_param(metric: MetricEnum):
 
 
 @parameterized_text_placeholder(custom_key="STARS_{parameter}",
-                                parameters=list(ArchMetric) + list(ArchSubcharacteristic))
+                                parameters=list(ArchMetric) + list(ArchSubcharacteristic),
+                                data_models=(architecture_data,))
 def arch_stars_param(metric: MetricEnum):
     """Stars corresponding to this metric or subcharacteristic rating."""
     metric_key = metric.to_json_name()
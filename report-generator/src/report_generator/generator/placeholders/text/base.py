@@ -67,7 +67,8 @@ class _AbstractTextPlaceholder(Placeholder, ABC):
         _AbstractTextPlaceholder._resolve_with_adapter(_AbstractTextPlaceholder._DOCX_ADAPTER, document, key, value_cb)
 
 
-def text_placeholder(custom_key: str = None) -> Callable[[Callable[[], str]], Type[Placeholder]]:
+def text_placeholder(custom_key: str = None, data_models: tuple = ()) -> Callable[
+    [Callable[[], str]], Type[Placeholder]]:
     def decorator(value_func: Callable[[], str]) -> Type[Placeholder]:
         class TextPlaceholder(_AbstractTextPlaceholder):
             __doc__ = value_func.__doc__ if value_func.__doc__ else None
@@ -78,12 +79,13 @@ def text_placeholder(custom_key: str = None) -> Callable[[Callable[[], str]], Ty
                 return value_func()
 
 
+        TextPlaceholder.data_models = data_models
         return TextPlaceholder
 
     return decorator
 
 
-def parameterized_text_placeholder(custom_key: str, parameters: ParameterList) -> Callable[
+def parameterized_text_placeholder(custom_key: str, parameters: ParameterList, data_models: tuple = ()) -> Callable[
     [Callable[[Parameter], str]], Type[ParameterizedPlaceholder]]:
     def decorator(value_func: Callable[[Parameter], str]) -> Type[ParameterizedPlaceholder]:
         if "{parameter}" not in custom_key:
@@ -100,6 +102,7 @@ def parameterized_text_placeholder(custom_key: str, parameters: ParameterList) -
                 return value_func(parameter)
 
 
+        ParameterizedTextPlaceholder.data_models = data_models
         return ParameterizedTextPlaceholder
 
     return decorator
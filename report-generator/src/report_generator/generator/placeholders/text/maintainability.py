@@ -21,13 +21,13 @@ from report_generator.generator.formatters.formatters import calculate_stars, fo
 from .base import parameterized_text_placeholder, text_placeholder
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def period_start_date():
     """The reporting period's start date in yyyy-mm-dd format."""
     return maintainability_data.period[0]
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def period_end_date():
     """The reporting period's end date in yyyy-mm-dd format."""
     return maintainability_data.period[1]
@@ -39,13 +39,13 @@ def report_date():
     return datetime.now().strftime("%B %d, %Y")
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def maint_rating():
     """The 0.5-5.5 star rating provided by SIG's Maintainability Model."""
     return maintainability_round(maintainability_data.maintainability_rating)
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def maint_diff():
     """The maintainability rating diff within the reporting period."""
     old_rating = maintainability_data.start_snapshot["maintainability"]
@@ -53,55 +53,55 @@ def maint_diff():
     return format_diff(old_rating, new_rating)
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def maint_stars():
     """Stars corresponding to the system's Maintainability Rating."""
     return calculate_stars(maintainability_data.maintainability_rating)
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def maint_relative():
     """Remark of the system's Maintainability Rating relative to the benchmark."""
     return smart_remarks.relative_to_market_average(maintainability_data.maintainability_rating)
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def maint_indication():
     """Indicates whether the maintainability rating is above, below or at market average."""
     return smart_remarks.relative_cost(maintainability_data.maintainability_rating)
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def maint_observation():
     """Short description of the worst maintainability metric."""
     return smart_remarks.maint_observation(maintainability_data.data)
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def maint_multiple_observations():
     """Smart Remarks for all maintainability metrics that are either <= 2 stars or >= 4 stars."""
     return smart_remarks.maint_observations(maintainability_data.data)
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def maint_date_day():
     """The day of the month the latest system snapshot which was analyzed."""
     return maintainability_data.date.strftime("%d")
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def maint_date_month():
     """The month of the latest system snapshot which was analyzed."""
     return maintainability_data.date.strftime("%b").upper()
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def maint_date_year():
     """The year of the latest system snapshot which was analyzed."""
     return maintainability_data.date.strftime("%Y")
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def maint_size():
     """Description of the system volume."""
     volume_rating = maintainability_data.data["volume"]
@@ -117,13 +117,13 @@ def maint_size():
         return "very small"
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def test_code_ratio():
     """The test/code ratio of the system. Measured as a ratio of total production code against total test code. No decimals."""
     return format(maintainability_data.data["testCodeRatio"], ".0%")
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def test_code_relative():
     """Remark on the system's test/code ratio relative to the industry."""
     if "testCodeRatio" in maintainability_data.data:
@@ -131,7 +131,7 @@ def test_code_relative():
     return ""
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def test_code_summary():
     """Remark on the quality of testing in the system indicated by the total test/code ratio observed."""
     if "testCodeRatio" in maintainability_data.data:
@@ -139,50 +139,50 @@ def test_code_summary():
     return ""
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def system_pm():
     """The volume of the system in person months. 1 decimal."""
     return maintainability_data.system_pm
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def system_py():
     """The volume of the system in person years. 1 decimal."""
     return maintainability_data.system_py
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def system_loc():
     """The volume of the system in lines of code."""
     return maintainability_data.system_loc
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def system_loc_format_locale():
     """The volume of the system in lines of code, formatted with thousands separator corresponding with your system locale settings."""
     return f"{maintainability_data.system_loc:n}" if maintainability_data.system_loc is not None else ""
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def system_loc_format_comma():
     """The volume of the system in lines of code, formatted with commas as thousands separator."""
     return f"{maintainability_data.system_loc:,}" if maintainability_data.system_loc is not None else ""
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def system_loc_format_dot():
     """The volume of the system in lines of code, formatted with dots as thousands separator."""
     return f"{maintainability_data.system_loc:,}".replace(",",
                                                           ".") if maintainability_data.system_loc is not None else ""
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def volume_relative():
     """Relative volume remark for the system."""
     return smart_remarks.relative_volume(maintainability_data.data["volume"])
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def tech_common_summary():
     """Remark on how common the technologies used in the system are relative to the industry."""
     return smart_remarks.technology_summary(maintainability_data.tech_target_ratio,
@@ -190,14 +190,14 @@ def tech_common_summary():
                                             maintainability_data.tech_phaseout_technologies)
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def tech_variance():
     """Remark on how many significant technologies the system contains (threshold: 15% or more)."""
     return smart_remarks.tech_variance_remark(maintainability_data.sorted_tech,
                                               maintainability_data.tech_total_volume_pm)
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def tech_summary():
     """Remark on how common the technologies used in the system are relative to the industry."""
     return smart_remarks.technology_summary(maintainability_data.tech_target_ratio,
@@ -205,59 +205,68 @@ def tech_summary():
                                             maintainability_data.tech_phaseout_technologies)
 
 
-@parameterized_text_placeholder(custom_key="TECH_{parameter}_NAME", parameters=range(1, 6))
+@parameterized_text_placeholder(custom_key="TECH_{parameter}_NAME", parameters=range(1, 6),
+                                data_models=(maintainability_data,))
 def tech_name(idx: int):
     """Name of the technology in the system (if present)."""
     return maintainability_data.sorted_tech_get_key(idx - 1, 'displayName')
 
 
-@parameterized_text_placeholder(custom_key="TECH_{parameter}_PY", parameters=range(1, 6))
+@parameterized_text_placeholder(custom_key="TECH_{parameter}_PY", parameters=range(1, 6),
+                                data_models=(maintainability_data,))
 def tech_person_years(idx: int):
     """Volume of the technology in the system (if present) in person years. 1 decimal."""
     volume = maintainability_data.sorted_tech_get_key(idx - 1, 'volumeInPersonMonths', None)
     return round(volume / 12, 1) if volume else ""
 
 
-@parameterized_text_placeholder(custom_key="TECH_{parameter}_PM", parameters=range(1, 6))
+@parameterized_text_placeholder(custom_key="TECH_{parameter}_PM", parameters=range(1, 6),
+                                data_models=(maintainability_data,))
 def tech_person_months(idx: int):
     """Volume of the technology in the system (if present) in person months. 1 decimal."""
     volume = maintainability_data.sorted_tech_get_key(idx - 1, 'volumeInPersonMonths', None)
     return round(volume, 1) if volume else ""
 
 
-@parameterized_text_placeholder(custom_key="TECH_{parameter}_LOC", parameters=range(1, 6))
+@parameterized_text_placeholder(custom_key="TECH_{parameter}_LOC", parameters=range(1, 6),
+                                data_models=(maintainability_data,))
 def tech_lines_of_code(idx: int):
     """Volume of the technology in the system (if present) in lines of code. 1 decimal."""
     return maintainability_data.sorted_tech_get_key(idx - 1, 'volumeInLoc')
 
 
-@parameterized_text_placeholder(custom_key="TECH_{parameter}_MAINT_RATING", parameters=range(1, 6))
+@parameterized_text_placeholder(custom_key="TECH_{parameter}_MAINT_RATING", parameters=range(1, 6),
+                                data_models=(maintainability_data,))
 def tech_maintainability_rating(idx: int):
     """Maintainability rating of the technology in the system (if present). One decimal."""
     rating = maintainability_data.sorted_tech_get_key(idx - 1, 'maintainability')
     return round(rating, 1) if rating else ""
 
 
-@parameterized_text_placeholder(custom_key="TECH_{parameter}_TEST_RATIO", parameters=range(1, 6))
+@parameterized_text_placeholder(custom_key="TECH_{parameter}_TEST_RATIO", parameters=range(1, 6),
+                                data_models=(maintainability_data,))
 def tech_test_ratio(idx: int):
     """Test code ratio of the technology in the system (if present)."""
     return maintainability_data.sorted_tech_get_key(idx - 1, 'testCodeRatio')
 
 
-@parameterized_text_placeholder(custom_key="TECH_{parameter}_TECH_RISK", parameters=range(1, 6))
+@parameterized_text_placeholder(custom_key="TECH_{parameter}_TECH_RISK", parameters=range(1, 6),
+                                data_models=(maintainability_data,))
 def tech_risk(idx: int):
     """Technology risk rating of the technology in the system (if present)."""
     return maintainability_data.sorted_tech_get_key(idx - 1, 'technologyRisk')
 
 
-@parameterized_text_placeholder(custom_key="MAINT_RATING_{parameter}", parameters=list(MaintMetric))
+@parameterized_text_placeholder(custom_key="MAINT_RATING_{parameter}", parameters=list(MaintMetric),
+                                data_models=(maintainability_data,))
 def maint_rating_param(metric: MaintMetric):
     """The 0.5-5.5 star rating for this metric."""
     metric_key = metric.to_json_name()
     return maintainability_round(maintainability_data.data[metric_key])
 
 
-@parameterized_text_placeholder(custom_key="MAINT_DIFF_{parameter}", parameters=list(MaintMetric))
+@parameterized_text_placeholder(custom_key="MAINT_DIFF_{parameter}", parameters=list(MaintMetric),
+                                data_models=(maintainability_data,))
 def maint_rating_diff_param(metric: MaintMetric):
     """The rating difference for the specified metric within the reporting period."""
     old_rating = maintainability_data.start_snapshot[metric.to_json_name()]
@@ -265,32 +274,33 @@ def maint_rating_diff_param(metric: MaintMetric):
     return format_diff(old_rating, new_rating)
 
 
-@parameterized_text_placeholder(custom_key="STARS_{parameter}", parameters=list(MaintMetric))
+@parameterized_text_placeholder(custom_key="STARS_{parameter}", parameters=list(MaintMetric),
+                                data_models=(maintainability_data,))
 def maint_stars_param(metric: MaintMetric):
     """Stars corresponding to this metric rating."""
     metric_key = metric.to_json_name()
     return calculate_stars(maintainability_data.data[metric_key])
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def maintenance_fte():
     """Estimated maintenance FTE (Full-Time Equivalent) for the system."""
     return f"{maintainability_data.system_py * 0.15:.1f}"
 
 
-@text_placeholder()
+@text_placeholder(data_models=(modernization_data,))
 def technical_debt_py():
     """Technical debt of the system in person years."""
     return f"{modernization_data.single_system_candidate.technical_debt_in_py:.1f}"
 
 
-@text_placeholder()
+@text_placeholder(data_models=(modernization_data,))
 def renovation_effort_py():
     """Estimated renovation effort in person years."""
     return f"{modernization_data.single_system_candidate.estimated_effort_py:.1f}"
 
 
-@text_placeholder()
+@text_placeholder(data_models=(modernization_data,))
 def technical_debt_percentage():
     """Technical debt as a percentage of total system volume."""
     volume_in_py = modernization_data.single_system_candidate.volume_in_py
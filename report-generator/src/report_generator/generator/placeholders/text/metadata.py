@@ -16,13 +16,13 @@ from report_generator.generator.data_models import *
 from .base import text_placeholder
 
 
-@text_placeholder()
+@text_placeholder(data_models=(system_metadata,))
 def system_name():
     """The name of the system as defined in Sigrid Metadata, capitalized."""
     return system_metadata.display_name
 
 
-@text_placeholder()
+@text_placeholder(data_models=(maintainability_data,))
 def customer_name():
     """The name of the customer as defined in Sigrid, capitalized."""
     return maintainability_data.customer_name
@@ -16,13 +16,13 @@ from report_generator.generator.data_models import *
 from .base import text_placeholder
 
 
-@text_placeholder()
+@text_placeholder(data_models=(objectives_data,))
 def objectives_period_start():
     """The start date of the period on which objectives are being reported."""
     return objectives_data.comparison_period.start.strftime("%B %Y")
 
 
-@text_placeholder()
+@text_placeholder(data_models=(objectives_data,))
 def objectives_period_end():
     """The end date of the period on which objectives are being reported."""
     return objectives_data.comparison_period.end.strftime("%B %Y")
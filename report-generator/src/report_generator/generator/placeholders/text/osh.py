@@ -19,74 +19,74 @@ from report_generator.generator.formatters.formatters import calculate_stars, ma
 from .base import parameterized_text_placeholder, text_placeholder
 
 
-@text_placeholder()
+@text_placeholder(data_models=(osh_data,))
 def osh_risk_summary():
     """One-sentence summary of main OSH findings."""
     return smart_remarks.osh_remark(osh_data.raw_data)
 
 
-@text_placeholder()
+@text_placeholder(data_models=(osh_data,))
 def osh_total_deps():
     """Total number of identified open-source dependencies."""
     return osh_data.data.total_deps
 
 
-@text_placeholder()
+@text_placeholder(data_models=(osh_data,))
 def osh_total_vuln():
     """Number of identified open-source dependencies with a known vulnerability."""
     return osh_data.data.total_vulnerable
 
 
-@text_placeholder()
+@text_placeholder(data_models=(osh_data,))
 def osh_date_day():
     """The day of the month the latest system snapshot which was analyzed."""
     return osh_data.data.date_day
 
 
-@text_placeholder()
+@text_placeholder(data_models=(osh_data,))
 def osh_date_month():
     """The month of the latest system snapshot which was analyzed."""
     return osh_data.data.date_month
 
 
-@text_placeholder()
+@text_placeholder(data_models=(osh_data,))
 def osh_date_year():
     """The year of the latest system snapshot which was analyzed."""
     return osh_data.data.date_year
 
 
-@text_placeholder()
+@text_placeholder(data_models=(osh_data,))
 def osh_vuln_summary():
     """Descriptive summary of open-source vulnerability issues identified."""
     return osh_data.vulnerability_summary
 
 
-@text_placeholder()
+@text_placeholder(data_models=(osh_data,))
 def osh_freshness_summary():
     """Descriptive summary of open-source freshness issues identified."""
     return osh_data.freshness_summary
 
 
-@text_placeholder()
+@text_placeholder(data_models=(osh_data,))
 def osh_legal_summary():
     """Descriptive summary of open-source legal issues identified."""
     return osh_data.legal_summary
 
 
-@text_placeholder()
+@text_placeholder(data_models=(osh_data,))
 def osh_management_summary():
     """Descriptive summary of open-source management issues identified."""
     return osh_data.management_summary
 
 
-@text_placeholder()
+@text_placeholder(data_models=(osh_data,))
 def osh_relative():
     """Relative rating remark for open-source health."""
     return smart_remarks.osh_relative_rating(osh_data.data.ratings["system"])
 
 
 @parameterized_text_placeholder(custom_key="OSH_RATING_{parameter}",
-                                parameters=list(OSHMetric))
+                                parameters=list(OSHMetric), data_models=(osh_data,))
 def osh_rating_param(metric: OSHMetric):
     """The 0.5-5.5 star rating for this OSH metric."""
     metric_key = metric.to_json_name()
@@ -94,7 +94,7 @@ def osh_rating_param(metric: OSHMetric):
 
 
 @parameterized_text_placeholder(custom_key="STARS_{parameter}",
-                                parameters=list(OSHMetric))
+                                parameters=list(OSHMetric), data_models=(osh_data,))
 def osh_stars_param(metric: OSHMetric):
     """Stars corresponding to this OSH metric rating."""
     metric_key = metric.to_json_name()
@@ -0,0 +1,106 @@
+#  Copyright Software Improvement Group
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Type
+
+from report_generator.generator import data_models, profiling, report_utils
+from report_generator.generator.placeholders import Placeholder, PlaceholderCollection
+from report_generator.generator.placeholders.base import Parameter, PlaceholderValues
+from report_generator.generator.report import Report, ReportType
+from report_generator.generator.sigrid_api import SigridAPIRequestFailed
+
+MAX_CONCURRENT_REQUESTS = 8
+
+# The properties that load the data for each data model, everything else is derived from these.
+_DATA_MODEL_SOURCES = {
+    data_models.architecture_data: ("data",),
+    data_models.maintainability_data: ("data",),
+    data_models.modernization_data: ("modernization_candidates",),
+    data_models.objectives_data: ("objectives_evaluation_trend", "objectives_evaluation_status", "teams"),
+    data_models.osh_data: ("raw_data",),
+    data_models.system_metadata: ("data",),
+}
+
+
+def collect_tokens(report: Report) -> set[str]:
+    if report.type == ReportType.PRESENTATION:
+        return report_utils.pptx.collect_tokens(report.content)
+    else:
+        return report_utils.docx.collect_tokens(report.content)
+
+
+def scan_template(report: Report) -> set[str]:
+    """Returns all words and table names in the template, from which the placeholders it uses are determined."""
+    with profiling.span("template scan", "step"):
+        return collect_tokens(report)
+
+
+def find_used_placeholders(report: Report, placeholders: PlaceholderCollection,
+                           tokens: set[str]) -> PlaceholderCollection:
+    """Returns the placeholders that appear in the template, given the tokens returned by scan_template."""
+    used = {placeholder for placeholder in placeholders
+            if placeholder.supports(report.type) and placeholder.is_used(tokens)}
+    logging.debug(f"Template uses {len(used)} of {len(placeholders)} placeholders")
+    return used
+
+
+def compute_values(placeholders: PlaceholderCollection, tokens: set[str]) -> PlaceholderValues:
+    """
+    Computes the values of all placeholder keys that appear in the template concurrently, so that the Sigrid API
+    requests they need overlap. The values can then be used to resolve the placeholders one after another.
+    Placeholders that don't use their value when they are resolved are skipped.
+    """
+    values = PlaceholderValues()
+
+    with profiling.span("compute values", "step"), ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        for placeholder in placeholders:
+            if not placeholder.uses_value:
+                continue
+            for key, parameter in placeholder.used_key_parameters(tokens):
+                values.add(placeholder, key, executor.submit(_compute_value, placeholder, key, parameter))
+
+    return values
+
+
+def _compute_value(placeholder: Type[Placeholder], key: str, parameter: Parameter):
+    with profiling.span(placeholder.key, "value"):
+        profiling.annotate(key=key)
+        return placeholder.value(parameter)
+
+
+def prefetch_data(placeholders: PlaceholderCollection) -> None:
+    """Loads the data for all data models used by the placeholders concurrently, instead of one after another."""
+    prefetch_models(set().union(*(placeholder.data_models for placeholder in placeholders)))
+
+
+def prefetch_models(models: Iterable) -> None:
+    """Loads the data for the given data models concurrently. Failures are left to the placeholders that use them."""
+    sources = [(model, name) for model in models for name in _DATA_MODEL_SOURCES.get(model, ())]
+
+    if len(sources) == 0:
+        return
+
+    with profiling.span("prefetch data", "step"), ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        for _ in executor.map(lambda source: _prefetch(*source), sources):
+            pass
+
+
+def _prefetch(model, name: str) -> None:
+    try:
+        getattr(model, name)
+    except (SigridAPIRequestFailed, KeyError, AttributeError, ValueError, TypeError) as e:
+        # Not fatal, the placeholder will report the problem when it is resolved.
+        logging.debug(f"Failed to prefetch {type(model).__name__}.{name}: {e}")
@@ -0,0 +1,189 @@
+#  Copyright Software Improvement Group
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+SUMMARY_TOP_PLACEHOLDERS = 15
+
+
+@dataclass
+class Span:
+    name: str
+    category: str
+    start: float
+    thread_id: int
+    duration: float = 0.0
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+class Profiler:
+    """
+    Records how long the steps of report generation take, as nested spans per thread, plus counters for events such
+    as cache hits. The spans can be written as a Chrome trace, which can be opened in chrome://tracing, Perfetto or
+    speedscope to show a flame graph.
+    """
+
+    def __init__(self):
+        self.spans: list[Span] = []
+        self.counters: dict[str, int] = defaultdict(int)
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def span(self, name: str, category: str) -> Iterator[Span]:
+        span = Span(name, category, time.perf_counter(), threading.get_ident())
+        stack = self._stack()
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            span.duration = time.perf_counter() - span.start
+            stack.pop()
+            with self._lock:
+                self.spans.append(span)
+
+    def annotate(self, **args) -> None:
+        """Adds information to the innermost span of the current thread."""
+        stack = self._stack()
+        if stack:
+            stack[-1].args.update(args)
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += n
+
+    def _stack(self) -> list[Span]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def trace(self) -> dict:
+        events = [{
+            "name": span.name,
+            "cat" : span.category,
+            "ph"  : "X",
+            "ts"  : round((span.start - self._start) * 1_000_000),
+            "dur" : round(span.duration * 1_000_000),
+            "pid" : os.getpid(),
+            "tid" : span.thread_id,
+            "args": span.args,
+        } for span in sorted(self.spans, key=lambda s: s.start)]
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": dict(self.counters)}
+
+    def write_trace(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.trace(), f)
+
+    def summary(self) -> str:
+        lines = []
+
+        step_spans = self._spans_in("step")
+        if step_spans:
+            lines += ["", _table(["Step", "Time (s)"], [[span.name, f"{span.duration:.3f}"] for span in step_spans])]
+
+        api_rows = []
+        for name, spans in sorted(self._group("api").items(), key=lambda item: -_total(item[1])):
+            requested = [span for span in spans if "bytes" in span.args]
+            api_rows.append([name, str(len(spans)), str(len(requested)), f"{_total(spans):.3f}",
+                             f"{_total(requested) / len(requested):.3f}" if requested else "-",
+                             _format_bytes(sum(span.args["bytes"] for span in requested))])
+        if api_rows:
+            lines += ["", _table(["Endpoint", "Calls", "Requests", "Total (s)", "Avg request (s)", "Bytes"], api_rows)]
+
+        # Values are computed concurrently before the placeholders are resolved, both count towards a placeholder.
+        value_groups = self._group("value")
+        resolve_groups = self._group("placeholder")
+        placeholder_rows = []
+        for name in value_groups.keys() | resolve_groups.keys():
+            value_spans, resolve_spans = value_groups.get(name, []), resolve_groups.get(name, [])
+            value_time, resolve_time = _total(value_spans), _total(resolve_spans)
+            placeholder_rows.append([name, str(len(value_spans)), f"{value_time:.3f}", str(len(resolve_spans)),
+                                     f"{resolve_time:.3f}", f"{value_time + resolve_time:.3f}"])
+        placeholder_rows.sort(key=lambda row: -float(row[-1]))
+        if placeholder_rows:
+            lines += ["", _table(["Placeholder", "Values", "Value (s)", "Resolved", "Resolve (s)", "Total (s)"],
+                                 placeholder_rows[:SUMMARY_TOP_PLACEHOLDERS])]
+            if len(placeholder_rows) > SUMMARY_TOP_PLACEHOLDERS:
+                lines.append(f"... and {len(placeholder_rows) - SUMMARY_TOP_PLACEHOLDERS} more placeholders")
+
+        if self.counters:
+            lines += ["", _table(["Counter", "Count"], [[name, str(n)] for name, n in sorted(self.counters.items())])]
+
+        return "\n".join(lines).strip("\n")
+
+    def _spans_in(self, category: str) -> list[Span]:
+        return sorted((span for span in self.spans if span.category == category), key=lambda s: s.start)
+
+    def _group(self, category: str) -> dict[str, list[Span]]:
+        groups = defaultdict(list)
+        for span in self._spans_in(category):
+            groups[span.name].append(span)
+        return groups
+
+
+def _total(spans: list[Span]) -> float:
+    return sum(span.duration for span in spans)
+
+
+def _format_bytes(size: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _table(header: list[str], rows: list[list[str]]) -> str:
+    widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+    lines = [header, ["-" * width for width in widths]] + rows
+    return "\n".join("  ".join(cell.ljust(width) if i == 0 else cell.rjust(width)
+                               for i, (cell, width) in enumerate(zip(line, widths))) for line in lines)
+
+
+_profiler: Optional[Profiler] = None
+
+
+def start() -> Profiler:
+    global _profiler
+    _profiler = Profiler()
+    return _profiler
+
+
+def stop() -> Optional[Profiler]:
+    global _profiler
+    profiler, _profiler = _profiler, None
+    return profiler
+
+
+def span(name: str, category: str):
+    """Measures the duration of a block of code, when profiling is enabled."""
+    return _profiler.span(name, category) if _profiler else nullcontext()
+
+
+def annotate(**args) -> None:
+    if _profiler:
+        _profiler.annotate(**args)
+
+
+def count(name: str, n: int = 1) -> None:
+    if _profiler:
+        _profiler.count(name, n)
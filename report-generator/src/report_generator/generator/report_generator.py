@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from report_generator.generator import planner, profiling
 from report_generator.generator.placeholders import PlaceholderCollection, placeholders as default_placeholders
 from report_generator.generator.report import Report
 
@@ -19,13 +20,23 @@ from report_generator.generator.report import Report
 class ReportGenerator:
     def __init__(self, template_path: str):
         self.placeholders: PlaceholderCollection = default_placeholders
-        self.report: Report = Report.from_template(template_path)
+        with profiling.span("load template", "step"):
+            self.report: Report = Report.from_template(template_path)
 
     def register_additional_placeholders(self, placeholders: PlaceholderCollection) -> None:
         self.placeholders.update(placeholders)
 
     def generate(self, output_path: str) -> None:
-        for placeholder in self.placeholders:
-            placeholder.resolve(self.report)
+        tokens = planner.scan_template(self.report)
+        placeholders = planner.find_used_placeholders(self.report, self.placeholders, tokens)
+        planner.prefetch_data(placeholders)
 
-        self.report.save(output_path)
+        # Values are computed concurrently, but python-pptx and python-docx are not thread-safe, so the document
+        # is updated one placeholder at a time.
+        values = planner.compute_values(placeholders, tokens)
+        for placeholder in placeholders:
+            with profiling.span(placeholder.key, "placeholder"):
+                placeholder.resolve(self.report, values)
+
+        with profiling.span("save report", "step"):
+            self.report.save(output_path)
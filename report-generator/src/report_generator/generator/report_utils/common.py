@@ -11,9 +11,8 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Optional, Union
-from xmlrpc.client import Boolean
 
 from docx.enum.dml import MSO_THEME_COLOR as MSO_THEME_COLOR_DOCX
 from docx.shared import RGBColor as DocxRGBColor
@@ -31,14 +30,14 @@ MSO_THEME_COLOR_COMMON = Union[MSO_THEME_COLOR_PPTX, MSO_THEME_COLOR_DOCX]
 CommonRGBColor = Union[PptxRGBColor, DocxRGBColor]
 
 
-@dataclass
+@dataclass(frozen=True)
 class FontColor:
     rgb: Optional[CommonRGBColor] = None
     theme_color: Optional[MSO_THEME_COLOR_COMMON] = None
     brightness: Optional[float] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class FontProperties:
     bold: Optional[bool] = None
     italic: Optional[bool] = None
@@ -55,19 +54,20 @@ def merge_runs_with_same_formatting(paragraph: CommonParagraph):
     This can split placeholders across multiple runs (e.g., "AAP_", "NOOT", "_MIES").
     This function combines such runs to enable effective replacement.
     """
-    run_idx = 0
-    while run_idx < len(paragraph.runs) - 1:
-        current_run = paragraph.runs[run_idx]
-        next_run = paragraph.runs[run_idx + 1]
-
-        if has_same_formatting(current_run, next_run):
-            combine_runs(current_run, next_run)
+    groups = []
+    for run in paragraph.runs:
+        font_properties = get_font_properties(run)
+        if groups and groups[-1][0] == font_properties:
+            groups[-1][1].append(run)
         else:
-            run_idx += 1
-
+            groups.append((font_properties, [run]))
 
-def has_same_formatting(run_a: CommonRun, run_b: CommonRun) -> Boolean:
-    return get_font_properties(run_a) == get_font_properties(run_b)
+    for _, group in groups:
+        if len(group) > 1:
+            group[0].text = "".join(run.text for run in group)
+            for run in group[1:]:
+                # noinspection PyProtectedMember
+                run._r.getparent().remove(run._r)
 
 
 def get_font_properties(run: CommonRun) -> Optional[FontProperties]:
@@ -90,16 +90,14 @@ def get_font_properties(run: CommonRun) -> Optional[FontProperties]:
 
     color = font.color
 
-    props.color = FontColor(
+    return replace(props, color=FontColor(
         rgb=color.rgb if hasattr(color, 'rgb') else None,
         theme_color=(color.theme_color if hasattr(color, 'theme_color')
                                           and color.theme_color is not MSO_THEME_COLOR_PPTX.NOT_THEME_COLOR
                                           and color.theme_color is not MSO_THEME_COLOR_DOCX.NOT_THEME_COLOR
                      else None),
         brightness=color.brightness if hasattr(color, 'brightness') else None
-    )
-
-    return props
+    ))
 
 
 def apply_font_properties(run: CommonRun, font_props: FontProperties):
@@ -120,11 +118,3 @@ def apply_font_properties(run: CommonRun, font_props: FontProperties):
         font.color.theme_color = font_props.color.theme_color
     if font_props.color.brightness is not None and run.font.color.type is not None:
         font.color.brightness = font_props.color.brightness
-
-
-def combine_runs(base: CommonRun, suffix: CommonRun):
-    base.text = base.text + suffix.text
-    # noinspection PyProtectedMember
-    r_to_remove = suffix._r
-    r_to_remove.getparent().remove(r_to_remove)
-    return
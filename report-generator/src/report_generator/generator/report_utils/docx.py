@@ -14,25 +14,109 @@
 
 import logging
 import re
-from typing import Union
+from functools import lru_cache
+from typing import Iterator, Union
 
+from docx.document import Document
+from docx.text.paragraph import Paragraph
+
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+class DocumentIndex:
+    """
+    Index from words to the paragraphs containing them, built in a single pass over the body, tables (including
+    nested tables), headers and footers of the document. Placeholders are only found if they are within a single
+    run. Like update_paragraph, a lookup returns a paragraph once for every run that contains the search text.
+    Paragraphs found in the index are checked against their current text, text added later is not indexed.
+    """
+
+    def __init__(self, document: Document):
+        self._paragraphs = []
+        self._paragraphs_by_token = {}
+
+        for paragraph in _searchable_paragraphs(document):
+            self._add_paragraph(paragraph)
+
+    def _add_paragraph(self, paragraph: Paragraph) -> None:
+        index = len(self._paragraphs)
+        self._paragraphs.append(paragraph)
 
-def find_text_in_document(document, search_text):
-    paragraphs = []
-    for paragraph in document.paragraphs:
         for run in paragraph.runs:
-            if re.match(rf".*\b{search_text}\b.*", run.text):
-                paragraphs.append(paragraph)
+            for token in WORD_PATTERN.findall(run.text):
+                paragraphs = self._paragraphs_by_token.setdefault(token, [])
+                if not paragraphs or paragraphs[-1] != index:
+                    paragraphs.append(index)
+
+    def tokens(self) -> set[str]:
+        return set(self._paragraphs_by_token)
+
+    def find(self, search_text: str) -> list[Paragraph]:
+        if WORD_PATTERN.fullmatch(search_text):
+            candidates = self._paragraphs_by_token.get(search_text, [])
+        else:
+            candidates = range(len(self._paragraphs))
+
+        pattern = _search_pattern(search_text)
+        return [self._paragraphs[index]
+                for index in candidates
+                for run in self._paragraphs[index].runs
+                if pattern.match(run.text)]
+
 
-    for table in document.tables:
+def document_index(document) -> DocumentIndex:
+    """
+    Returns the index for the document, which is built the first time it is needed. The index is kept on the
+    document part, so it is discarded together with the document.
+    """
+    part = document.part
+    index = getattr(part, "_placeholder_index", None)
+    if index is None:
+        index = part._placeholder_index = DocumentIndex(document)
+    return index
+
+
+@lru_cache(maxsize=None)
+def _search_pattern(search_text: str) -> re.Pattern:
+    return re.compile(rf".*\b{search_text}\b.*")
+
+
+def _searchable_paragraphs(document: Document) -> Iterator[Paragraph]:
+    yield from _paragraphs_in_container(document)
+
+    parts = set()
+    for section in document.sections:
+        for header_footer in (section.header, section.first_page_header, section.even_page_header,
+                              section.footer, section.first_page_footer, section.even_page_footer):
+            # Linked headers and footers have no content of their own, accessing it would create an empty one.
+            if header_footer.is_linked_to_previous or header_footer.part in parts:
+                continue
+            parts.add(header_footer.part)
+            yield from _paragraphs_in_container(header_footer)
+
+
+def _paragraphs_in_container(container) -> Iterator[Paragraph]:
+    yield from container.paragraphs
+
+    for table in container.tables:
+        cells = set()
         for row in table.rows:
             for cell in row.cells:
-                for paragraph in cell.paragraphs:
-                    for run in paragraph.runs:
-                        if re.match(rf".*\b{search_text}\b.*", run.text):
-                            paragraphs.append(paragraph)
+                # Merged cells are returned once for every row and column they span.
+                # noinspection PyProtectedMember
+                if cell._tc in cells:
+                    continue
+                cells.add(cell._tc)
+                yield from _paragraphs_in_container(cell)
+
 
-    return paragraphs
+def collect_tokens(document) -> set[str]:
+    return document_index(document).tokens()
+
+
+def find_text_in_document(document, search_text):
+    return document_index(document).find(search_text)
 
 
 def update_many_paragraphs(paragraphs, placeholder_id, replacement_text):
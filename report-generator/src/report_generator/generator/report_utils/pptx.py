@@ -14,12 +14,14 @@
 
 import logging
 import re
-from typing import Iterable, Union
+from functools import lru_cache
+from typing import Iterable, Iterator, Union
 
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE_TYPE
 from pptx.oxml.xmlchemy import OxmlElement
 from pptx.presentation import Presentation
+from pptx.slide import Slide
 # noinspection PyProtectedMember
 from pptx.table import Table, _Row
 # noinspection PyProtectedMember
@@ -34,6 +36,8 @@ THREE_STAR_COLOR = RGBColor(0xf8, 0xc6, 0x40)
 FOUR_STAR_COLOR = RGBColor(0x57, 0xc9, 0x68)
 FIVE_STAR_COLOR = RGBColor(0x2c, 0x96, 0x3f)
 
+WORD_PATTERN = re.compile(r"\w+")
+
 
 def print_slide_ids(slide):
     # Print slide IDs and names for debugging purposes
@@ -68,70 +72,109 @@ def update_paragraph(paragraph: _Paragraph, placeholder_id, replacement_text, fo
         apply_font_properties(run_with_placeholder, font)
 
 
-def find_shapes_with_text(presentation, search_text):
-    shapes = []
-    for slide in presentation.slides:
-        paragraphs = find_text_in_slide(slide, search_text)
-        # A paragraph is typically in a TextGroup which is in a Shape, so we call getparent() twice
-        # noinspection PyProtectedMember
-        shapes += [paragraph._parent._parent for paragraph in paragraphs]
-    return shapes
-
+class PresentationIndex:
+    """
+    Index from words to the paragraphs containing them, built in a single pass over the presentation. Like a full
+    search, a lookup returns at most one paragraph per top-level shape: the first one that matches. For tables, only
+    the first paragraph of each cell is searched. Since placeholders change the text of the presentation while it is
+    being resolved, every paragraph found in the index is checked against its current text. Text that placeholders
+    add to the presentation is not indexed. Runs with the same formatting are merged in the paragraphs that are found.
+    """
 
-def find_text_in_presentation(presentation, search_text):
-    paragraphs = []
-    for slide in presentation.slides:
-        paragraphs.extend(find_text_in_slide(slide, search_text))
+    def __init__(self, presentation: Presentation):
+        self._shapes = []
+        self._shapes_by_token = {}
+        self._tables_by_name = {}
+
+        for slide in presentation.slides:
+            for shape in slide.shapes:
+                self._add_shape(slide, shape)
+
+    def _add_shape(self, slide, shape) -> None:
+        index = len(self._shapes)
+        paragraphs = list(_searchable_paragraphs(shape))
+        self._shapes.append((slide, paragraphs))
+
+        for paragraph in paragraphs:
+            for token in WORD_PATTERN.findall(paragraph.text):
+                shapes = self._shapes_by_token.setdefault(token, [])
+                if not shapes or shapes[-1] != index:
+                    shapes.append(index)
+
+        if shape.has_table:
+            self._tables_by_name.setdefault(shape.name, []).append(shape.table)
+
+    def tokens(self) -> set[str]:
+        """All words in the presentation, plus the names of tables, which table placeholders use as key."""
+        return set(self._shapes_by_token) | set(self._tables_by_name)
+
+    def find(self, search_text: str) -> list[tuple[Slide, _Paragraph]]:
+        """Returns the slides and paragraphs containing the search text."""
+        if WORD_PATTERN.fullmatch(search_text):
+            candidates = self._shapes_by_token.get(search_text, [])
+        else:
+            candidates = range(len(self._shapes))
+
+        pattern = _search_pattern(search_text)
+        results = []
+        for index in candidates:
+            slide, paragraphs = self._shapes[index]
+            paragraph = next((p for p in paragraphs if pattern.match(p.text)), None)
+            if paragraph is not None:
+                merge_runs_with_same_formatting(paragraph)
+                results.append((slide, paragraph))
+        return results
+
+    def find_tables(self, name: str) -> list[Table]:
+        return self._tables_by_name.get(name, [])
+
+
+def presentation_index(presentation) -> PresentationIndex:
+    """
+    Returns the index for the presentation, which is built the first time it is needed. The index is kept on the
+    presentation part, so it is discarded together with the presentation.
+    """
+    part = presentation.part
+    index = getattr(part, "_placeholder_index", None)
+    if index is None:
+        index = part._placeholder_index = PresentationIndex(presentation)
+    return index
 
-    return paragraphs
 
+@lru_cache(maxsize=None)
+def _search_pattern(search_text: str) -> re.Pattern:
+    return re.compile(fr".*\b{search_text}\b.*")
 
-def find_text_in_slide(slide, search_text):
-    paragraphs = []
-    for shape in slide.shapes:
-        result = find_text_in_shape(shape, search_text)
-        if result:
-            paragraphs.append(result)
-    return paragraphs
 
-
-def find_text_in_table(shape, search_text):
-    if shape.has_table:
-        for cell in shape.table.iter_cells():
-            if re.match(fr".*\b{search_text}\b.*", cell.text):
-                return cell.text_frame.paragraphs[0]
-    return None
+def _searchable_paragraphs(shape) -> Iterator[_Paragraph]:
+    if "GraphicFrame" in type(shape).__name__:
+        if shape.has_table:
+            for cell in shape.table.iter_cells():
+                yield cell.text_frame.paragraphs[0]
+    elif shape.has_text_frame:
+        yield from shape.text_frame.paragraphs
+    elif shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+        for s in shape.shapes:
+            yield from _searchable_paragraphs(s)
 
 
-def find_text_in_text_frame(shape, search_text):
-    if shape.has_text_frame:
-        for paragraph in shape.text_frame.paragraphs:
-            if re.match(fr".*\b{search_text}\b.*", paragraph.text):
-                return paragraph
-    return None
+def collect_tokens(presentation) -> set[str]:
+    return presentation_index(presentation).tokens()
 
 
-def find_text_in_group(shape, search_text):
-    if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
-        for s in shape.shapes:
-            result = find_text_in_shape(s, search_text)
-            if result:
-                return result
-    return None
+def find_shapes_with_text(presentation, search_text):
+    # A paragraph is typically in a TextGroup which is in a Shape, so we call getparent() twice
+    # noinspection PyProtectedMember
+    return [paragraph._parent._parent for paragraph in find_text_in_presentation(presentation, search_text)]
 
 
-def find_text_in_shape(shape, search_text):
-    if "GraphicFrame" in type(shape).__name__:
-        result = find_text_in_table(shape, search_text)
-        if result:
-            return result
-        return None
+def find_text_in_presentation(presentation, search_text):
+    return [paragraph for _, paragraph in presentation_index(presentation).find(search_text)]
 
-    result = find_text_in_text_frame(shape, search_text)
-    if result:
-        return result
 
-    return find_text_in_group(shape, search_text)
+def find_text_in_slide(slide, search_text):
+    presentation = slide.part.package.presentation_part.presentation
+    return [paragraph for s, paragraph in presentation_index(presentation).find(search_text) if s == slide]
 
 
 def add_content_paragraph(text_frame, markers, content, paragraph=None):
@@ -170,8 +213,8 @@ def set_shape_color(shape, rgb_color):
 
 def identify_specific_slide(presentation, marker):
     specific_slides = []
-    for slide in presentation.slides:
-        if find_text_in_slide(slide, marker):
+    for slide, _ in presentation_index(presentation).find(marker):
+        if slide not in specific_slides:
             specific_slides.append(slide)
     return specific_slides
 
@@ -214,12 +257,7 @@ def gather_charts(presentation: Presentation, key: str):
 
 
 def find_tables(presentation: Presentation, key: str):
-    return [
-        shape.table
-        for slide in presentation.slides
-        for shape in slide.shapes
-        if shape.has_table and shape.name == key
-    ]
+    return presentation_index(presentation).find_tables(key)
 
 
 def remove_row_from_table(table: Table, row: _Row):
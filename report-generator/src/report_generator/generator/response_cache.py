@@ -0,0 +1,230 @@
+#  Copyright Software Improvement Group
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional
+
+DATABASE_FILENAME = "sigrid-api-cache.sqlite"
+DEFAULT_MAX_SIZE_BYTES = 512 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 12 * 60 * 60
+DEFAULT_MEMORY_CACHE_SIZE_BYTES = 256 * 1024 * 1024
+BUSY_TIMEOUT_SECONDS = 30
+
+# Sigrid analysis results are updated nightly, but metadata can be edited by users at any time.
+ENDPOINT_TTL_SECONDS = {
+    "system-metadata": 60 * 60,
+}
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    @property
+    def content(self) -> bytes:
+        return zlib.decompress(self.body)
+
+    @property
+    def data(self) -> Any:
+        return json.loads(self.content)
+
+    def is_fresh(self, ttl_seconds: Optional[float]) -> bool:
+        return ttl_seconds is None or time.time() - self.stored_at < ttl_seconds
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Persistent cache for Sigrid API responses, stored in an SQLite database in the cache directory. Responses are
+    keyed by customer and URL and stored compressed. Expired responses are kept so they can be revalidated using a
+    conditional request. When the cache grows beyond max_size_bytes, the least recently used responses are evicted.
+    """
+
+    def __init__(self, directory: str, max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+                 ttl_seconds: Optional[dict[str, float]] = None, default_ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, DATABASE_FILENAME)
+        self.max_size_bytes = max_size_bytes
+        self.ttl_seconds = ENDPOINT_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.default_ttl_seconds = default_ttl_seconds
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False,
+                                           isolation_level=None)
+        # Batch workers share the database, WAL mode lets them read while another process is writing.
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                customer TEXT NOT NULL,
+                url TEXT NOT NULL,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL,
+                PRIMARY KEY (customer, url)
+            )""")
+
+    def ttl_for(self, url: str) -> float:
+        path = url.split("?")[0]
+        for endpoint, ttl in self.ttl_seconds.items():
+            if f"/{endpoint}/" in path:
+                return ttl
+        return self.default_ttl_seconds
+
+    def lookup(self, customer: str, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, etag, last_modified, stored_at FROM responses WHERE customer = ? AND url = ?",
+                (customer, url)).fetchone()
+            if row is None:
+                return None
+            try:
+                self._connection.execute("UPDATE responses SET accessed_at = ? WHERE customer = ? AND url = ?",
+                                         (time.time(), customer, url))
+            except sqlite3.OperationalError as e:
+                # The access time is only used for eviction, so the response can still be used.
+                logging.debug(f"Failed to update the access time of {url} in the response cache: {e}")
+        return CachedResponse(*row)
+
+    def store(self, customer: str, url: str, content: bytes, etag: Optional[str] = None,
+              last_modified: Optional[str] = None) -> None:
+        body = zlib.compress(content)
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (customer, url, body, etag, last_modified, now, now, len(body)))
+            self._evict()
+
+    def refresh(self, customer: str, url: str) -> None:
+        """Marks a response as fresh again, after the server confirmed that it did not change."""
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE customer = ? AND url = ?",
+                (now, now, customer, url))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def size(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self) -> None:
+        total_size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total_size <= self.max_size_bytes:
+            return
+
+        rows = self._connection.execute("SELECT customer, url, size FROM responses ORDER BY accessed_at").fetchall()
+        for customer, url, size in rows:
+            if total_size <= self.max_size_bytes:
+                break
+            self._connection.execute("DELETE FROM responses WHERE customer = ? AND url = ?", (customer, url))
+            total_size -= size
+            logging.debug(f"Evicted {url} from the response cache")
+
+
+@dataclass
+class MemoryCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_size_bytes: int
+
+
+class MemoryResponseCache:
+    """
+    In-process LRU cache for decoded Sigrid API responses. The size of an entry is the size of the JSON document it
+    was decoded from. When the total size exceeds max_size_bytes, the least recently used entries are evicted.
+    """
+
+    def __init__(self, max_size_bytes: int = DEFAULT_MEMORY_CACHE_SIZE_BYTES):
+        self.max_size_bytes = max_size_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, self._entries[key][0]
+
+    def put(self, key: Hashable, value: Any, size_bytes: int) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._size_bytes -= self._entries.pop(key)[1]
+
+            if size_bytes > self.max_size_bytes:
+                logging.debug(f"Not caching response of {size_bytes} bytes, it exceeds the memory cache size")
+                return
+
+            self._entries[key] = (value, size_bytes)
+            self._size_bytes += size_bytes
+            self._evict()
+
+    def resize(self, max_size_bytes: int) -> None:
+        with self._lock:
+            self.max_size_bytes = max_size_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def stats(self) -> MemoryCacheStats:
+        with self._lock:
+            return MemoryCacheStats(self._hits, self._misses, self._evictions, len(self._entries), self._size_bytes,
+                                    self.max_size_bytes)
+
+    def _evict(self) -> None:
+        while self._size_bytes > self.max_size_bytes:
+            _, (_, size_bytes) = self._entries.popitem(last=False)
+            self._size_bytes -= size_bytes
+            self._evictions += 1
@@ -12,23 +12,37 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import hashlib
+import json
 import logging
-from functools import cache, wraps
-from typing import Optional
+from datetime import datetime, timedelta
+from functools import wraps
+from typing import Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 
+from report_generator.generator import profiling
 from report_generator.generator.constants import MaintMetric
 from report_generator.generator.report_utils.time_series import Period
+from report_generator.generator.response_cache import MemoryCacheStats, MemoryResponseCache, ResponseCache
 
 DEFAULT_BASE_URL = "https://sigrid-says.com"
 BASE_ANALYSIS_RESULTS_ENDPOINT = "analysis-results/api/v1"
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT_SECONDS = 60.0
+CLOSED_PERIOD_DELAY = timedelta(days=1)
 
 _bearer_token: Optional[str] = None
 _customer: Optional[str] = None
 _system: Optional[str] = None
 _period: Optional[tuple[str, str]] = None
 _rest_url: Optional[str] = None
+_session: Optional[requests.Session] = None
+_timeout: float = DEFAULT_TIMEOUT_SECONDS
+_response_cache: Optional[ResponseCache] = None
+_memory_cache = MemoryResponseCache()
 
 
 class SigridAPIRequestFailed(Exception):
@@ -49,10 +63,19 @@ def set_context(
         customer: Optional[str] = None,
         system: Optional[str] = None,
         period: Optional[tuple[str, str]] = None,
-        base_url: Optional[str] = None
+        base_url: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        keep_alive: Optional[bool] = None,
+        compression: Optional[bool] = None,
+        timeout: Optional[float] = None
 ) -> None:
-    """Set the context values. Only updates provided values. Sets base_url to default if not provided."""
-    global _bearer_token, _customer, _system, _period, _rest_url
+    """
+    Set the context values. Only updates provided values. Sets base_url to default if not provided.
+    The HTTP session used for all API calls is (re)created when one of pool_size, keep_alive or compression is
+    provided, or when no session exists yet. The timeout (in seconds) applies to every individual API request, and
+    defaults to DEFAULT_TIMEOUT_SECONDS.
+    """
+    global _bearer_token, _customer, _system, _period, _rest_url, _session, _timeout
 
     if bearer_token is not None:
         _test_sigrid_token(bearer_token)
@@ -67,14 +90,82 @@ def set_context(
     if period is not None:
         _period = period
 
+    if timeout is not None:
+        if timeout <= 0:
+            raise ValueError(f"Timeout must be positive, got {timeout}")
+        _timeout = timeout
+
     _rest_url = f"{base_url or DEFAULT_BASE_URL.rstrip('/')}/rest"
 
+    if _session is None or pool_size is not None or keep_alive is not None or compression is not None:
+        _close_session()
+        _session = _create_session(
+            pool_size=DEFAULT_POOL_SIZE if pool_size is None else pool_size,
+            keep_alive=True if keep_alive is None else keep_alive,
+            compression=True if compression is None else compression
+        )
+
+
+def _create_session(pool_size: int, keep_alive: bool, compression: bool) -> requests.Session:
+    """
+    Creates a session that reuses connections to Sigrid, so consecutive API calls don't each pay for a new TLS
+    handshake. When compression is enabled, all encodings supported by urllib3 are accepted, which includes brotli
+    if the brotli package is installed.
+    """
+    if pool_size < 1:
+        raise ValueError(f"Connection pool size must be at least 1, got {pool_size}")
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive" if keep_alive else "close"
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING if compression else "identity"
+    return session
+
+
+def _get_session() -> requests.Session:
+    global _session
+
+    if _session is None:
+        _session = _create_session(DEFAULT_POOL_SIZE, keep_alive=True, compression=True)
+    return _session
+
+
+def _close_session() -> None:
+    global _session
+
+    if _session is not None:
+        _session.close()
+        _session = None
+
+
+def set_response_cache(response_cache: Optional[ResponseCache]) -> None:
+    """Sets the persistent cache that is consulted before calling the Sigrid API. Use None to disable it."""
+    global _response_cache
+    _response_cache = response_cache
+
+
+def set_memory_cache_size(max_size_bytes: int) -> None:
+    """Limits the total size of the API responses kept in memory, evicting the least recently used ones."""
+    _memory_cache.resize(max_size_bytes)
+
+
+def clear_cache() -> None:
+    """Removes all API responses kept in memory. The persistent response cache is not affected."""
+    _memory_cache.clear()
+
+
+def cache_stats() -> MemoryCacheStats:
+    return _memory_cache.stats()
+
 
 def reset_context(
         reset_bearer_token: bool = False,
         reset_customer: bool = False,
         reset_system: bool = False,
-        reset_base_url: bool = False
+        reset_base_url: bool = False,
+        reset_session: bool = False
 ) -> None:
     global _bearer_token, _customer, _system, _rest_url
 
@@ -90,6 +181,9 @@ def reset_context(
     if reset_base_url:
         _rest_url = f"{DEFAULT_BASE_URL.rstrip('/')}/rest"
 
+    if reset_session:
+        _close_session()
+
 
 def get_period() -> tuple[str, str]:
     if _period is None:
@@ -112,20 +206,80 @@ def _check_context() -> None:
                          f"The following values are not set: {', '.join(missing_values)}")
 
 
-@cache
-def _request(url):
+def _token_fingerprint() -> Optional[str]:
+    if _bearer_token is None:
+        return None
+    return hashlib.sha256(_bearer_token.encode("utf-8")).hexdigest()
+
+
+def _request(url, immutable_since: Optional[datetime] = None):
+    key = (_token_fingerprint(), _customer, url)
+    found, result = _memory_cache.get(key)
+    if found:
+        profiling.count("memory cache hits")
+        profiling.annotate(cache="memory")
+        return result
+
+    profiling.count("memory cache misses")
+
+    content, result = _fetch(url, immutable_since)
+    _memory_cache.put(key, result, len(content) if content is not None else 0)
+    return result
+
+
+def _decode(url, content: bytes):
+    try:
+        return json.loads(content)
+    except ValueError as e:
+        logging.error(f"Sigrid API endpoint {url} returned an invalid JSON response. Error: {e}")
+        profiling.count("failed requests")
+        return None
+
+
+def _fetch(url, immutable_since: Optional[datetime] = None) -> tuple[Optional[bytes], Any]:
+    """
+    Returns the response body and its decoded contents, or None for both if the request failed. Responses are only
+    stored in the response cache once they have been decoded, so invalid responses are not served from the cache.
+    """
     logging.debug(f"Sending request to {url}")
     headers = {
         "Content-type" : "application/json",
         "Authorization": f"Bearer {_bearer_token}"
     }
+
+    cached = _response_cache.lookup(_customer, url) if _response_cache else None
+    if cached is not None:
+        immutable = immutable_since is not None and cached.stored_at >= immutable_since.timestamp()
+        if cached.is_fresh(None if immutable else _response_cache.ttl_for(url)):
+            logging.debug(f"Using cached response for {url}")
+            profiling.count("response cache hits")
+            profiling.annotate(cache="disk")
+            return cached.content, _decode(url, cached.content)
+        headers.update(cached.conditional_headers())
+    elif _response_cache:
+        profiling.count("response cache misses")
+
     try:
-        response = requests.request('GET', url, headers=headers)
+        response = _get_session().get(url, headers=headers, timeout=_timeout)
+        if cached is not None and response.status_code == 304:
+            logging.debug(f"Cached response for {url} is still valid")
+            profiling.count("response cache revalidations")
+            profiling.annotate(cache="revalidated", bytes=0)
+            _response_cache.refresh(_customer, url)
+            return cached.content, _decode(url, cached.content)
+
         response.raise_for_status()
-        return response.json()
+        profiling.annotate(bytes=len(response.content))
+        result = _decode(url, response.content)
+        if _response_cache and result is not None:
+            _response_cache.store(_customer, url, response.content, response.headers.get("ETag"),
+                                  response.headers.get("Last-Modified"))
+        return response.content, result
     except requests.RequestException as e:
         logging.error(f"Failed to make request to Sigrid API endpoint {url}. Error: {e}")
-        return None
+        profiling.count("failed requests")
+        profiling.annotate(error=type(e).__name__)
+        return None, None
 
 
 def _sigrid_api_request(with_system=False):
@@ -138,28 +292,34 @@ def _sigrid_api_request(with_system=False):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if with_system:
-                system = args[0] if args else kwargs.pop('system', None) or _system
-                if system is None:
-                    raise ValueError("System not provided and global _system is not set.")
-                result = func(system, *args[1:], **kwargs)
-            else:
-                result = func(*args, **kwargs)
+            with profiling.span(func.__name__, "api"):
+                if with_system:
+                    system = args[0] if args else kwargs.pop('system', None) or _system
+                    if system is None:
+                        raise ValueError("System not provided and global _system is not set.")
+                    result = func(system, *args[1:], **kwargs)
+                else:
+                    result = func(*args, **kwargs)
 
             if result is None:
                 raise SigridAPIRequestFailed(func.__name__)
 
             return result
 
+        wrapper.with_system = with_system
         return wrapper
 
     return decorator
 
 
-def _make_request(endpoint):
+def _make_request(endpoint, immutable_since: Optional[datetime] = None):
+    """
+    Responses never change after immutable_since, so responses that were stored in the response cache after that
+    moment are used without revalidation.
+    """
     _check_context()
     url = f"{_rest_url}/{endpoint}"
-    return _request(url)
+    return _request(url, immutable_since)
 
 
 @_sigrid_api_request()
@@ -179,7 +339,12 @@ def get_objectives_evaluation(period: Period):
     start = period.start.strftime("%Y-%m-%d")
     end = period.end.strftime("%Y-%m-%d")
     endpoint = f"{BASE_ANALYSIS_RESULTS_ENDPOINT}/objectives-evaluation/{_customer}?startDate={start}&endDate={end}"
-    return _make_request(endpoint)
+    return _make_request(endpoint, immutable_since=_closed_since(period))
+
+
+def _closed_since(period: Period) -> datetime:
+    """Results for a period no longer change once the nightly analysis after its end has been processed."""
+    return period.end + CLOSED_PERIOD_DELAY
 
 
 @_sigrid_api_request(with_system=True)
@@ -12,49 +12,68 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import logging
+import os
+from functools import cache
 from typing import Callable
 
 from importlib_resources import files
 
-from report_generator.generator import ReportGenerator
+from report_generator.generator import ReportGenerator, planner
+from report_generator.generator.placeholders import placeholders
+from report_generator.generator.report import Report
+
+_preset_templates: dict[str, str] = {
+    'default'                         : "default-template.pptx",
+    'word-debug'                      : "debug-template.docx",
+    'debug'                           : "debug-template.pptx",
+    'itdd-technical-debt'             : "itdd-technical-debt.pptx",
+    'modernization'                   : "modernization.pptx",
+    'objectives'                      : "objectives.pptx",
+    'refactoring-candidates'          : "refactoring-candidates.pptx",
+    'system-maintainability-one-pager': "system-maintainability-one-pager.pptx"
+}
+
+
+def _template_path(template_name: str) -> str:
+    return str(files("report_generator.presets.templates").joinpath(template_name))
 
 
 def _generate_report(template_name: str, output_path: str) -> None:
-    template = files("report_generator.presets.templates").joinpath(template_name)
-    report_generator = ReportGenerator(str(template))
+    report_generator = ReportGenerator(_template_path(template_name))
     report_generator.generate(output_path)
 
 
 def generate_debug_docx(output_path: str) -> None:
-    _generate_report("debug-template.docx", output_path)
+    _generate_report(_preset_templates['word-debug'], output_path)
 
 
 def generate_debug_pptx(output_path: str) -> None:
-    _generate_report("debug-template.pptx", output_path)
+    _generate_report(_preset_templates['debug'], output_path)
 
 
 def generate_itdd_light(output_path: str) -> None:
-    _generate_report("default-template.pptx", output_path)
+    _generate_report(_preset_templates['default'], output_path)
 
 
 def generate_itdd_system_technical_debt_report(output_path: str) -> None:
-    _generate_report("itdd-technical-debt.pptx", output_path)
+    _generate_report(_preset_templates['itdd-technical-debt'], output_path)
 
 
 def generate_modernization_report(output_path: str) -> None:
-    _generate_report("modernization.pptx", output_path)
+    _generate_report(_preset_templates['modernization'], output_path)
 
 
 def generate_objectives_report(output_path: str) -> None:
-    _generate_report("objectives.pptx", output_path)
+    _generate_report(_preset_templates['objectives'], output_path)
 
 
 def generate_refactoring_candidates_report(output_path: str) -> None:
-    _generate_report("refactoring-candidates.pptx", output_path)
+    _generate_report(_preset_templates['refactoring-candidates'], output_path)
 
 
 def generate_system_maintainability_one_pager(output_path: str) -> None:
-    _generate_report("system-maintainability-one-pager.pptx", output_path)
+    _generate_report(_preset_templates['system-maintainability-one-pager'], output_path)
 
 
 _preset_reports: dict[str, Callable[[str], None]] = {
@@ -80,6 +99,24 @@ SYSTEM_LEVEL_PRESETS = {
 ids = set(_preset_reports.keys())
 
 
+@cache
+def data_models(preset_id: str) -> frozenset:
+    """
+    Returns the data models used by the placeholders in the template of a preset, so that their data can be fetched
+    up front when generating many reports at once.
+    """
+    template_path = _template_path(_preset_templates[preset_id])
+    if not os.path.isfile(template_path):
+        # Not fatal, the data is then fetched while generating the report, which reports the missing template.
+        logging.debug(f"Template for preset {preset_id} not found: {template_path}")
+        return frozenset()
+
+    report = Report.from_template(template_path)
+    tokens = planner.scan_template(report)
+    used = planner.find_used_placeholders(report, placeholders, tokens)
+    return frozenset().union(*(placeholder.data_models for placeholder in used))
+
+
 def run(preset_id: str, output_path: str) -> None:
     if preset_id not in ids:
         raise ValueError(f"Unsupported preset: {preset_id}")
@@ -0,0 +1,88 @@
+#  Copyright Software Improvement Group
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import io
+
+import pytest
+
+from report_generator import batch, presets
+from report_generator.batch.batch import _fetch_data
+from report_generator.generator import data_models, sigrid_api
+
+MANIFEST = """
+start: 2025-03-01
+reports:
+  - customer: Aap
+    system: noot
+    layout: system-maintainability-one-pager
+    out-file: noot
+  - customer: aap
+    layout: modernization
+    out-file: modernization
+    token: eyMiesMiesMies
+"""
+
+
+class TestBatch:
+
+    def test_load_manifest(self):
+        jobs = batch.load_manifest(io.StringIO(MANIFEST), "eyAapAapAapAap", "2025-01-01", "2025-04-01")
+
+        assert len(jobs) == 2
+        assert jobs[0].system == "noot"
+        assert jobs[0].context.customer == "aap"
+        assert jobs[0].context.token == "eyAapAapAapAap"
+        assert jobs[0].context.start == "2025-03-01"
+        assert jobs[1].system is None
+        assert jobs[1].context.token == "eyMiesMiesMies"
+
+    def test_system_level_layout_requires_system(self):
+        manifest = "reports:\n  - {customer: aap, layout: default, out-file: out}"
+
+        with pytest.raises(ValueError) as excinfo:
+            batch.load_manifest(io.StringIO(manifest), "eyAapAapAapAap", "2025-01-01", "2025-04-01")
+        assert "System is required" in str(excinfo.value)
+
+    def test_missing_token_is_rejected(self):
+        manifest = "reports:\n  - {customer: aap, layout: modernization, out-file: out}"
+
+        with pytest.raises(ValueError) as excinfo:
+            batch.load_manifest(io.StringIO(manifest), None, "2025-01-01", "2025-04-01")
+        assert "token" in str(excinfo.value)
+
+    def test_reset_data_models(self):
+        data_models.maintainability_data.__dict__["data"] = {"maintainability": 3.0}
+
+        data_models.reset()
+
+        assert "data" not in data_models.maintainability_data.__dict__
+
+    def test_preset_data_models_are_derived_from_template(self):
+        assert presets.data_models("modernization") == {data_models.modernization_data}
+        assert presets.data_models("system-maintainability-one-pager") == {data_models.maintainability_data,
+                                                                           data_models.system_metadata}
+
+    def test_fetch_data_prefetches_data_models_per_system(self, tmp_path, mocker):
+        prefetch_models = mocker.patch("report_generator.generator.planner.prefetch_models")
+        jobs = batch.load_manifest(io.StringIO(MANIFEST), "eyAapAapAapAap", "2025-01-01", "2025-04-01")
+
+        try:
+            _fetch_data(jobs, str(tmp_path))
+        finally:
+            sigrid_api.reset_context(reset_bearer_token=True, reset_customer=True, reset_system=True)
+
+        assert [set(call.args[0]) for call in prefetch_models.call_args_list] == [
+            {data_models.maintainability_data, data_models.system_metadata},
+            {data_models.modernization_data}
+        ]
@@ -12,8 +12,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from report_generator.generator import sigrid_api
 # noinspection PyProtectedMember
 from report_generator.generator.data_models.maintainability import _sort_and_aggregate_technology_data
+from report_generator.generator.data_models.modernization import CandidateSystem, ModernizationData
+from report_generator.generator.data_models.objectives import ObjectivesData, ObjectivesStatusCube
+from report_generator.generator.report_utils.time_series import Period
 
 
 class TestDataModels:
@@ -70,3 +74,64 @@ class TestDataModels:
             "testCodeRatio"       : test_ratio,
             "technologyRisk"      : tech_risk
         }
+
+
+class TestModernizationData:
+    def test_fetch_architecture_graphs_skips_failed_systems(self, mocker):
+        def get_architecture_graph(system):
+            if system == "noot":
+                raise sigrid_api.SigridAPIRequestFailed("get_architecture_graph")
+            return {"system": system}
+
+        mocker.patch.object(sigrid_api, "get_architecture_graph", side_effect=get_architecture_graph)
+        systems = [TestModernizationData._mock_candidate_system(name) for name in ["aap", "noot", "mies"]]
+
+        graphs = ModernizationData().fetch_architecture_graphs(systems)
+
+        assert graphs == {"aap": {"system": "aap"}, "mies": {"system": "mies"}}
+
+    @staticmethod
+    def _mock_candidate_system(name):
+        return CandidateSystem({"systemName": name}, {"system": name, "volumeInPersonMonths": 12})
+
+
+class TestObjectivesData:
+    def test_fetch_evaluations_keeps_order_of_periods(self, mocker):
+        periods = Period.for_months("2024-01-01", "2024-12-31")
+        mocker.patch.object(sigrid_api, "get_objectives_evaluation",
+                            side_effect=lambda period: {"systems": [{"period": str(period)}]})
+
+        evaluations = ObjectivesData.fetch_evaluations(periods)
+
+        assert evaluations == [[{"period": str(period)}] for period in periods]
+
+    def test_status_cube_distributions(self):
+        evaluation = [
+            {"systemName": "aap", "objectives": [
+                {"feature": "MAINTAINABILITY", "targetMetAtEnd": "MET", "delta": "SIMILAR"},
+                {"feature": "SECURITY", "targetMetAtEnd": "NOT_MET", "delta": "IMPROVING"}]},
+            {"systemName": "noot", "objectives": [
+                {"feature": "MAINTAINABILITY", "targetMetAtEnd": "NOT_MET", "delta": "DETERIORATING"}]},
+            {"systemName": "mies", "objectives": []},
+        ]
+
+        cube = ObjectivesStatusCube([evaluation])
+
+        # Order of statuses: MET, IMPROVED, UNCHANGED, WORSENED, UNKNOWN
+        assert cube.distribution(0) == [1, 1, 0, 1, 0]
+        assert cube.distribution(0, "MAINTAINABILITY") == [1, 0, 0, 1, 0]
+        assert cube.distribution(0, "OPEN_SOURCE_HEALTH") == [0, 0, 0, 0, 0]
+        assert cube.distribution(0, systems=["noot", "wim"]) == [0, 0, 0, 1, 0]
+        assert cube.distribution_per_group(0, {"team1": ["aap", "noot"], "team2": ["noot", "noot"], "team3": []}) == {
+            "team1": [1, 1, 0, 1, 0], "team2": [0, 0, 0, 1, 0], "team3": [0, 0, 0, 0, 0]}
+
+    def test_team_status_series(self):
+        data = ObjectivesData()
+        data.__dict__["teams"] = {"team1": ["aap"], "team2": ["noot"]}
+        data.__dict__["objectives_evaluation_status"] = [
+            {"systemName": "aap", "objectives": [
+                {"feature": "MAINTAINABILITY", "targetMetAtEnd": "MET", "delta": "SIMILAR"},
+                {"feature": "SECURITY", "targetMetAtEnd": "UNKNOWN", "delta": "SIMILAR"}]},
+        ]
+
+        assert data.get_team_status_series() == [[50.0, 0], [0.0, 0], [0.0, 0], [0.0, 0], [50.0, 0]]
@@ -0,0 +1,138 @@
+#  Copyright Software Improvement Group
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import threading
+
+from pptx import Presentation
+from pptx.util import Inches
+
+from report_generator.generator import data_models, planner
+from report_generator.generator.constants import MaintMetric
+from report_generator.generator.placeholders import placeholders, text_placeholder
+from report_generator.generator.report import Report, ReportType
+
+
+def _presentation(*texts):
+    presentation = Presentation()
+    slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+    for text in texts:
+        slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame.text = text
+    return Report(presentation, ReportType.PRESENTATION)
+
+
+def _placeholder(key):
+    return next(placeholder for placeholder in placeholders if key in placeholder.keys())
+
+
+class TestPlanner:
+
+    def test_only_placeholders_in_template_are_used(self):
+        report = _presentation("Rating: MAINT_RATING stars", "MAINT_DIFF")
+
+        used = planner.find_used_placeholders(report, placeholders, planner.scan_template(report))
+
+        assert {placeholder.key for placeholder in used} == {"MAINT_RATING", "MAINT_DIFF"}
+
+    def test_parameterized_placeholder_is_used_if_any_parameter_is(self):
+        report = _presentation("MAINT_RATING_DUPLICATION")
+
+        used = planner.find_used_placeholders(report, placeholders, planner.scan_template(report))
+
+        assert _placeholder("MAINT_RATING_DUPLICATION") in used
+        assert f"MAINT_RATING_{MaintMetric.UNIT_SIZE}" in _placeholder("MAINT_RATING_DUPLICATION").keys()
+
+    def test_tables_are_found_by_shape_name(self):
+        report = _presentation()
+        table = report.content.slides[0].shapes.add_table(2, 2, Inches(1), Inches(1), Inches(4), Inches(2))
+        table.name = "REFACTORING_CANDIDATES_TABLE_DUPLICATION"
+
+        used = planner.find_used_placeholders(report, placeholders, planner.scan_template(report))
+
+        assert {placeholder.key for placeholder in used} == {"REFACTORING_CANDIDATES_TABLE_DUPLICATION"}
+
+    def test_keys_that_are_not_a_word_are_always_used(self):
+        @text_placeholder("MY-CUSTOM-KEY")
+        def my_custom_key():
+            return "value"
+
+        report = _presentation("Nothing here")
+
+        assert planner.find_used_placeholders(report, {my_custom_key}, planner.scan_template(report)) == {my_custom_key}
+
+    def test_placeholders_declare_data_models(self):
+        assert _placeholder("MAINT_RATING").data_models == (data_models.maintainability_data,)
+        assert _placeholder("MODERNIZATION_SCATTER_PLOT_CHART").data_models == (data_models.modernization_data,)
+        assert _placeholder("GALAXY_SLIDE").data_models == (data_models.maintainability_data,
+                                                            data_models.system_metadata)
+        assert _placeholder("REPORT_DATE").data_models == ()
+
+    def test_prefetch_data_ignores_data_models_without_sources(self, mocker):
+        get_candidates = mocker.patch.object(type(data_models.refactoring_candidates_data), "get_candidates")
+
+        planner.prefetch_data({_placeholder("REFACTORING_CANDIDATES_TABLE_DUPLICATION")})
+
+        get_candidates.assert_not_called()
+
+    def test_prefetch_data_loads_data_models_once(self, mocker):
+        get_maintainability_ratings = mocker.patch("report_generator.generator.sigrid_api.get_maintainability_ratings",
+                                                   return_value={"maintainability": 3.0})
+        data_models.reset()
+
+        try:
+            planner.prefetch_data({_placeholder("MAINT_RATING"), _placeholder("MAINT_DIFF")})
+
+            assert data_models.maintainability_data.data == {"maintainability": 3.0}
+            get_maintainability_ratings.assert_called_once()
+        finally:
+            data_models.reset()
+
+    def test_values_are_computed_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        @text_placeholder()
+        def first_value():
+            barrier.wait()
+            return "aap"
+
+        @text_placeholder()
+        def second_value():
+            barrier.wait()
+            return "noot"
+
+        report = _presentation("FIRST_VALUE", "SECOND_VALUE")
+        values = planner.compute_values({first_value, second_value}, planner.scan_template(report))
+        first_value.resolve(report, values)
+        second_value.resolve(report, values)
+
+        assert [shape.text_frame.text for shape in report.content.slides[0].shapes] == ["aap", "noot"]
+
+    def test_failed_value_is_reported_when_resolving(self, caplog):
+        @text_placeholder()
+        def missing_value():
+            return {}["missing"]
+
+        report = _presentation("MISSING_VALUE")
+        values = planner.compute_values({missing_value}, planner.scan_template(report))
+        missing_value.resolve(report, values)
+
+        assert "Failed to resolve MISSING_VALUE" in caplog.text
+        assert report.content.slides[0].shapes[0].text_frame.text == "MISSING_VALUE"
+
+    def test_values_are_not_computed_for_placeholders_that_do_not_use_them(self, mocker):
+        placeholder = _placeholder("MODERNIZATION_SCATTER_PLOT_CHART")
+        value = mocker.patch.object(placeholder, "value")
+
+        planner.compute_values({placeholder}, {"MODERNIZATION_SCATTER_PLOT_CHART"})
+
+        value.assert_not_called()
@@ -0,0 +1,86 @@
+#  Copyright Software Improvement Group
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import time
+
+from report_generator.generator import profiling
+
+
+class TestProfiling:
+
+    def test_disabled_by_default(self):
+        with profiling.span("template scan", "step") as span:
+            profiling.annotate(bytes=10)
+            profiling.count("memory cache hits")
+
+        assert span is None
+
+    def test_nested_spans_and_counters(self):
+        profiler = profiling.start()
+        try:
+            with profiling.span("MAINT_RATING", "placeholder"):
+                with profiling.span("get_maintainability_ratings", "api"):
+                    profiling.annotate(bytes=2048)
+                profiling.count("memory cache misses")
+            with profiling.span("MAINT_DIFF", "placeholder"):
+                with profiling.span("get_maintainability_ratings", "api"):
+                    profiling.count("memory cache hits")
+        finally:
+            assert profiling.stop() is profiler
+
+        assert [(span.name, span.category) for span in sorted(profiler.spans, key=lambda s: s.start)] == [
+            ("MAINT_RATING", "placeholder"), ("get_maintainability_ratings", "api"),
+            ("MAINT_DIFF", "placeholder"), ("get_maintainability_ratings", "api")]
+        assert profiler.counters == {"memory cache misses": 1, "memory cache hits": 1}
+
+        summary = profiler.summary()
+        assert "get_maintainability_ratings" in summary
+        assert "2.0 KB" in summary
+        assert "MAINT_RATING" in summary
+
+    def test_summary_includes_value_computation(self):
+        profiler = profiling.start()
+        try:
+            with profiling.span("MAINT_RATING", "value"):
+                time.sleep(0.01)
+            with profiling.span("MAINT_RATING", "placeholder"):
+                pass
+            with profiling.span("MAINT_DIFF", "value"):
+                pass
+        finally:
+            profiling.stop()
+
+        summary = profiler.summary()
+        assert "Value (s)" in summary
+        rows = {line.split()[0]: line.split()[1:] for line in summary.splitlines() if line.startswith("MAINT")}
+        values, value_time, resolved, resolve_time, total_time = rows["MAINT_RATING"]
+        assert (values, resolved) == ("1", "1")
+        assert float(value_time) >= 0.01
+        assert float(total_time) >= float(value_time)
+        assert rows["MAINT_DIFF"][0] == "1" and rows["MAINT_DIFF"][2] == "0"
+
+    def test_write_trace(self, tmp_path):
+        profiler = profiling.start()
+        try:
+            with profiling.span("template scan", "step"):
+                pass
+        finally:
+            profiling.stop()
+
+        profiler.write_trace(str(tmp_path / "out.trace.json"))
+
+        with open(tmp_path / "out.trace.json") as f:
+            trace = json.load(f)
+        assert [(event["name"], event["ph"]) for event in trace["traceEvents"]] == [("template scan", "X")]
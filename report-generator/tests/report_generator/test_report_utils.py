@@ -12,13 +12,26 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import gc
+import weakref
+
+from docx import Document
+from pptx import Presentation
 from pptx.oxml.text import CT_TextParagraph
 # noinspection PyProtectedMember
 from pptx.text.text import _Paragraph
 
+from pptx.util import Inches
+
 from report_generator.generator import report_utils
 
 
+def _add_textbox(slide, *paragraphs):
+    text_frame = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text_frame
+    text_frame.text = "\n".join(paragraphs)
+    return text_frame
+
+
 class TestReportUtils:
 
     def test_merge_similar_runs(self):
@@ -54,3 +67,119 @@ class TestReportUtils:
         assert len(p.runs) == 2
         assert p.runs[0].text == "aap"
         assert p.runs[1].text == "noot"
+
+    def test_merge_many_runs(self):
+        presentation = Presentation()
+        p = _add_textbox(presentation.slides.add_slide(presentation.slide_layouts[6])).paragraphs[0]
+        for text, bold in [("a", True), ("b", True), ("c", False), ("d", False), ("e", True)]:
+            run = p.add_run()
+            run.text = text
+            run.font.bold = bold
+
+        report_utils.pptx.merge_runs_with_same_formatting(p)
+
+        assert [run.text for run in p.runs] == ["ab", "cd", "e"]
+
+    def test_merge_runs_again_after_runs_were_added(self):
+        presentation = Presentation()
+        p = _add_textbox(presentation.slides.add_slide(presentation.slide_layouts[6])).paragraphs[0]
+        p.add_run().text = "aap"
+        report_utils.pptx.merge_runs_with_same_formatting(p)
+
+        p.add_run().text = "noot"
+        report_utils.pptx.merge_runs_with_same_formatting(p)
+
+        assert [run.text for run in p.runs] == ["aapnoot"]
+
+    def test_find_text_returns_first_matching_paragraph_per_shape(self):
+        presentation = Presentation()
+        slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+        _add_textbox(slide, "Rating: MAINT_RATING", "Again MAINT_RATING")
+        _add_textbox(slide, "MAINT_RATING_DIFF", "(MAINT_RATING)")
+
+        paragraphs = report_utils.pptx.find_text_in_presentation(presentation, "MAINT_RATING")
+
+        assert [paragraph.text for paragraph in paragraphs] == ["Rating: MAINT_RATING", "(MAINT_RATING)"]
+
+    def test_presentation_index_is_discarded_with_presentation(self):
+        presentation = Presentation()
+        _add_textbox(presentation.slides.add_slide(presentation.slide_layouts[6]), "KEY")
+        report_utils.pptx.find_text_in_presentation(presentation, "KEY")
+        part = weakref.ref(presentation.part)
+
+        del presentation
+        gc.collect()
+
+        assert part() is None
+
+    def test_find_text_only_searches_first_paragraph_of_table_cells(self):
+        presentation = Presentation()
+        slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+        table = slide.shapes.add_table(1, 2, Inches(1), Inches(1), Inches(4), Inches(1)).table
+        table.cell(0, 0).text = "Header\nKEY"
+        table.cell(0, 1).text = "KEY\nFooter"
+
+        paragraphs = report_utils.pptx.find_text_in_presentation(presentation, "KEY")
+
+        assert [paragraph.text for paragraph in paragraphs] == ["KEY"]
+        assert paragraphs[0]._p is table.cell(0, 1).text_frame.paragraphs[0]._p
+
+    def test_find_text_uses_current_text(self):
+        presentation = Presentation()
+        slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+        _add_textbox(slide, "First KEY", "Second KEY")
+
+        paragraphs = report_utils.pptx.find_text_in_presentation(presentation, "KEY")
+        report_utils.pptx.update_paragraph(paragraphs[0], "KEY", "value")
+
+        assert [p.text for p in report_utils.pptx.find_text_in_presentation(presentation, "KEY")] == ["Second KEY"]
+
+    def test_find_text_that_is_not_a_word(self):
+        presentation = Presentation()
+        slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+        _add_textbox(slide, "Some MY-KEY here")
+
+        paragraphs = report_utils.pptx.find_text_in_presentation(presentation, "MY-KEY")
+
+        assert [paragraph.text for paragraph in paragraphs] == ["Some MY-KEY here"]
+
+    def test_find_text_in_document_headers_and_nested_tables(self):
+        document = Document()
+        document.add_paragraph("Body KEY")
+        document.add_table(1, 1).cell(0, 0).add_table(1, 1).cell(0, 0).text = "Nested KEY"
+        document.sections[0].header.paragraphs[0].text = "Header KEY"
+        document.sections[0].footer.paragraphs[0].text = "Footer KEY"
+
+        paragraphs = report_utils.docx.find_text_in_document(document, "KEY")
+
+        assert [paragraph.text for paragraph in paragraphs] == ["Body KEY", "Nested KEY", "Header KEY", "Footer KEY"]
+
+    def test_find_text_in_document_returns_paragraph_for_every_run(self):
+        document = Document()
+        paragraph = document.add_paragraph("KEY and ")
+        paragraph.add_run("KEY").bold = True
+
+        paragraphs = report_utils.docx.find_text_in_document(document, "KEY")
+        report_utils.docx.update_many_paragraphs(paragraphs, "KEY", "value")
+
+        assert paragraph.text == "value and value"
+        assert report_utils.docx.find_text_in_document(document, "KEY") == []
+
+    def test_document_index_is_discarded_with_document(self):
+        document = Document()
+        document.add_paragraph("Body KEY")
+        report_utils.docx.find_text_in_document(document, "KEY")
+        part = weakref.ref(document.part)
+
+        del document
+        gc.collect()
+
+        assert part() is None
+
+    def test_find_text_in_document_does_not_add_linked_headers(self):
+        document = Document()
+        document.add_paragraph("Body KEY")
+
+        report_utils.docx.find_text_in_document(document, "KEY")
+
+        assert document.sections[0].header.is_linked_to_previous
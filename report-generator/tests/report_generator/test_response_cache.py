@@ -0,0 +1,91 @@
+#  Copyright Software Improvement Group
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import sqlite3
+import time
+
+from report_generator.generator import response_cache
+from report_generator.generator.response_cache import MemoryResponseCache, ResponseCache
+
+
+class TestResponseCache:
+
+    def test_stored_response_can_be_looked_up(self, tmp_path):
+        cache = ResponseCache(str(tmp_path))
+        cache.store("aap", "https://sigrid-says.com/rest/x", b'{"noot": 1}', etag='"123"')
+
+        cached = cache.lookup("aap", "https://sigrid-says.com/rest/x")
+
+        assert cached.data == {"noot": 1}
+        assert cached.conditional_headers() == {"If-None-Match": '"123"'}
+        assert cache.lookup("mies", "https://sigrid-says.com/rest/x") is None
+
+    def test_response_expires_after_ttl(self, tmp_path):
+        cache = ResponseCache(str(tmp_path), ttl_seconds={"system-metadata": 60}, default_ttl_seconds=3600)
+        cache.store("aap", "https://sigrid-says.com/rest/system-metadata/aap", b'{}')
+
+        cached = cache.lookup("aap", "https://sigrid-says.com/rest/system-metadata/aap")
+        cached.stored_at = time.time() - 120
+
+        assert cache.ttl_for("https://sigrid-says.com/rest/system-metadata/aap") == 60
+        assert cache.ttl_for("https://sigrid-says.com/rest/maintainability/aap") == 3600
+        assert not cached.is_fresh(60)
+
+    def test_least_recently_used_responses_are_evicted(self, tmp_path):
+        cache = ResponseCache(str(tmp_path), max_size_bytes=2000)
+        cache.store("aap", "https://sigrid-says.com/rest/1", os.urandom(800))
+        cache.store("aap", "https://sigrid-says.com/rest/2", os.urandom(800))
+        cache.lookup("aap", "https://sigrid-says.com/rest/1")
+        cache.store("aap", "https://sigrid-says.com/rest/3", os.urandom(800))
+
+        assert cache.lookup("aap", "https://sigrid-says.com/rest/1") is not None
+        assert cache.lookup("aap", "https://sigrid-says.com/rest/2") is None
+        assert cache.lookup("aap", "https://sigrid-says.com/rest/3") is not None
+        assert cache.size() <= 2000
+
+    def test_lookup_works_while_another_process_is_writing(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(response_cache, "BUSY_TIMEOUT_SECONDS", 0.1)
+        cache = ResponseCache(str(tmp_path))
+        cache.store("aap", "https://sigrid-says.com/rest/x", b'{"noot": 1}')
+
+        other = sqlite3.connect(cache.path, isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        try:
+            assert cache.lookup("aap", "https://sigrid-says.com/rest/x").data == {"noot": 1}
+        finally:
+            other.execute("ROLLBACK")
+            other.close()
+
+
+class TestMemoryResponseCache:
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = MemoryResponseCache(max_size_bytes=20)
+        cache.put("aap", 1, 10)
+        cache.put("noot", 2, 10)
+        cache.get("aap")
+        cache.put("mies", 3, 10)
+
+        assert cache.get("aap") == (True, 1)
+        assert cache.get("noot") == (False, None)
+        assert cache.stats().evictions == 1
+        assert cache.stats().size_bytes == 20
+
+    def test_entries_larger_than_cache_are_not_stored(self):
+        cache = MemoryResponseCache(max_size_bytes=20)
+        cache.put("aap", 1, 30)
+
+        assert cache.get("aap") == (False, None)
+        assert cache.stats().entries == 0
@@ -12,9 +12,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from datetime import datetime
+
 import pytest
+from dateutil.relativedelta import relativedelta
 
 import report_generator.generator.sigrid_api as sigrid_api
+from report_generator.generator.report_utils.time_series import Period
+from report_generator.generator.response_cache import ResponseCache
 
 
 class TestSigridAPI:
@@ -34,3 +39,159 @@ class TestSigridAPI:
             sigrid_api._test_sigrid_token("eyKskfiurkfshiuwhfibvcgi43hf2o3h893hg34")
         except ValueError:
             pytest.fail(f"This token was expected to be valid")
+
+    def test_set_context_creates_pooled_session(self):
+        sigrid_api.set_context(pool_size=4, keep_alive=True, compression=False)
+
+        session = sigrid_api._get_session()
+        adapter = session.get_adapter("https://sigrid-says.com")
+
+        assert adapter._pool_maxsize == 4
+        assert session.headers["Connection"] == "keep-alive"
+        assert session.headers["Accept-Encoding"] == "identity"
+
+        sigrid_api.reset_context(reset_session=True)
+
+    def test_set_context_keeps_session_if_http_options_not_provided(self):
+        sigrid_api.set_context(pool_size=2)
+        session = sigrid_api._get_session()
+
+        sigrid_api.set_context(customer="aap")
+
+        assert sigrid_api._get_session() is session
+        sigrid_api.reset_context(reset_customer=True, reset_session=True)
+
+    def test_invalid_pool_size_is_rejected(self):
+        with pytest.raises(ValueError):
+            sigrid_api.set_context(pool_size=0)
+
+    def test_invalid_json_response_is_treated_as_failed_request(self, mocker):
+        session = mocker.Mock()
+        session.get.return_value.content = b''
+        mocker.patch.object(sigrid_api, "_get_session", return_value=session)
+        sigrid_api.clear_cache()
+
+        assert sigrid_api._request("https://sigrid-says.com/rest/x") is None
+        sigrid_api.clear_cache()
+
+    def test_invalid_json_response_is_not_stored_in_response_cache(self, tmp_path, mocker):
+        url = "https://sigrid-says.com/rest/analysis-results/api/v1/maintainability/aap"
+        cache = ResponseCache(str(tmp_path))
+        session = mocker.Mock()
+        session.get.return_value.status_code = 200
+        session.get.return_value.content = b'{"noot'
+        session.get.return_value.headers = {}
+        mocker.patch.object(sigrid_api, "_get_session", return_value=session)
+
+        sigrid_api.set_context(customer="aap")
+        sigrid_api.set_response_cache(cache)
+        try:
+            assert sigrid_api._fetch(url) == (b'{"noot', None)
+            assert cache.lookup("aap", url) is None
+
+            session.get.return_value.content = b'{"noot": 1}'
+            assert sigrid_api._fetch(url) == (b'{"noot": 1}', {"noot": 1})
+            assert cache.lookup("aap", url).content == b'{"noot": 1}'
+        finally:
+            sigrid_api.set_response_cache(None)
+            sigrid_api.reset_context(reset_customer=True)
+
+    def test_requests_use_timeout(self, mocker):
+        session = mocker.Mock()
+        session.get.return_value.content = b'{}'
+        mocker.patch.object(sigrid_api, "_get_session", return_value=session)
+
+        sigrid_api._fetch("https://sigrid-says.com/rest/x")
+        assert session.get.call_args.kwargs["timeout"] == sigrid_api.DEFAULT_TIMEOUT_SECONDS
+
+        sigrid_api.set_context(timeout=5)
+        try:
+            sigrid_api._fetch("https://sigrid-says.com/rest/x")
+            assert session.get.call_args.kwargs["timeout"] == 5
+        finally:
+            sigrid_api.set_context(timeout=sigrid_api.DEFAULT_TIMEOUT_SECONDS)
+
+    def test_invalid_timeout_is_rejected(self):
+        with pytest.raises(ValueError):
+            sigrid_api.set_context(timeout=0)
+
+    def test_expired_cached_response_is_revalidated(self, tmp_path, mocker):
+        url = "https://sigrid-says.com/rest/analysis-results/api/v1/maintainability/aap"
+        cache = ResponseCache(str(tmp_path), default_ttl_seconds=0)
+        cache.store("aap", url, b'{"noot": 1}', etag='"123"')
+        session = mocker.Mock()
+        session.get.return_value.status_code = 304
+        mocker.patch.object(sigrid_api, "_get_session", return_value=session)
+
+        sigrid_api.set_context(customer="aap")
+        sigrid_api.set_response_cache(cache)
+        try:
+            assert sigrid_api._fetch(url) == (b'{"noot": 1}', {"noot": 1})
+            assert session.get.call_args.kwargs["headers"]["If-None-Match"] == '"123"'
+        finally:
+            sigrid_api.set_response_cache(None)
+            sigrid_api.reset_context(reset_customer=True)
+
+    def test_cached_objectives_evaluation_of_closed_month_is_not_revalidated(self, tmp_path, mocker):
+        cache = ResponseCache(str(tmp_path), default_ttl_seconds=0)
+        session = mocker.Mock()
+        mocker.patch.object(sigrid_api, "_get_session", return_value=session)
+        sigrid_api.clear_cache()
+
+        sigrid_api.set_context(bearer_token="eyAapAapAapAap", customer="aap")
+        sigrid_api.set_response_cache(cache)
+        try:
+            closed, current = Period.for_months(datetime.now() - relativedelta(months=2), datetime.now())[-2:]
+            for period in (closed, current):
+                url = (f"{sigrid_api._rest_url}/{sigrid_api.BASE_ANALYSIS_RESULTS_ENDPOINT}/objectives-evaluation/aap"
+                       f"?startDate={period.start:%Y-%m-%d}&endDate={period.end:%Y-%m-%d}")
+                cache.store("aap", url, b'{"systems": []}')
+            session.get.return_value.status_code = 304
+
+            assert sigrid_api.get_objectives_evaluation(closed) == {"systems": []}
+            session.get.assert_not_called()
+            assert sigrid_api.get_objectives_evaluation(current) == {"systems": []}
+            session.get.assert_called_once()
+        finally:
+            sigrid_api.set_response_cache(None)
+            sigrid_api.reset_context(reset_bearer_token=True, reset_customer=True)
+            sigrid_api.clear_cache()
+
+    def test_objectives_evaluation_cached_before_month_closed_is_revalidated(self, tmp_path, mocker):
+        cache = ResponseCache(str(tmp_path))
+        session = mocker.Mock()
+        session.get.return_value.status_code = 304
+        mocker.patch.object(sigrid_api, "_get_session", return_value=session)
+        sigrid_api.clear_cache()
+
+        sigrid_api.set_context(bearer_token="eyAapAapAapAap", customer="aap")
+        sigrid_api.set_response_cache(cache)
+        try:
+            closed = Period.for_months(datetime.now() - relativedelta(months=2), datetime.now())[-2]
+            url = (f"{sigrid_api._rest_url}/{sigrid_api.BASE_ANALYSIS_RESULTS_ENDPOINT}/objectives-evaluation/aap"
+                   f"?startDate={closed.start:%Y-%m-%d}&endDate={closed.end:%Y-%m-%d}")
+            cache.store("aap", url, b'{"systems": []}')
+            stored_at = (closed.end - relativedelta(days=1)).timestamp()
+            cache._connection.execute("UPDATE responses SET stored_at = ?", (stored_at,))
+
+            assert sigrid_api.get_objectives_evaluation(closed) == {"systems": []}
+            session.get.assert_called_once()
+        finally:
+            sigrid_api.set_response_cache(None)
+            sigrid_api.reset_context(reset_bearer_token=True, reset_customer=True)
+            sigrid_api.clear_cache()
+
+    def test_memory_cache_key_includes_token_and_customer(self, mocker):
+        fetch = mocker.patch.object(sigrid_api, "_fetch", return_value=(b'{"noot": 1}', {"noot": 1}))
+        sigrid_api.clear_cache()
+
+        sigrid_api.set_context(bearer_token="eyAapAapAapAap", customer="aap")
+        sigrid_api._request("https://sigrid-says.com/rest/x")
+        sigrid_api._request("https://sigrid-says.com/rest/x")
+        sigrid_api.set_context(bearer_token="eyMiesMiesMies", customer="mies")
+        sigrid_api._request("https://sigrid-says.com/rest/x")
+
+        assert fetch.call_count == 2
+        assert sigrid_api.cache_stats().hits == 1
+        sigrid_api.clear_cache()
+        sigrid_api.reset_context(reset_bearer_token=True, reset_customer=True)